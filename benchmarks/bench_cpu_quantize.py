@@ -0,0 +1,155 @@
+"""CPU benchmark: fp32 vs dynamic int8 (``cpu_quantize="int8"``) inference for one engine.
+
+Renders the deterministic synthetic room (``vibephysics.feedforward.synthetic``) to
+PNG frames, runs the engine on CPU once in fp32 and once with int8 ``nn.Linear``
+layers, and reports wall time per mode plus the int8 prediction's error against the
+fp32 one: depth abs-rel, per-frame rotation error (degrees) and camera-centre error
+after Sim(3) alignment (as a fraction of the fp32 trajectory extent).
+
+Needs the engine's dependencies and weights (first run downloads them). The int8
+run of an engine that caches quantized weights (vggt_omega, r3, dvlt, lingbot_map)
+is timed twice: the first builds the cache, the second loads it.
+
+Usage::
+
+    python benchmarks/bench_cpu_quantize.py --engine vggt_omega
+    python benchmarks/bench_cpu_quantize.py --engine lingbot_map --size 16x240x320 --json int8.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+os.environ["VIBEPHYSICS_DEVICE"] = "cpu"
+
+import numpy as np  # noqa: E402
+
+from vibephysics.feedforward.synthetic import make_synthetic_prediction  # noqa: E402
+
+DEFAULT_SIZE = "8x240x320"
+
+
+def _render_frames(directory: Path, num_frames: int, height: int, width: int, seed: int) -> None:
+    from PIL import Image
+
+    prediction = make_synthetic_prediction(num_frames, height, width, seed=seed)
+    for index, image in enumerate(prediction.images):
+        rgb = np.clip(np.asarray(image) * 255.0 + 0.5, 0, 255).astype(np.uint8)
+        Image.fromarray(rgb).save(directory / f"frame_{index:05d}.png")
+
+
+def _run(engine: str, image_dir: Path, cpu_quantize: str) -> tuple[float, Any]:
+    from vibephysics.feedforward.common import clear_model_pool
+    from vibephysics.feedforward.engines import get_engine, settings_for_engine
+
+    spec = get_engine(engine)
+    settings = settings_for_engine(spec, {"cpu_quantize": cpu_quantize})
+    clear_model_pool()
+    started_at = time.perf_counter()
+    prediction = spec.run(image_dir, settings, verbose=False)
+    return time.perf_counter() - started_at, prediction
+
+
+def _rotation_errors_deg(reference_w2c: np.ndarray, w2c: np.ndarray) -> np.ndarray:
+    # ||R_a - R_b||_F = 2 sqrt(2) sin(theta / 2); stable near zero, unlike arccos of the trace.
+    chord = np.linalg.norm(reference_w2c[:, :3, :3] - w2c[:, :3, :3], axis=(1, 2))
+    return np.degrees(2.0 * np.arcsin(np.clip(chord / (2.0 * np.sqrt(2.0)), 0.0, 1.0)))
+
+
+def prediction_errors(reference, prediction) -> dict[str, float]:
+    """int8-vs-fp32 error summary (``reference`` is the fp32 prediction)."""
+    from vibephysics.feedforward.common import umeyama_alignment
+    from vibephysics.feedforward.window_align import camera_centers
+
+    ref_depth = np.asarray(reference.depth, dtype=np.float64)
+    depth = np.asarray(prediction.depth, dtype=np.float64)
+    valid = np.isfinite(ref_depth) & np.isfinite(depth) & (ref_depth > 1e-6)
+    abs_rel = np.abs(depth[valid] - ref_depth[valid]) / ref_depth[valid]
+
+    rotation_deg = _rotation_errors_deg(
+        np.asarray(reference.extrinsic, dtype=np.float64),
+        np.asarray(prediction.extrinsic, dtype=np.float64),
+    )
+
+    ref_centers = camera_centers(np.asarray(reference.extrinsic, dtype=np.float64))
+    centers = camera_centers(np.asarray(prediction.extrinsic, dtype=np.float64))
+    if len(centers) >= 3:
+        scale, rotation, translation = umeyama_alignment(centers, ref_centers, with_scale=True)
+        centers = scale * centers @ rotation.T + translation
+    extent = float(np.linalg.norm(ref_centers.max(axis=0) - ref_centers.min(axis=0))) or 1.0
+    center_error = np.linalg.norm(centers - ref_centers, axis=1) / extent
+
+    return {
+        "depth_abs_rel_mean": float(abs_rel.mean()) if abs_rel.size else float("nan"),
+        "depth_abs_rel_p95": float(np.percentile(abs_rel, 95)) if abs_rel.size else float("nan"),
+        "rotation_error_deg_mean": float(rotation_deg.mean()),
+        "rotation_error_deg_max": float(rotation_deg.max()),
+        "camera_center_error_mean": float(center_error.mean()),
+        "camera_center_error_max": float(center_error.max()),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", default="vggt_omega", help="Feedforward engine (default: vggt_omega).")
+    parser.add_argument("--size", default=DEFAULT_SIZE, help=f"FRAMESxHEIGHTxWIDTH (default: {DEFAULT_SIZE}).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this JSON file.")
+    args = parser.parse_args()
+
+    from vibephysics.feedforward.engines import get_engine
+
+    spec = get_engine(args.engine)
+    if not spec.available():
+        print(f"[ERROR] Engine '{args.engine}' is not available here ({spec.install_hint})")
+        return 1
+
+    num_frames, height, width = (int(part) for part in args.size.lower().split("x"))
+    with tempfile.TemporaryDirectory(prefix="vibephysics_bench_int8_") as tmp:
+        image_dir = Path(tmp)
+        _render_frames(image_dir, num_frames, height, width, args.seed)
+
+        fp32_s, reference = _run(args.engine, image_dir, "none")
+        int8_first_s, _ = _run(args.engine, image_dir, "int8")
+        int8_s, prediction = _run(args.engine, image_dir, "int8")
+
+    errors = prediction_errors(reference, prediction)
+    print(f"engine={args.engine} size={args.size} device=cpu")
+    print(f"  fp32            {fp32_s:8.2f} s")
+    print(f"  int8 (1st run)  {int8_first_s:8.2f} s")
+    print(f"  int8            {int8_s:8.2f} s  ({fp32_s / max(int8_s, 1e-9):.2f}x vs fp32)")
+    print("  int8 vs fp32:")
+    for name, value in errors.items():
+        print(f"    {name:<26} {value:.6g}")
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(
+            json.dumps(
+                {
+                    "engine": args.engine,
+                    "size": args.size,
+                    "seed": args.seed,
+                    "fp32_s": fp32_s,
+                    "int8_first_s": int8_first_s,
+                    "int8_s": int8_s,
+                    "errors": errors,
+                },
+                indent=2,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""CPU benchmarks for the feedforward post-processing stages (no model weights).
+
+Every case runs on a deterministic synthetic prediction (room planes + moving boxes,
+``vibephysics.feedforward.synthetic``) at each requested size. Reported per stage:
+best / median wall time over ``--repeat`` runs, plus peak traced allocation (numpy
+buffers included) from one extra run under ``tracemalloc`` so tracing never skews timings.
+
+Usage::
+
+    python benchmarks/bench_postprocess.py
+    python benchmarks/bench_postprocess.py --sizes 32x240x320 --repeat 5 --json after.json
+    python benchmarks/bench_postprocess.py --json after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from vibephysics.feedforward.synthetic import make_synthetic_prediction  # noqa: E402
+
+DEFAULT_SIZES = ("16x120x160", "32x240x320")
+MIN_CONFIDENCE = 2.0
+NMS_RADIUS = 0.05
+NMS_MIN_NEIGHBORS = 3  # library default; the config's 20 assumes 518px-dense frames
+# NMS_RADIUS holds at this width and up; narrower frames space pixels further apart in
+# the (meter-scale) synthetic room, so the radius grows with the pixel spacing.
+NMS_REFERENCE_WIDTH = 160
+# save_compact_prediction samples this fraction of each frame before NMS, but at least
+# SAVE_MIN_SAMPLE_POINTS (so tiny frames are not thinned below what NMS keeps).
+SAVE_SAMPLE_FRACTION = 0.05
+SAVE_MIN_SAMPLE_POINTS = 500
+# Flag a regression when the best time grows by more than this factor.
+DEFAULT_REGRESSION_THRESHOLD = 1.2
+
+
+@dataclass
+class BenchResult:
+    case: str
+    size: str
+    best_s: float
+    median_s: float
+    peak_alloc_bytes: int
+    repeat: int
+
+
+def nms_radius(prediction) -> float:
+    width = int(prediction.world_points.shape[2])
+    return NMS_RADIUS * max(1.0, NMS_REFERENCE_WIDTH / width)
+
+
+def _bench_run_per_frame_postprocess(prediction) -> Callable[[], Any]:
+    from vibephysics.feedforward.frame_postprocess import run_per_frame_postprocess
+
+    return lambda: run_per_frame_postprocess(
+        prediction,
+        min_confidence=MIN_CONFIDENCE,
+        point_cloud_3d_nms=True,
+        point_cloud_3d_nms_radius=nms_radius(prediction),
+        point_cloud_3d_nms_min_neighbors=NMS_MIN_NEIGHBORS,
+        with_frame_ids=True,
+    )
+
+
+def _bench_filter_points_3d_nms(prediction) -> Callable[[], Any]:
+    from vibephysics.feedforward.common import filter_points_3d_nms
+
+    points = prediction.world_points[len(prediction.world_points) // 2].reshape(-1, 3).astype(np.float64)
+    radius = nms_radius(prediction)
+    return lambda: filter_points_3d_nms(points, radius=radius, min_neighbors=NMS_MIN_NEIGHBORS)
+
+
+def _bench_compute_bbox_for_frame(prediction) -> Callable[[], Any]:
+    from vibephysics.feedforward.algo_3d_bbox import compute_bbox_for_frame, prepare_bbox_reference
+
+    ctx = prepare_bbox_reference(prediction, reference_frame=0, min_confidence=MIN_CONFIDENCE)
+    last = int(prediction.world_points.shape[0]) - 1
+    return lambda: compute_bbox_for_frame(prediction, last, ctx, min_confidence=MIN_CONFIDENCE)
+
+
+def _bench_align_prediction_ground(prediction) -> Callable[[], Any]:
+    from vibephysics.feedforward.ground_align import align_prediction_ground
+
+    fresh = copy.deepcopy(prediction)  # mutates world_points / extrinsic in place
+    return lambda: align_prediction_ground(fresh)
+
+
+def _bench_save_compact_prediction(prediction) -> Callable[[], Any]:
+    from vibephysics.feedforward.schema import save_compact_prediction
+
+    out_dir = Path(tempfile.mkdtemp(prefix="vibephysics-bench-"))
+    pixels = int(prediction.world_points.shape[1]) * int(prediction.world_points.shape[2])
+    sample_fraction = min(1.0, max(SAVE_SAMPLE_FRACTION, SAVE_MIN_SAMPLE_POINTS / pixels))
+    return lambda: save_compact_prediction(
+        out_dir / "predictions.npz",
+        prediction,
+        min_confidence=MIN_CONFIDENCE,
+        random_points_per_frame=sample_fraction,
+        point_cloud_3d_nms=True,
+        point_cloud_3d_nms_radius=nms_radius(prediction),
+        point_cloud_3d_nms_min_neighbors=NMS_MIN_NEIGHBORS,
+        split_files=True,
+    )
+
+
+# name -> factory(prediction) returning the timed callable; setup stays untimed.
+CASES: dict[str, Callable[[Any], Callable[[], Any]]] = {
+    "run_per_frame_postprocess": _bench_run_per_frame_postprocess,
+    "filter_points_3d_nms": _bench_filter_points_3d_nms,
+    "compute_bbox_for_frame": _bench_compute_bbox_for_frame,
+    "align_prediction_ground": _bench_align_prediction_ground,
+    "save_compact_prediction": _bench_save_compact_prediction,
+}
+
+
+def parse_size(text: str) -> tuple[int, int, int]:
+    try:
+        frames, height, width = (int(part) for part in text.lower().split("x"))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"size must be FRAMESxHEIGHTxWIDTH, got {text!r}") from exc
+    return frames, height, width
+
+
+def run_case(name: str, prediction, size: str, repeat: int) -> BenchResult:
+    factory = CASES[name]
+    times: list[float] = []
+    for _ in range(repeat):
+        fn = factory(prediction)
+        started_at = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started_at)
+
+    fn = factory(prediction)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchResult(
+        case=name,
+        size=size,
+        best_s=min(times),
+        median_s=statistics.median(times),
+        peak_alloc_bytes=peak,
+        repeat=repeat,
+    )
+
+
+def compare_results(
+    results: list[BenchResult],
+    baseline_path: Path,
+    threshold: float,
+) -> list[str]:
+    baseline = {
+        (entry["case"], entry["size"]): entry
+        for entry in json.loads(baseline_path.read_text()).get("results", [])
+    }
+    regressions = []
+    for result in results:
+        before = baseline.get((result.case, result.size))
+        if before is None or before["best_s"] <= 0:
+            continue
+        ratio = result.best_s / before["best_s"]
+        if ratio > threshold:
+            regressions.append(
+                f"{result.case} @ {result.size}: {before['best_s']:.3f}s -> {result.best_s:.3f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feedforward post-processing on synthetic scenes.")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help=f"FRAMESxHEIGHTxWIDTH per scene (default: {' '.join(DEFAULT_SIZES)}).",
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES), help="Stages to time.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3).")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic scene seed.")
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this JSON file.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON from an earlier run.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help=f"Slowdown factor reported as a regression (default: {DEFAULT_REGRESSION_THRESHOLD}).",
+    )
+    args = parser.parse_args()
+
+    results: list[BenchResult] = []
+    print(f"{'case':<28} {'size':<12} {'best':>9} {'median':>9} {'peak alloc':>11}")
+    for size_text in args.sizes:
+        frames, height, width = parse_size(size_text)
+        prediction = make_synthetic_prediction(frames, height, width, seed=args.seed)
+        for name in args.cases:
+            try:
+                result = run_case(name, prediction, size_text, max(1, args.repeat))
+            except ValueError as exc:
+                # e.g. nothing left to save on a tiny scene; the other cases still run.
+                print(f"{name:<28} {size_text:<12} skipped: {exc}", flush=True)
+                continue
+            results.append(result)
+            print(
+                f"{result.case:<28} {result.size:<12} {result.best_s:>8.3f}s {result.median_s:>8.3f}s "
+                f"{result.peak_alloc_bytes / 1024**2:>9.1f}MB",
+                flush=True,
+            )
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(
+            json.dumps({"seed": args.seed, "results": [asdict(result) for result in results]}, indent=2)
+        )
+    if args.compare is not None:
+        regressions = compare_results(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"[REGRESSION] {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""LingBot-Map ``center_square`` batch build: per-frame arrays + stack vs in-place fill.
+
+Each method runs in a fresh subprocess so its peak RSS (``ru_maxrss``) is its own:
+
+- ``stack``    — the previous path: ``load_preprocessed_frames`` returns one uint8 array
+                 per frame, ``np.stack`` copies them, then ``permute().float().div_()``
+                 makes the float batch;
+- ``inplace``  — ``lingbot_map._load_center_square_images``: one preallocated
+                 (S, 3, H, W) float32 batch (pinned when CUDA is available), each decode
+                 worker normalizes its crop straight into its slice.
+
+Frames are synthetic PNGs (``--unique`` rendered views repeated up to ``--frames``);
+the preprocess cache is disabled so both methods decode every frame.
+
+Usage::
+
+    python benchmarks/bench_preprocess_batch.py
+    python benchmarks/bench_preprocess_batch.py --frames 1000 --image-size 518 --json preprocess.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+METHODS = ("stack", "inplace")
+DEFAULT_FRAMES = 1000
+DEFAULT_IMAGE_SIZE = 518
+
+
+def _peak_rss_bytes() -> int:
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+
+
+def _render_inputs(directory: Path, frames: int, unique: int, height: int, width: int) -> list[str]:
+    import numpy as np
+    from PIL import Image
+
+    from vibephysics.feedforward.synthetic import make_synthetic_prediction
+
+    prediction = make_synthetic_prediction(unique, height, width, seed=0)
+    rendered = []
+    for index, image in enumerate(prediction.images):
+        path = directory / f"view_{index:03d}.png"
+        Image.fromarray(np.clip(np.asarray(image) * 255.0 + 0.5, 0, 255).astype(np.uint8)).save(path)
+        rendered.append(path)
+    paths = []
+    for index in range(frames):
+        path = directory / f"frame_{index:05d}.png"
+        shutil.copyfile(rendered[index % unique], path)
+        paths.append(str(path))
+    return paths
+
+
+def _child(method: str, list_file: Path, image_size: int) -> dict[str, float]:
+    import numpy as np
+    import torch
+
+    from vibephysics.feedforward.lingbot_map import _center_square_array, _load_center_square_images
+    from vibephysics.feedforward.preprocess_cache import frame_file_hashes, load_preprocessed_frames
+
+    paths = list_file.read_text().splitlines()
+    rss_before = _peak_rss_bytes()
+    started_at = time.perf_counter()
+    if method == "stack":
+        arrays = load_preprocessed_frames(
+            frame_file_hashes(paths),
+            mode="center_square",
+            image_size=image_size,
+            patch_size=14,
+            read_frames=lambda positions: [paths[pos] for pos in positions],
+            preprocess=lambda source: _center_square_array(source, target=image_size, patch_size=14),
+        )
+        images = torch.from_numpy(np.stack(arrays)).permute(0, 3, 1, 2).float().div_(255.0)
+        del arrays
+    else:
+        images = _load_center_square_images(
+            paths, image_size=image_size, pin_memory=torch.cuda.is_available()
+        )
+    elapsed_s = time.perf_counter() - started_at
+    return {
+        "elapsed_s": elapsed_s,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "rss_before_bytes": rss_before,
+        "batch_bytes": images.numel() * images.element_size(),
+        "checksum": float(images.double().sum()),
+    }
+
+
+def _run_child(method: str, list_file: Path, image_size: int) -> dict[str, float]:
+    cmd = [
+        sys.executable,
+        __file__,
+        "--child",
+        method,
+        "--list-file",
+        str(list_file),
+        "--image-size",
+        str(image_size),
+    ]
+    env = dict(os.environ, VIBEPHYSICS_NO_PREPROCESS_CACHE="1")
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help=f"Frames (default: {DEFAULT_FRAMES}).")
+    parser.add_argument("--unique", type=int, default=32, help="Distinct rendered views (default: 32).")
+    parser.add_argument("--input-size", default="540x960", help="Input HEIGHTxWIDTH (default: 540x960).")
+    parser.add_argument(
+        "--image-size", type=int, default=DEFAULT_IMAGE_SIZE, help=f"Square crop (default: {DEFAULT_IMAGE_SIZE})."
+    )
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this JSON file.")
+    parser.add_argument("--child", choices=METHODS, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--list-file", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(_child(args.child, args.list_file, args.image_size)))
+        return 0
+
+    try:
+        import torch  # noqa: F401
+    except ImportError as exc:
+        print(f"[ERROR] This benchmark needs torch ({exc})")
+        return 1
+
+    height, width = (int(part) for part in args.input_size.lower().split("x"))
+    with tempfile.TemporaryDirectory(prefix="vibephysics_bench_preprocess_") as tmp:
+        tmp_dir = Path(tmp)
+        paths = _render_inputs(tmp_dir, args.frames, max(1, min(args.unique, args.frames)), height, width)
+        list_file = tmp_dir / "frames.txt"
+        list_file.write_text("\n".join(paths))
+        results = {method: _run_child(method, list_file, args.image_size) for method in METHODS}
+
+    checksums = {round(result["checksum"], 3) for result in results.values()}
+    print(f"{args.frames} frames {width}x{height} -> {args.image_size}x{args.image_size}")
+    print(f"{'method':<8} {'time':>9} {'peak RSS':>10} {'batch':>9}")
+    for method, result in results.items():
+        print(
+            f"{method:<8} {result['elapsed_s']:8.2f}s "
+            f"{result['peak_rss_bytes'] / 1024**2:8.0f}MB {result['batch_bytes'] / 1024**2:7.0f}MB"
+        )
+    stack, inplace = results["stack"], results["inplace"]
+    print(
+        f"inplace vs stack: {stack['elapsed_s'] / max(inplace['elapsed_s'], 1e-9):.2f}x faster, "
+        f"{(stack['peak_rss_bytes'] - inplace['peak_rss_bytes']) / 1024**2:.0f} MB lower peak RSS"
+    )
+    if len(checksums) != 1:
+        print(f"[WARNING] Batches differ between methods: {sorted(checksums)}")
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(
+            json.dumps(
+                {
+                    "frames": args.frames,
+                    "input_size": args.input_size,
+                    "image_size": args.image_size,
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,155 @@
+"""Checkpoint load time and peak RSS: ``torch.load`` vs mmap ``.pt`` vs ``.safetensors``.
+
+Each method loads in a fresh subprocess so its peak RSS (``ru_maxrss``) is its own:
+
+- ``torch_load``   — ``torch.load`` + ``load_state_dict`` (how engines loaded before);
+- ``pt_mmap``      — ``weights.load_checkpoint_into`` on the ``.pt`` (``torch.load(mmap=True)``);
+- ``safetensors``  — ``weights.load_checkpoint_into`` on the converted ``.safetensors`` copy.
+
+By default the checkpoint is a synthetic MLP of ``--size-mb`` loaded into a matching
+module. With ``--checkpoint`` a real engine ``.pt`` is converted into a temp dir and
+only its state dict is loaded (every tensor touched), since there is no model to
+build without the engine package.
+
+Usage::
+
+    python benchmarks/bench_weight_loading.py
+    python benchmarks/bench_weight_loading.py --size-mb 2048 --json weights.json
+    python benchmarks/bench_weight_loading.py --checkpoint .vibephysics/feedforward/lingbot_map/lingbot-map.pt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+METHODS = ("torch_load", "pt_mmap", "safetensors")
+LAYER_WIDTH = 4096
+DEFAULT_SIZE_MB = 512
+
+
+def _synthetic_model(size_mb: int):
+    import torch
+
+    # Square fp32 Linear layers: 4096^2 * 4 bytes = 64 MiB each.
+    layers = max(1, round(size_mb / (LAYER_WIDTH * LAYER_WIDTH * 4 / 1024**2)))
+    return torch.nn.Sequential(*(torch.nn.Linear(LAYER_WIDTH, LAYER_WIDTH) for _ in range(layers)))
+
+
+def _peak_rss_bytes() -> int:
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+
+
+def _child(method: str, path: Path, size_mb: int | None) -> dict[str, float]:
+    import torch
+
+    from vibephysics.feedforward.weights import load_checkpoint_into, load_checkpoint_state_dict
+
+    model = _synthetic_model(size_mb) if size_mb else None
+    rss_before = _peak_rss_bytes()
+    started_at = time.perf_counter()
+    if model is not None:
+        if method == "torch_load":
+            model.load_state_dict(torch.load(str(path), map_location="cpu", weights_only=False))
+        else:
+            load_checkpoint_into(model, path)
+        tensors = list(model.state_dict().values())
+    else:
+        if method == "torch_load":
+            state_dict = torch.load(str(path), map_location="cpu", weights_only=False)
+            state_dict = state_dict.get("model", state_dict.get("state_dict", state_dict))
+        else:
+            state_dict = load_checkpoint_state_dict(path)
+        tensors = [value for value in state_dict.values() if isinstance(value, torch.Tensor)]
+    # Touch every tensor so lazily mapped pages count as loaded.
+    checksum = float(sum(float(tensor.float().sum()) for tensor in tensors if tensor.is_floating_point()))
+    elapsed_s = time.perf_counter() - started_at
+    return {
+        "elapsed_s": elapsed_s,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "rss_before_load_bytes": rss_before,
+        "checksum": checksum,
+    }
+
+
+def _run_child(method: str, path: Path, size_mb: int | None) -> dict[str, float]:
+    cmd = [sys.executable, __file__, "--child", method, "--path", str(path)]
+    if size_mb:
+        cmd += ["--size-mb", str(size_mb)]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size-mb", type=int, default=None, help=f"Synthetic checkpoint size (default: {DEFAULT_SIZE_MB})."
+    )
+    parser.add_argument("--checkpoint", type=Path, default=None, help="Real .pt checkpoint instead of synthetic.")
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this JSON file.")
+    parser.add_argument("--child", choices=METHODS, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(_child(args.child, args.path, args.size_mb)))
+        return 0
+
+    try:
+        import safetensors  # noqa: F401
+        import torch
+    except ImportError as exc:
+        print(f"[ERROR] This benchmark needs torch and safetensors ({exc})")
+        return 1
+
+    from vibephysics.feedforward.weights import convert_checkpoint_to_safetensors
+
+    with tempfile.TemporaryDirectory(prefix="vibephysics_bench_weights_") as tmp:
+        tmp_dir = Path(tmp)
+        size_mb: int | None = None
+        if args.checkpoint is None:
+            size_mb = args.size_mb or DEFAULT_SIZE_MB
+            pt_path = tmp_dir / "synthetic.pt"
+            torch.save(_synthetic_model(size_mb).state_dict(), pt_path)
+        else:
+            pt_path = args.checkpoint
+        # Not next to pt_path, so the pt_mmap run loads the .pt rather than this copy.
+        (tmp_dir / "converted").mkdir()
+        st_path = convert_checkpoint_to_safetensors(
+            pt_path, tmp_dir / "converted" / f"{pt_path.stem}.safetensors", verbose=False
+        )
+
+        results = {}
+        for method in METHODS:
+            path = st_path if method == "safetensors" else pt_path
+            results[method] = _run_child(method, path, size_mb)
+
+    checksums = {round(result["checksum"], 3) for result in results.values()}
+    label = f"synthetic {size_mb} MB" if size_mb else str(args.checkpoint)
+    print(f"checkpoint: {label}")
+    print(f"{'method':<12} {'load':>9} {'peak RSS':>10} {'RSS before':>11}")
+    for method, result in results.items():
+        print(
+            f"{method:<12} {result['elapsed_s']:8.2f}s "
+            f"{result['peak_rss_bytes'] / 1024**2:8.0f}MB {result['rss_before_load_bytes'] / 1024**2:9.0f}MB"
+        )
+    if len(checksums) != 1:
+        print(f"[WARNING] Loaded weights differ between methods: {sorted(checksums)}")
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"checkpoint": label, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
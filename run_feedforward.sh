@@ -15,7 +15,8 @@ usage() {
     echo "  $0 --method mapanything --input path/to/images --blend"
     echo ""
     echo "Direct engines:"
-    echo "  lingbot_map, vggt_omega, vgg_ttt, r3, r3_long, dvlt, map_anything"
+    echo "  lingbot_map, vggt_omega, vgg_ttt, r3, r3_long, dvlt, map_anything,"
+    echo "  synthetic (procedural scene, no weights; pipeline benchmarking)"
     echo ""
     echo "Map-Anything factory methods (known examples; unknown methods route here too):"
     echo "  mapanything, mapanything_apache, mapanything_ablations, vggt, moge,"
@@ -30,7 +31,7 @@ usage() {
     echo "  --point_cloud_3d_nms, --point_cloud_3d_nms_radius, --point_cloud_3d_nms_min_neighbors,"
     echo "  --detection_seg (masks + 3D bboxes + voxels), --detection_seg_classes,"
     echo "  --algo_3d_bbox (voxel-diff only, without RF-DETR),"
-    echo "  --mode, --config,"
+    echo "  --mode, --config, --force-inference (skip the raw inference cache),"
     echo "  --blend, --html, --frames, --no-install, --install-all"
     exit 1
 }
@@ -293,6 +294,9 @@ case "$METHOD_NORM" in
     map_anything|mapanything_engine)
         ENGINE="map_anything"
         ;;
+    synthetic)
+        ENGINE="synthetic"
+        ;;
     *)
         # Treat remaining methods as Map-Anything factory keys. This keeps the
         # unified CLI forward-compatible when Map-Anything adds new model names.
@@ -365,6 +369,8 @@ elif engine == "dvlt":
     from vibephysics.feedforward.dvlt import ensure_dependencies
 
     ok = ensure_dependencies()
+elif engine == "synthetic":
+    ok = True
 elif engine == "map_anything":
     from vibephysics.feedforward.config import load_yaml_config
     from vibephysics.feedforward.map_anything import ensure_dependencies
@@ -0,0 +1,109 @@
+"""Parity check: ``common.depth_edge_mask`` against the original nine-pass numpy loop.
+
+Compares masks on random depth stacks (with depth jumps, NaN and inf pixels) for
+several kernel sizes and worker counts, and prints the speedup. Exits non-zero on any
+mismatch in float32 mode; float16 mode is reported as a disagreement rate only.
+
+Usage::
+
+    PYTHONPATH=src python scripts/check_depth_edge_parity.py
+    PYTHONPATH=src python scripts/check_depth_edge_parity.py --size 24x518x518
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from vibephysics.feedforward.common import depth_edge_mask  # noqa: E402
+
+
+def reference_depth_edge(depth: np.ndarray, rtol: float = 0.03, kernel_size: int = 3) -> np.ndarray:
+    """The per-engine implementation this replaced (vgg_ttt / dvlt / vggt_omega)."""
+    depth = np.asarray(depth)
+    original_shape = depth.shape
+    depth = depth.reshape(-1, *original_shape[-2:])
+
+    pad = kernel_size // 2
+    padded = np.pad(depth, ((0, 0), (pad, pad), (pad, pad)), mode="edge")
+    depth_max = np.full_like(depth, -np.inf)
+    depth_min = np.full_like(depth, np.inf)
+
+    for y in range(kernel_size):
+        for x in range(kernel_size):
+            window = padded[:, y : y + depth.shape[-2], x : x + depth.shape[-1]]
+            depth_max = np.maximum(depth_max, window)
+            depth_min = np.minimum(depth_min, window)
+
+    with np.errstate(invalid="ignore"):
+        relative_jump = (depth_max - depth_min) / np.maximum(np.abs(depth), 1e-6)
+    return (relative_jump > rtol).reshape(original_shape)
+
+
+def make_depth(frames: int, height: int, width: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    depth = np.empty((frames, height, width), dtype=np.float32)
+    for index in range(frames):
+        plane = 2.0 + 0.002 * xx + 0.001 * yy * (index + 1)
+        box = (abs(xx - width * 0.5) < width * 0.15) & (abs(yy - height * 0.5) < height * 0.2)
+        plane[box] *= 0.6
+        depth[index] = plane + rng.normal(0.0, 0.01, size=plane.shape).astype(np.float32)
+    depth[0, 0, :5] = np.nan
+    depth[-1, height // 3, width // 3] = np.inf
+    depth[-1, 1, 1] = 0.0
+    return depth
+
+
+def parse_size(text: str) -> tuple[int, int, int]:
+    frames, height, width = (int(part) for part in text.lower().split("x"))
+    return frames, height, width
+
+
+def _timed(fn) -> tuple[float, np.ndarray]:
+    started_at = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started_at, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="8x240x320", help="FRAMESxHEIGHTxWIDTH (default: 8x240x320).")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    depth = make_depth(*parse_size(args.size), seed=args.seed)
+    failures = 0
+    for kernel_size in (3, 5):
+        for rtol in (0.01, 0.03):
+            ref_s, expected = _timed(lambda: reference_depth_edge(depth, rtol, kernel_size))
+            for workers in (1, 4):
+                new_s, actual = _timed(
+                    lambda: depth_edge_mask(depth, rtol, kernel_size, workers=workers)
+                )
+                mismatches = int(np.count_nonzero(actual != expected))
+                failures += mismatches > 0
+                print(
+                    f"k={kernel_size} rtol={rtol:<4} workers={workers}: "
+                    f"{'ok' if not mismatches else f'{mismatches} mismatches'}  "
+                    f"ref {ref_s * 1e3:7.1f} ms  new {new_s * 1e3:7.1f} ms  ({ref_s / max(new_s, 1e-9):.1f}x)"
+                )
+            half = depth_edge_mask(depth, rtol, kernel_size, dtype=np.float16)
+            rate = float(np.count_nonzero(half != expected)) / expected.size
+            print(f"k={kernel_size} rtol={rtol:<4} float16: {rate:.4%} of pixels differ")
+
+    batched = depth.reshape(2, -1, *depth.shape[-2:]) if len(depth) % 2 == 0 else depth[None]
+    failures += int(not np.array_equal(depth_edge_mask(batched), reference_depth_edge(batched)))
+    print("PASS" if not failures else f"FAIL ({failures} configurations)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Import-time regression check for the light vibephysics entry points.
+
+Runs each entry point under ``python -X importtime`` in a fresh interpreter and fails
+when one imports a heavy module (bpy, torch, plotly, ...) or exceeds its budget.
+
+Usage::
+
+    PYTHONPATH=src python scripts/check_importtime.py
+    PYTHONPATH=src python scripts/check_importtime.py --budget-scale 2   # slow CI runners
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules that must only load on first use, never while parsing args / importing.
+HEAVY_MODULES = ("bpy", "mathutils", "torch", "torchvision", "plotly", "PIL", "scipy", "cv2")
+
+# (label, python args, cumulative import budget in ms)
+ENTRY_POINTS = (
+    ("reconstruct --help", ["-m", "vibephysics.feedforward.reconstruct", "--help"], 400.0),
+    ("feedforward.export", ["-c", "import vibephysics.feedforward.export"], 250.0),
+    ("mapping.pipeline", ["-c", "import vibephysics.mapping.pipeline"], 250.0),
+)
+
+
+def measure_imports(args: list[str]) -> tuple[float, set[str]]:
+    """Total import time (ms) and the set of modules imported, from ``-X importtime``."""
+    env = dict(os.environ)
+    src = str(REPO_ROOT / "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited {result.returncode}:\n{result.stderr[-2000:]}")
+
+    total_ms = 0.0
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        modules.add(name.strip())
+        # Nested imports are indented; their time is already in the parent's cumulative.
+        if not name[1:].startswith(" "):
+            total_ms += int(cumulative) / 1000.0
+    return total_ms, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check import-time budgets of light entry points.")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. 2 on slow or cold-cache machines).",
+    )
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    for label, entry_args, budget_ms in ENTRY_POINTS:
+        try:
+            total_ms, modules = measure_imports(entry_args)
+        except RuntimeError as exc:
+            failures.append(f"{label}: {exc}")
+            continue
+        budget_ms *= args.budget_scale
+        heavy = sorted(name for name in modules if name.split(".")[0] in HEAVY_MODULES)
+        status = "ok" if total_ms <= budget_ms and not heavy else "FAIL"
+        print(f"{label:<22} {total_ms:8.1f} ms  (budget {budget_ms:.0f} ms)  {status}")
+        if total_ms > budget_ms:
+            failures.append(f"{label}: {total_ms:.1f} ms exceeds {budget_ms:.0f} ms budget")
+        if heavy:
+            failures.append(f"{label}: eagerly imports {', '.join(heavy[:8])}")
+
+    if failures:
+        for failure in failures:
+            print(f"[ERROR] {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
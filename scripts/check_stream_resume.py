@@ -0,0 +1,184 @@
+"""Resume check: an interrupted ``stream_checkpoint.run_segments`` run continues exactly.
+
+Drives a small synthetic online model (a growing KV cache that every output attends
+to, so a wrong or missing restore changes all later frames) through
+``run_segments`` three ways and compares the outputs bit for bit:
+
+1. uninterrupted;
+2. interrupted after ``--interrupt-after`` segments, then resumed by a fresh model and
+   ``StreamCheckpoint`` (as a new process would), with ``resume=True``;
+3. resumed against a checkpoint in the same directory written for other inputs
+   (identities sharing the directory prefix; must start from frame 0).
+
+Also checks the checkpoint is removed once a run finishes. Exits non-zero on failure.
+
+Usage::
+
+    PYTHONPATH=src python scripts/check_stream_resume.py
+    PYTHONPATH=src python scripts/check_stream_resume.py --frames 100 --every 7 --interrupt-after 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from vibephysics.feedforward.stream_checkpoint import StreamCheckpoint, run_segments  # noqa: E402
+
+
+class Interrupted(RuntimeError):
+    pass
+
+
+class SyntheticOnlineModel:
+    """Per-frame outputs attend over every earlier frame's key (the streaming state)."""
+
+    def __init__(self, dim: int = 16):
+        rng = np.random.default_rng(1234)
+        self.w_key = rng.normal(size=(dim, dim)).astype(np.float32)
+        self.w_value = rng.normal(size=(dim, dim)).astype(np.float32)
+        self.keys: list[np.ndarray] = []
+        self.values: list[np.ndarray] = []
+        self.frames_seen = 0
+
+    def snapshot(self) -> dict:
+        return {"keys": self.keys, "values": self.values, "frames_seen": self.frames_seen}
+
+    def restore(self, state: dict) -> None:
+        self.keys = list(state["keys"])
+        self.values = list(state["values"])
+        self.frames_seen = int(state["frames_seen"])
+
+    def __call__(self, frames: np.ndarray) -> dict[str, np.ndarray]:
+        outputs = []
+        for frame in frames:
+            self.keys.append(np.tanh(frame @ self.w_key))
+            self.values.append(frame @ self.w_value)
+            keys = np.stack(self.keys)
+            weights = np.exp(keys @ self.keys[-1] - np.max(keys @ self.keys[-1]))
+            outputs.append((weights / weights.sum()) @ np.stack(self.values))
+            self.frames_seen += 1
+        return {"features": np.stack(outputs).astype(np.float32)}
+
+
+def _run(
+    frames: np.ndarray,
+    every: int,
+    checkpoint: StreamCheckpoint | None,
+    *,
+    resume: bool = False,
+    interrupt_after: int | None = None,
+) -> np.ndarray:
+    model = SyntheticOnlineModel(frames.shape[-1])
+    calls = 0
+
+    def step(start: int, stop: int) -> dict[str, np.ndarray]:
+        nonlocal calls
+        if interrupt_after is not None and calls == interrupt_after:
+            raise Interrupted(f"interrupted before frame {start}")
+        calls += 1
+        outputs = model(frames[start:stop])
+        outputs["frame_ids"] = np.arange(start, stop)
+        return outputs
+
+    segments = run_segments(
+        len(frames),
+        step,
+        every=every,
+        checkpoint=checkpoint,
+        resume=resume,
+        snapshot=model.snapshot,
+        restore=model.restore,
+        verbose=False,
+    )
+    frame_ids = np.concatenate([segment["frame_ids"] for segment in segments])
+    if not np.array_equal(frame_ids, np.arange(len(frames))):
+        raise AssertionError(f"frame ids out of order: {frame_ids.tolist()}")
+    return np.concatenate([segment["features"] for segment in segments])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--every", type=int, default=8)
+    parser.add_argument(
+        "--interrupt-after", type=int, default=3, help="Segments finished before the interrupt."
+    )
+    args = parser.parse_args()
+    num_segments = -(-args.frames // max(args.every, 1))
+    if args.every < 1 or not 1 <= args.interrupt_after < num_segments:
+        parser.error(f"need --every >= 1 and 1 <= --interrupt-after < {num_segments} (segments in the run)")
+
+    frames = np.random.default_rng(0).normal(size=(args.frames, 16)).astype(np.float32)
+    other = frames.copy()
+    other[0] += 1.0
+    # Same first 24 characters -> same checkpoint directory, different identity.
+    identity, other_identity = "0" * 24 + "-run", "0" * 24 + "-other"
+    failures = []
+
+    with tempfile.TemporaryDirectory(prefix="vibephysics_stream_resume_") as tmp:
+        root = Path(tmp)
+        reference = _run(frames, args.every, None)
+
+        try:
+            _run(
+                frames,
+                args.every,
+                StreamCheckpoint("synthetic", identity, root=root),
+                interrupt_after=args.interrupt_after,
+            )
+            failures.append("interrupt did not fire")
+        except Interrupted:
+            pass
+        checkpoint = StreamCheckpoint("synthetic", identity, root=root)
+        point = checkpoint.load(verbose=False)
+        done = len(point.frame_ids) if point is not None else 0
+        expected = args.interrupt_after * args.every
+        if done != expected:
+            failures.append(f"checkpoint covers {done} frames, expected {expected}")
+
+        resumed = _run(frames, args.every, checkpoint, resume=True)
+        if not np.array_equal(resumed, reference):
+            failures.append(f"resumed output differs (max {np.abs(resumed - reference).max():.3g})")
+        if checkpoint.state_path.exists():
+            failures.append("checkpoint left behind after a finished run")
+
+        try:
+            _run(
+                other,
+                args.every,
+                StreamCheckpoint("synthetic", other_identity, root=root),
+                interrupt_after=args.interrupt_after,
+            )
+        except Interrupted:
+            pass
+        foreign = StreamCheckpoint("synthetic", identity, root=root)
+        if foreign.directory != checkpoint.directory or not foreign.state_path.exists():
+            failures.append("identity-collision setup did not leave a foreign checkpoint")
+        if foreign.load(verbose=False) is not None:
+            failures.append("a checkpoint written for other inputs was accepted")
+        fresh = _run(frames, args.every, foreign, resume=True)
+        if not np.array_equal(fresh, reference):
+            failures.append("run resumed from a foreign checkpoint")
+
+    print(
+        f"{args.frames} frames, segments of {args.every}, interrupted after {args.interrupt_after}: "
+        f"resumed from frame {done}"
+    )
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        return 1
+    print("ok: resumed output identical to the uninterrupted run")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""Size check: ``reconstruct(engine="synthetic")`` keeps points at small and default sizes.
+
+Runs the synthetic engine through ``reconstruct()`` with the default output settings
+(confidence filter, ground align, 3D NMS with the config radius / neighbor count) at
+each ``--sizes`` entry and checks the saved point cloud is not empty. The synthetic
+scene scale follows the frame width, so NMS should keep a similar fraction of points
+at every size. Exits non-zero when a size fails or keeps no points.
+
+Usage::
+
+    PYTHONPATH=src python scripts/check_synthetic_sizes.py
+    PYTHONPATH=src python scripts/check_synthetic_sizes.py --sizes 30x40,60x80 --frames 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+# Check runs are not real runs; keep them out of the estimate history.
+os.environ.setdefault("VIBEPHYSICS_NO_RUN_HISTORY", "1")
+
+import numpy as np  # noqa: E402
+
+from vibephysics.feedforward.reconstruct import reconstruct  # noqa: E402
+
+
+def _parse_sizes(text: str) -> list[tuple[int, int]]:
+    sizes = []
+    for item in text.split(","):
+        height, width = (int(part) for part in item.lower().split("x"))
+        sizes.append((height, width))
+    return sizes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="60x80,120x160,240x320", help="Comma-separated HxW frame sizes.")
+    parser.add_argument("--frames", type=int, default=4)
+    args = parser.parse_args()
+    sizes = _parse_sizes(args.sizes)
+    failures = []
+
+    with tempfile.TemporaryDirectory(prefix="vibephysics_synthetic_sizes_") as tmp:
+        root = Path(tmp)
+        frames = root / "frames"
+        frames.mkdir()
+        # The synthetic engine renders its own frames; inputs only set the frame count.
+        for index in range(args.frames):
+            (frames / f"frame_{index:04d}.jpg").write_bytes(b"synthetic")
+
+        for height, width in sizes:
+            label = f"{height}x{width}"
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    output = reconstruct(
+                        image_path=frames,
+                        output_path=root / label,
+                        engine="synthetic",
+                        synthetic_height=height,
+                        synthetic_width=width,
+                        inference_cache=False,
+                        verbose=False,
+                    )
+            except ValueError as exc:
+                failures.append(f"{label}: {exc}")
+                continue
+            with np.load(Path(output) / "predictions.npz", allow_pickle=True) as saved:
+                kept = len(saved["points"])
+            total = args.frames * height * width
+            print(f"{label}: kept {kept:,} of {total:,} pixels ({kept / total:.1%})")
+            if kept == 0:
+                failures.append(f"{label}: no points kept")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        return 1
+    print("ok: every size kept points")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
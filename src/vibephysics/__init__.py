@@ -19,12 +19,10 @@ Note: This package requires Blender 5.0's Python environment (bpy) for simulatio
 __version__ = "0.4.2"
 __author__ = "Tsun-Yi Yang"
 
-try:
-    import bpy
+import importlib.util
 
-    HAS_BPY = True
-except ImportError:
-    HAS_BPY = False
+# Probe without importing: loading bpy is expensive and feedforward/mapping CLIs never need it.
+HAS_BPY = importlib.util.find_spec("bpy") is not None
 
 __all__ = [
     "__version__",
@@ -0,0 +1,283 @@
+"""Batch feedforward reconstruction over many clips with warm models.
+
+One process, one model load per engine, and CPU post-processing / export of clip N
+overlapping model inference of clip N+1 (single inference lane, ``workers`` clips in
+flight).
+
+Manifest (YAML; relative paths resolve against the manifest directory)::
+
+    config: src/vibephysics/feedforward/configs/feedforward.yaml   # optional default
+    workers: 2                                                      # clips in flight
+    overrides:                                                      # merged into every clip
+      output:
+        save_html: visual.html
+    clips:
+      - clips/kitchen.mov
+      - input: clips/hallway.mov
+        output_path: out/hallway
+        overrides:
+          engine: vggt_omega
+
+Usage::
+
+    python -m vibephysics.feedforward.batch manifest.yaml --summary batch_summary.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BATCH_WORKERS = 2
+
+
+@dataclass
+class BatchClip:
+    index: int
+    input: Path
+    config: Path
+    output_path: Path | None = None
+    overrides: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchClipResult:
+    index: int
+    input: str
+    engine: str | None
+    status: str
+    output_path: str | None = None
+    error: str | None = None
+    wall_s: float = 0.0
+    peak_rss_bytes: int | None = None
+    stages: dict[str, float] = field(default_factory=dict)
+    notes: dict[str, str] = field(default_factory=dict)
+
+
+def merge_config(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge ``overrides`` into a copy of ``base`` (mappings merge, values replace)."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _resolve_path(value: str | Path, base_dir: Path) -> Path:
+    path = Path(value).expanduser()
+    return path if path.is_absolute() else (base_dir / path).resolve()
+
+
+def load_batch_manifest(manifest_path: str | Path) -> tuple[list[BatchClip], dict[str, Any]]:
+    """Parse a batch manifest into clips plus top-level settings (``workers``)."""
+    from .config import DEFAULT_FEEDFORWARD_CONFIG, load_yaml_config
+
+    manifest_path = Path(manifest_path).expanduser().resolve()
+    manifest = load_yaml_config(manifest_path)
+    base_dir = manifest_path.parent
+
+    default_config = manifest.get("config")
+    default_config = (
+        _resolve_path(default_config, base_dir) if default_config else DEFAULT_FEEDFORWARD_CONFIG
+    )
+    shared_overrides = manifest.get("overrides") or {}
+    if not isinstance(shared_overrides, dict):
+        raise ValueError(f"{manifest_path}: 'overrides' must be a mapping")
+
+    entries = manifest.get("clips")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{manifest_path}: 'clips' must be a non-empty list")
+
+    clips: list[BatchClip] = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, (str, Path)):
+            entry = {"input": entry}
+        if not isinstance(entry, dict) or not entry.get("input"):
+            raise ValueError(f"{manifest_path}: clip #{index} needs an 'input' path")
+        clip_overrides = entry.get("overrides") or {}
+        if not isinstance(clip_overrides, dict):
+            raise ValueError(f"{manifest_path}: clip #{index} 'overrides' must be a mapping")
+        clips.append(
+            BatchClip(
+                index=index,
+                input=_resolve_path(entry["input"], base_dir),
+                config=_resolve_path(entry["config"], base_dir) if entry.get("config") else default_config,
+                output_path=(
+                    _resolve_path(entry["output_path"], base_dir) if entry.get("output_path") else None
+                ),
+                overrides=merge_config(shared_overrides, clip_overrides),
+            )
+        )
+    settings = {"workers": int(manifest.get("workers") or DEFAULT_BATCH_WORKERS)}
+    return clips, settings
+
+
+def _run_clip(clip: BatchClip, inference_lane: threading.Lock) -> BatchClipResult:
+    from .config import load_yaml_config, parse_feedforward_config
+    from .reconstruct import RunProfiler, reconstruct
+
+    started_at = time.perf_counter()
+    profiler = RunProfiler(enabled=True)
+    engine = None
+    try:
+        cfg = merge_config(load_yaml_config(clip.config), clip.overrides)
+        cfg["image_path"] = str(clip.input)
+        if clip.output_path is not None:
+            cfg["output_path"] = str(clip.output_path)
+        params = parse_feedforward_config(cfg, config_path=clip.config)
+        engine = params["engine"]
+        output_path = reconstruct(**params, inference_lane=inference_lane, profiler=profiler)
+        status, error = "ok", None
+    except Exception as exc:
+        output_path, status, error = None, "failed", f"{type(exc).__name__}: {exc}"
+    finally:
+        profiler.finish()
+
+    stages: dict[str, float] = {}
+    for stage in profiler.stages:
+        stages[stage.name] = stages.get(stage.name, 0.0) + stage.elapsed_s
+    return BatchClipResult(
+        index=clip.index,
+        input=str(clip.input),
+        engine=engine,
+        status=status,
+        output_path=str(output_path) if output_path is not None else None,
+        error=error,
+        wall_s=time.perf_counter() - started_at,
+        peak_rss_bytes=profiler.run_peak_rss_bytes,
+        stages=stages,
+        notes=dict(profiler.notes),
+    )
+
+
+def write_batch_summary(path: Path, results: list[BatchClipResult], *, wall_s: float) -> None:
+    ordered = sorted(results, key=lambda result: result.index)
+    payload = {
+        "wall_s": wall_s,
+        "clips": len(ordered),
+        "ok": sum(result.status == "ok" for result in ordered),
+        "failed": sum(result.status != "ok" for result in ordered),
+        "results": [asdict(result) for result in ordered],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2))
+    tmp_path.replace(path)
+
+
+def print_batch_summary(results: list[BatchClipResult], *, wall_s: float) -> None:
+    from .reconstruct import _format_seconds
+
+    ordered = sorted(results, key=lambda result: result.index)
+    name_width = max(len(Path(result.input).name) for result in ordered)
+    print("\n--- [vibephysics] Batch summary ---")
+    for result in ordered:
+        inference_s = result.stages.get("inference")
+        if inference_s is not None:
+            inference = _format_seconds(inference_s)
+        elif result.notes.get("Inference cache", "").startswith("hit"):
+            inference = "cached"
+        else:
+            inference = "-"
+        line = (
+            f"{Path(result.input).name:<{name_width}}  {result.status:<6}  "
+            f"wall {_format_seconds(result.wall_s):>8}  inference {inference:>8}"
+        )
+        if result.error:
+            line += f"  {result.error}"
+        print(line)
+    ok = sum(result.status == "ok" for result in ordered)
+    print(f"\n{ok}/{len(ordered)} clips succeeded in {_format_seconds(wall_s)}")
+
+
+def run_batch(
+    manifest_path: str | Path,
+    *,
+    workers: int | None = None,
+    summary_path: str | Path | None = None,
+) -> list[BatchClipResult]:
+    """
+    Reconstruct every clip in ``manifest_path`` with warm models.
+
+    ``workers`` clips are in flight at once; model inference (and detection_seg) is
+    serialized on one lane, so with ``workers >= 2`` the post-processing and export of
+    one clip overlap inference of the next. The summary JSON is rewritten after each clip.
+    """
+    from .common import set_model_pool_enabled
+
+    clips, settings = load_batch_manifest(manifest_path)
+    workers = max(1, int(workers or settings["workers"]))
+    if summary_path is None:
+        summary_path = Path(manifest_path).expanduser().resolve().with_name("batch_summary.json")
+    summary_path = Path(summary_path)
+
+    inference_lane = threading.Lock()
+    results: list[BatchClipResult] = []
+    started_at = time.perf_counter()
+    print(
+        f"--- [vibephysics] Batch: {len(clips)} clips, {workers} in flight, "
+        f"summary -> {summary_path} ---",
+        flush=True,
+    )
+    set_model_pool_enabled(True)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vibephysics-batch") as pool:
+            futures = [pool.submit(_run_clip, clip, inference_lane) for clip in clips]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                print(
+                    f"--- [vibephysics] Batch clip {result.index + 1}/{len(clips)} "
+                    f"{result.status}: {result.input} ---",
+                    flush=True,
+                )
+                write_batch_summary(summary_path, results, wall_s=time.perf_counter() - started_at)
+    finally:
+        set_model_pool_enabled(False)
+
+    wall_s = time.perf_counter() - started_at
+    write_batch_summary(summary_path, results, wall_s=wall_s)
+    print_batch_summary(results, wall_s=wall_s)
+    return sorted(results, key=lambda result: result.index)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Run feedforward reconstruction over a manifest of clips with warm models."
+    )
+    parser.add_argument("manifest", type=Path, help="Batch manifest YAML (see module docstring).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Clips in flight (default: manifest workers or {DEFAULT_BATCH_WORKERS}). "
+        "Inference stays serialized; extra workers overlap post-processing/export.",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=None,
+        help="Per-clip status/timing JSON (default: batch_summary.json next to the manifest).",
+    )
+    args = parser.parse_args()
+
+    try:
+        results = run_batch(args.manifest, workers=args.workers, summary_path=args.summary)
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(1)
+    sys.exit(0 if all(result.status == "ok" for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import math
 import os
 import subprocess
+import sys
+import threading
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TypeAlias
+from typing import Any, Callable, TypeAlias
 
 import numpy as np
 
@@ -188,8 +191,10 @@ def select_frames(
     elif mode == "spread":
         indices = np.linspace(0, len(image_paths) - 1, max_frames, dtype=int)
         indices = sorted(set(indices.tolist()))
+    elif mode == "adaptive":
+        raise ValueError("max_frames mode 'adaptive' needs indices from keyframes.select_keyframes")
     else:
-        raise ValueError(f"Unknown max_frames mode '{mode}'. Use 'first' or 'spread'.")
+        raise ValueError(f"Unknown max_frames mode '{mode}'. Use 'first', 'spread' or 'adaptive'.")
 
     selected = [image_paths[i] for i in indices]
     return selected, indices
@@ -202,13 +207,26 @@ def limit_image_frames(
     mode: str = "first",
     verbose: bool = True,
     engine_label: str = "feedforward",
+    indices: list[int] | None = None,
 ) -> tuple[list[Path], list[int], int]:
     """
     Apply unified frame limits shared by LingBot-Map and VGGT-Omega.
 
-    Returns (selected_paths, source_indices, total_input_count).
+    ``indices`` (precomputed, e.g. adaptive keyframes) takes precedence over
+    ``max_frames`` / ``mode``. Returns (selected_paths, source_indices, total_input_count).
     """
     total = len(image_paths)
+    if indices is not None:
+        indices = sorted({int(index) for index in indices if 0 <= int(index) < total})
+        if not indices:
+            raise ValueError("No valid frame indices selected")
+        if verbose and len(indices) < total:
+            print(
+                f"--- [vibephysics] {engine_label}: using {len(indices)}/{total} "
+                f"input frames (content-adaptive) ---",
+                flush=True,
+            )
+        return [image_paths[index] for index in indices], indices, total
     if max_frames is None or total <= max_frames:
         return image_paths, list(range(total)), total
 
@@ -242,8 +260,8 @@ def engine_preview_label(engine: str) -> str:
     return engine.replace("_", " ").strip() or "feedforward"
 
 
-def estimate_video_frame_count(video_path: Path, extract_fps: float) -> int | None:
-    """Estimate extracted frame count from video duration and target fps."""
+def probe_video_duration(video_path: Path) -> float | None:
+    """Container duration in seconds via ffprobe (None when ffprobe is missing or fails)."""
     try:
         result = subprocess.run(
             [
@@ -260,9 +278,16 @@ def estimate_video_frame_count(video_path: Path, extract_fps: float) -> int | No
             capture_output=True,
             text=True,
         )
-        duration = float(result.stdout.strip())
+        return float(result.stdout.strip())
     except (FileNotFoundError, subprocess.CalledProcessError, ValueError):
         return None
+
+
+def estimate_video_frame_count(video_path: Path, extract_fps: float) -> int | None:
+    """Estimate extracted frame count from video duration and target fps."""
+    duration = probe_video_duration(video_path)
+    if duration is None:
+        return None
     return max(int(duration * max(float(extract_fps), 1e-6)), 1)
 
 
@@ -306,6 +331,8 @@ def estimate_input_frame_count(
         num_frames = max_frames
         if max_frames_mode == "first":
             suffix = " [first consecutive frames]"
+        elif max_frames_mode == "adaptive":
+            suffix = " [at most, content-adaptive]"
         else:
             suffix = " [spread across full input]"
     return num_frames, suffix
@@ -402,6 +429,141 @@ def apply_edge_filtering(depth: np.ndarray, conf: np.ndarray) -> None:
         conf[i][norm >= (12.0 / 255.0)] = 0.0
 
 
+def _axis_slice(ndim: int, axis: int, start: int, stop: int) -> tuple[slice, ...]:
+    index = [slice(None)] * ndim
+    index[axis] = slice(start, stop)
+    return tuple(index)
+
+
+def _window_extreme_1d(src: np.ndarray, pad: int, axis: int, op: np.ufunc, out: np.ndarray) -> np.ndarray:
+    """Running ``op`` (max/min) over ``2 * pad + 1`` samples along ``axis``, edge-clamped."""
+    np.copyto(out, src)
+    n = src.shape[axis]
+    ndim = src.ndim
+    first = src[_axis_slice(ndim, axis, 0, 1)]
+    last = src[_axis_slice(ndim, axis, n - 1, n)]
+    for offset in range(1, pad + 1):
+        offset = min(offset, n)
+        head = _axis_slice(ndim, axis, 0, n - offset)
+        tail = _axis_slice(ndim, axis, n - offset, n)
+        op(out[head], src[_axis_slice(ndim, axis, offset, n)], out=out[head])
+        op(out[tail], last, out=out[tail])
+        head = _axis_slice(ndim, axis, offset, n)
+        tail = _axis_slice(ndim, axis, 0, offset)
+        op(out[head], src[_axis_slice(ndim, axis, 0, n - offset)], out=out[head])
+        op(out[tail], first, out=out[tail])
+    return out
+
+
+def _depth_edge_block(depth: np.ndarray, rtol: float, kernel_size: int) -> np.ndarray:
+    # Max/min are separable: rows then columns gives the same k x k window (with the
+    # same edge padding and NaN propagation) in 4 * (k // 2) passes instead of k * k.
+    pad = kernel_size // 2
+    scratch = np.empty_like(depth)
+    jump = _window_extreme_1d(
+        _window_extreme_1d(depth, pad, -1, np.maximum, scratch), pad, -2, np.maximum, np.empty_like(depth)
+    )
+    low = _window_extreme_1d(
+        _window_extreme_1d(depth, pad, -1, np.minimum, np.empty_like(depth)), pad, -2, np.minimum, scratch
+    )
+    np.subtract(jump, low, out=jump)
+    np.abs(depth, out=low)
+    np.maximum(low, 1e-6, out=low)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        np.divide(jump, low, out=jump)
+    return jump > rtol
+
+
+def depth_edge_mask(
+    depth: np.ndarray,
+    rtol: float = 0.03,
+    kernel_size: int = 3,
+    *,
+    dtype: np.dtype | type | None = None,
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    Pixels whose ``kernel_size`` x ``kernel_size`` depth range exceeds ``rtol`` x |depth|.
+
+    ``depth`` is (..., H, W); all frames are filtered at once. ``dtype=np.float16``
+    halves the working set (pixels near the threshold may flip); ``workers > 1`` splits frames
+    over a thread pool.
+    """
+    depth = np.asarray(depth)
+    original_shape = depth.shape
+    frames = depth.reshape(-1, *original_shape[-2:])
+    if dtype is not None:
+        frames = frames.astype(dtype, copy=False)
+    elif not np.issubdtype(frames.dtype, np.floating):
+        frames = frames.astype(np.float32)
+
+    workers = max(1, min(int(workers), len(frames)))
+    if workers == 1:
+        return _depth_edge_block(frames, rtol, kernel_size).reshape(original_shape)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    mask = np.empty(frames.shape, dtype=bool)
+    bounds = np.linspace(0, len(frames), workers + 1).astype(int)
+
+    def run(start: int, stop: int) -> None:
+        mask[start:stop] = _depth_edge_block(frames[start:stop], rtol, kernel_size)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, bounds[:-1], bounds[1:]))
+    return mask.reshape(original_shape)
+
+
+def filter_depth_conf_edges(
+    depth: np.ndarray,
+    conf: np.ndarray,
+    *,
+    rtol: float = 0.03,
+    dtype: np.dtype | type | None = None,
+    workers: int | None = None,
+) -> np.ndarray:
+    """Copy of ``conf`` with depth-discontinuity pixels zeroed (``depth`` may be (S, H, W, 1))."""
+    conf = conf.copy()
+    depth_for_edges = depth[..., 0] if depth.ndim == 4 else depth
+    if workers is None:
+        workers = min(4, available_cpus())
+    conf[depth_edge_mask(depth_for_edges, rtol=rtol, dtype=dtype, workers=workers)] = 0.0
+    return conf
+
+
+def umeyama_alignment(
+    src: np.ndarray,
+    dst: np.ndarray,
+    *,
+    with_scale: bool = False,
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """
+    Least-squares ``dst ≈ s * R @ src + t`` (Umeyama / Kabsch) for (N, 3) correspondences.
+
+    Returns ``(s, R, t)``; ``s`` is 1.0 unless ``with_scale``.
+    """
+    src = np.asarray(src, dtype=np.float64).reshape(-1, 3)
+    dst = np.asarray(dst, dtype=np.float64).reshape(-1, 3)
+    if len(src) != len(dst) or len(src) < 3:
+        raise ValueError("umeyama_alignment needs >= 3 matching points")
+    src_mean = src.mean(axis=0)
+    dst_mean = dst.mean(axis=0)
+    src_c = src - src_mean
+    dst_c = dst - dst_mean
+    cov = dst_c.T @ src_c / len(src)
+    u, sigma, vt = np.linalg.svd(cov)
+    d = np.ones(3)
+    if np.linalg.det(u) * np.linalg.det(vt) < 0:
+        d[-1] = -1.0
+    rotation = u @ np.diag(d) @ vt
+    scale = 1.0
+    if with_scale:
+        src_var = float((src_c**2).sum() / len(src))
+        scale = float((sigma * d).sum() / src_var) if src_var > 0 else 1.0
+    translation = dst_mean - scale * rotation @ src_mean
+    return scale, rotation, translation
+
+
 def c2w_to_w2c(extrinsic_c2w: np.ndarray) -> np.ndarray:
     extrinsic_c2w = to_numpy(extrinsic_c2w)
     if extrinsic_c2w.ndim == 2:
@@ -473,13 +635,39 @@ def resolve_torch_device(*, verbose: bool = True) -> TorchDeviceInfo:
 
     By default this uses CUDA when PyTorch can initialize it, otherwise CPU.
     Set VIBEPHYSICS_DEVICE=cpu or VIBEPHYSICS_DEVICE=cuda to override.
+    The probe runs once per environment (see ``probe_cache``); later calls and
+    processes reuse it.
     """
-    import torch
+    from dataclasses import asdict
+
+    from .probe_cache import cached_probe
 
     requested = os.environ.get("VIBEPHYSICS_DEVICE", "auto").strip().lower() or "auto"
     if requested not in {"auto", "cuda", "cpu"}:
         raise ValueError("VIBEPHYSICS_DEVICE must be one of: auto, cuda, cpu")
 
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES", "*")
+    info = cached_probe(
+        f"torch_device:{requested}:{visible}",
+        lambda: _probe_torch_device(requested),
+        encode=asdict,
+        decode=_torch_device_info_from_dict,
+        # A transient CUDA init failure on a host with a driver must not pin later runs to CPU.
+        cache_if=lambda info: requested == "cpu" or info.cuda_available or info.nvidia_driver_version is None,
+    )
+    if verbose:
+        print(format_torch_device_info(info), flush=True)
+    return info
+
+
+def _torch_device_info_from_dict(data: dict[str, Any]) -> TorchDeviceInfo:
+    capability = data.get("cuda_capability")
+    return TorchDeviceInfo(**{**data, "cuda_capability": tuple(capability) if capability else None})
+
+
+def _probe_torch_device(requested: str) -> TorchDeviceInfo:
+    import torch
+
     with warnings.catch_warnings(record=True) as caught:
         warnings.simplefilter("always")
         cuda_available = bool(torch.cuda.is_available())
@@ -506,7 +694,7 @@ def resolve_torch_device(*, verbose: bool = True) -> TorchDeviceInfo:
         raise RuntimeError(f"VIBEPHYSICS_DEVICE=cuda was requested, but CUDA is unavailable. {details}")
 
     device_type = "cuda" if requested in {"auto", "cuda"} and cuda_available else "cpu"
-    info = TorchDeviceInfo(
+    return TorchDeviceInfo(
         device_type=device_type,
         torch_version=torch.__version__,
         torch_cuda_version=torch.version.cuda,
@@ -519,9 +707,6 @@ def resolve_torch_device(*, verbose: bool = True) -> TorchDeviceInfo:
         nvidia_gpu_name=gpu_name,
         requested_device=requested,
     )
-    if verbose:
-        print(format_torch_device_info(info), flush=True)
-    return info
 
 
 def _format_cuda_unavailable_reason(
@@ -576,6 +761,289 @@ def format_torch_device_info(info: TorchDeviceInfo) -> str:
     return f"--- [vibephysics] Torch device: cpu (torch {info.torch_version}) ---"
 
 
+# Warm model pool: long-running callers (batch / serve) keep built models resident so
+# repeated clips skip construction and checkpoint loading. Off for one-shot runs so
+# weights are freed when ``reconstruct`` returns. At most ``VIBEPHYSICS_MODEL_POOL_SIZE``
+# models (default 2) stay resident; the least recently used one is dropped first.
+DEFAULT_MODEL_POOL_SIZE = 2
+_MODEL_POOL: OrderedDict[tuple, Any] = OrderedDict()
+_MODEL_POOL_LOCK = threading.Lock()
+_MODEL_POOL_ENABLED = False
+
+
+def set_model_pool_enabled(enabled: bool) -> None:
+    global _MODEL_POOL_ENABLED
+    _MODEL_POOL_ENABLED = bool(enabled)
+    if not enabled:
+        clear_model_pool()
+
+
+def model_pool_enabled() -> bool:
+    return _MODEL_POOL_ENABLED
+
+
+def model_pool_size() -> int:
+    try:
+        return max(1, int(os.environ.get("VIBEPHYSICS_MODEL_POOL_SIZE", DEFAULT_MODEL_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_MODEL_POOL_SIZE
+
+
+def _free_cuda_cache() -> None:
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        import gc
+
+        gc.collect()
+        torch.cuda.empty_cache()
+
+
+def pooled_model(key: tuple, loader: Callable[[], Any], *, verbose: bool = False) -> Any:
+    """Return the pooled model for ``key``, building it with ``loader`` on first use."""
+    if not _MODEL_POOL_ENABLED:
+        return loader()
+    with _MODEL_POOL_LOCK:
+        model = _MODEL_POOL.get(key)
+        if model is not None:
+            _MODEL_POOL.move_to_end(key)
+            if verbose:
+                print(f"--- [vibephysics] Reusing warm {key[0]} model ---", flush=True)
+            return model
+        # Make room before building, so the evicted weights are freed first.
+        evicted = []
+        while len(_MODEL_POOL) >= model_pool_size():
+            evicted.append(_MODEL_POOL.popitem(last=False)[0])
+        if evicted:
+            if verbose:
+                names = ", ".join(str(old_key[0]) for old_key in evicted)
+                print(f"--- [vibephysics] Model pool full; dropped warm {names} model ---", flush=True)
+            _free_cuda_cache()
+        model = loader()
+        _MODEL_POOL[key] = model
+        return model
+
+
+def clear_model_pool() -> None:
+    with _MODEL_POOL_LOCK:
+        _MODEL_POOL.clear()
+    _free_cuda_cache()
+
+
+CPU_QUANTIZE_MODES = ("none", "int8")
+
+
+def normalize_cpu_quantize(value: str | None) -> str | None:
+    """``"int8"`` or None (fp32); accepts ``none`` / ``off`` / ``fp32`` / null."""
+    text = str(value or "none").strip().lower()
+    if text in ("none", "off", "false", "fp32"):
+        return None
+    if text == "int8":
+        return text
+    raise ValueError(f"Unknown cpu_quantize '{value}'. Choose one of: {', '.join(CPU_QUANTIZE_MODES)}")
+
+
+def resolve_cpu_quantize(value: str | None, device: str, *, verbose: bool = True) -> str | None:
+    """Effective quantization for this run: dynamic int8 kernels exist on CPU only."""
+    mode = normalize_cpu_quantize(value)
+    if mode is not None and str(device) != "cpu":
+        if verbose:
+            print(f"--- [vibephysics] cpu_quantize={mode} ignored on {device} (CPU only) ---", flush=True)
+        return None
+    return mode
+
+
+def _cpu_quantize_cache_path(checkpoint: str | Path, cache_dir: Path, mode: str, variant: object) -> Path:
+    import hashlib
+    import json
+
+    import torch
+
+    checkpoint_path = Path(checkpoint)
+    identity: list[Any] = [str(checkpoint), mode, repr(variant), torch.__version__]
+    if checkpoint_path.is_file():
+        stat = checkpoint_path.stat()
+        identity += [stat.st_size, stat.st_mtime_ns]
+        stem = checkpoint_path.stem
+    else:
+        stem = str(checkpoint).replace("/", "--")
+    digest = hashlib.sha256(json.dumps(identity).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{stem}.{mode}-dynamic.{digest}.pt"
+
+
+def cpu_quantized_model(
+    build: Callable[[], Any],
+    *,
+    cpu_quantize: str | None,
+    load_weights: Callable[[Any], None] | None = None,
+    checkpoint: str | Path | None = None,
+    cache_dir: Path | None = None,
+    variant: object = None,
+    verbose: bool = True,
+) -> Any:
+    """
+    Build an engine model, with dynamic int8 ``nn.Linear`` layers when ``cpu_quantize="int8"``.
+
+    ``build()`` returns the fp32 module on its device; ``load_weights(model)`` loads the
+    checkpoint when that is a separate step. ``cpu_quantize`` must already be resolved
+    for the device (:func:`resolve_cpu_quantize`). With a separate ``load_weights`` the
+    quantized state dict is cached in ``cache_dir`` (keyed by checkpoint identity,
+    ``variant`` and the torch version), so later runs skip reading the fp32 checkpoint.
+    """
+    if cpu_quantize is None:
+        model = build()
+        if load_weights is not None:
+            load_weights(model)
+        return model
+
+    import torch
+    from torch.ao.quantization import quantize_dynamic
+
+    def quantize(model):
+        return quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+    cache_path = None
+    if load_weights is not None and checkpoint is not None and cache_dir is not None:
+        cache_path = _cpu_quantize_cache_path(checkpoint, cache_dir, cpu_quantize, variant)
+
+    model = build()
+    if cache_path is not None and cache_path.is_file():
+        if verbose:
+            print(f"--- [vibephysics] Loading cached {cpu_quantize} weights: {cache_path} ---", flush=True)
+        model = quantize(model)
+        # Our own file; packed int8 params are not plain tensors, so weights_only cannot be used.
+        model.load_state_dict(torch.load(cache_path, map_location="cpu", weights_only=False))
+        return model
+
+    if load_weights is not None:
+        load_weights(model)
+    if verbose:
+        print(f"--- [vibephysics] Quantizing Linear layers to {cpu_quantize} (dynamic, CPU) ---", flush=True)
+    model = quantize(model)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            torch.save(model.state_dict(), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    return model
+
+
+def _cgroup_cpu_quota() -> float | None:
+    """CPUs granted by the cgroup CPU quota (v2 ``cpu.max`` or v1 CFS files); None when unlimited."""
+    root = Path("/sys/fs/cgroup")
+    candidates = [(root / "cpu.max", None)]
+    for v1 in ("cpu", "cpu,cpuacct"):
+        candidates.append((root / v1 / "cpu.cfs_quota_us", root / v1 / "cpu.cfs_period_us"))
+    for quota_path, period_path in candidates:
+        try:
+            if period_path is None:
+                quota, period = quota_path.read_text().split()[:2]
+            else:
+                quota, period = quota_path.read_text().strip(), period_path.read_text().strip()
+        except (OSError, ValueError):
+            continue
+        if quota in ("max", "-1"):
+            return None
+        try:
+            quota_us, period_us = int(quota), int(period)
+        except ValueError:
+            continue
+        if quota_us > 0 and period_us > 0:
+            return quota_us / period_us
+    return None
+
+
+def _cpu_budget() -> tuple[int, str]:
+    try:
+        cpus, source = len(os.sched_getaffinity(0)), "affinity"
+    except (AttributeError, OSError):
+        cpus, source = os.cpu_count() or 1, "os.cpu_count"
+    quota = _cgroup_cpu_quota()
+    if quota is not None and math.ceil(quota) < cpus:
+        cpus, source = math.ceil(quota), "cgroup quota"
+    return max(1, int(cpus)), source
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: scheduler affinity, capped by the cgroup CPU quota."""
+    return _cpu_budget()[0]
+
+
+@dataclass(frozen=True)
+class CpuThreadPlan:
+    """How one run splits its CPU budget between torch inference and frame post-processing."""
+
+    cpus: int
+    source: str
+    intra_op_threads: int
+    inter_op_threads: int
+    postprocess_workers: int
+    overlap_postprocess: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        from dataclasses import asdict
+
+        return asdict(self)
+
+
+def plan_cpu_threads(cpu_threads: int | None = None, *, overlap_postprocess: bool = False) -> CpuThreadPlan:
+    """
+    Pick torch intra/inter-op threads and frame-postprocess workers for this run.
+
+    The budget is ``cpu_threads`` when set, else ``OMP_NUM_THREADS``, else
+    :func:`available_cpus`. Alone, inference and post-processing run one after the
+    other and each gets every core. With ``overlap_postprocess`` (another job's
+    post-processing runs during this job's inference, as in ``batch`` / ``serve``) a
+    quarter of the cores go to post-processing so the two pools do not oversubscribe.
+    """
+    if cpu_threads:
+        cpus, source = max(1, int(cpu_threads)), "cpu_threads"
+    elif os.environ.get("OMP_NUM_THREADS", "").strip().isdigit() and int(os.environ["OMP_NUM_THREADS"]) > 0:
+        cpus, source = int(os.environ["OMP_NUM_THREADS"]), "OMP_NUM_THREADS"
+    else:
+        cpus, source = _cpu_budget()
+    if overlap_postprocess and cpus > 1:
+        postprocess_workers = max(1, cpus // 4)
+        intra_op_threads = cpus - postprocess_workers
+    else:
+        postprocess_workers = intra_op_threads = cpus
+    # One forward graph at a time: a wide inter-op pool only adds idle threads.
+    inter_op_threads = 1 if intra_op_threads < 8 else 2
+    return CpuThreadPlan(
+        cpus=cpus,
+        source=source,
+        intra_op_threads=intra_op_threads,
+        inter_op_threads=inter_op_threads,
+        postprocess_workers=postprocess_workers,
+        overlap_postprocess=bool(overlap_postprocess),
+    )
+
+
+def apply_cpu_thread_plan(plan: CpuThreadPlan) -> tuple[int, int]:
+    """Set torch intra/inter-op threads from ``plan``; returns the effective ``(intra, inter)``."""
+    import torch
+
+    if torch.get_num_threads() != plan.intra_op_threads:
+        torch.set_num_threads(plan.intra_op_threads)
+    if torch.get_num_interop_threads() != plan.inter_op_threads:
+        try:
+            torch.set_num_interop_threads(plan.inter_op_threads)
+        except RuntimeError:
+            pass  # fixed once the inter-op pool has started (earlier run in this process)
+    return torch.get_num_threads(), torch.get_num_interop_threads()
+
+
+def format_cpu_thread_plan(plan: CpuThreadPlan, *, torch_threads: tuple[int, int] | None = None) -> str:
+    if torch_threads is None:
+        torch_part = "torch threads unchanged"
+    else:
+        torch_part = f"torch {torch_threads[0]} intra-op / {torch_threads[1]} inter-op"
+    overlap = ", overlapping inference" if plan.overlap_postprocess else ""
+    return f"{plan.cpus} CPUs ({plan.source}): {torch_part}, {plan.postprocess_workers} postprocess workers{overlap}"
+
+
 def images_chw_to_hwc(images: np.ndarray) -> np.ndarray:
     """Convert model output images to float32 HWC in [0, 1]."""
     if images.ndim == 4 and images.shape[1] == 3:
@@ -787,19 +1255,20 @@ def apply_only_start_frame_pose(
     prediction.metadata["only_start_frame_pose_index"] = int(reference_frame)
 
 
-def convert_prediction_to_blender_zup(prediction) -> bool:
+def convert_prediction_to_blender_zup(prediction) -> np.ndarray | None:
     """
     Convert ``world_points`` and ``extrinsic`` to Blender Z-up in place.
 
     Call after ground align (still runs in OpenCV). Saved NPZ then matches Blender
-    without a second coordinate pass in ``visual.py``.
+    without a second coordinate pass in ``visual.py``. Returns the applied world
+    rotation (``p' = R @ p``), or None when already Z-up.
     """
     from .schema import FeedforwardPrediction
 
     if not isinstance(prediction, FeedforwardPrediction):
         raise TypeError("convert_prediction_to_blender_zup expects FeedforwardPrediction")
     if is_blender_z_up(prediction):
-        return False
+        return None
 
     wp = prediction.world_points
     flat = opencv_to_blender_points(wp.reshape(-1, 3))
@@ -821,7 +1290,7 @@ def convert_prediction_to_blender_zup(prediction) -> bool:
     prediction.metadata = dict(prediction.metadata)
     prediction.metadata["world_coordinates"] = WORLD_COORDS_BLENDER_Z_UP
     prediction.metadata["extrinsic_is_matrix_world"] = True
-    return True
+    return world_b[:3, :3].copy()
 
 
 def collect_compact_colored_point_cloud(
@@ -994,9 +1463,37 @@ def collect_single_frame_point_chunk(
     images = resolve_frame_images(payload)
     conf = payload["conf"]
 
-    frame_points = points[frame_idx].reshape(-1, 3)
-    frame_colors = images[frame_idx].reshape(-1, 3)
-    frame_conf = conf[frame_idx].reshape(-1)
+    return point_chunk_from_frame_arrays(
+        points[frame_idx],
+        images[frame_idx],
+        conf[frame_idx],
+        frame_idx,
+        min_confidence=min_confidence,
+        point_cloud_3d_nms=point_cloud_3d_nms,
+        point_cloud_3d_nms_radius=point_cloud_3d_nms_radius,
+        point_cloud_3d_nms_min_neighbors=point_cloud_3d_nms_min_neighbors,
+        random_points_per_frame=random_points_per_frame,
+        rng_seed=rng_seed,
+    )
+
+
+def point_chunk_from_frame_arrays(
+    world_points: np.ndarray,
+    image: np.ndarray,
+    conf: np.ndarray,
+    frame_idx: int,
+    *,
+    min_confidence: float = 2.0,
+    point_cloud_3d_nms: bool = False,
+    point_cloud_3d_nms_radius: float = 0.03,
+    point_cloud_3d_nms_min_neighbors: int = 3,
+    random_points_per_frame: RandomPointsLimit | None = None,
+    rng_seed: int | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int] | None:
+    """Per-frame core of :func:`collect_single_frame_point_chunk` on raw (H, W, ...) arrays."""
+    frame_points = world_points.reshape(-1, 3)
+    frame_colors = image.reshape(-1, 3)
+    frame_conf = conf.reshape(-1)
     valid_mask = np.isfinite(frame_points).all(axis=1)
     if min_confidence > 0:
         valid_mask &= frame_conf >= min_confidence
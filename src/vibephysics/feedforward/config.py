@@ -7,15 +7,18 @@ from typing import Any
 
 import yaml
 
-from .common import DEFAULT_LINGBOT_MAP_MODEL, DEFAULT_VIDEO_FPS
+from .common import DEFAULT_LINGBOT_MAP_MODEL, DEFAULT_VIDEO_FPS, normalize_cpu_quantize
 
 CONFIGS_DIR = Path(__file__).resolve().parent / "configs"
 DEFAULT_FEEDFORWARD_CONFIG = CONFIGS_DIR / "feedforward.yaml"
 
-FEEDFORWARD_ENGINES = ("lingbot_map", "vggt_omega", "vgg_ttt", "map_anything", "r3", "dvlt")
+# Built-in engines; plugins registered through ``engines.register_engine`` or the
+# ``vibephysics.feedforward_engines`` entry-point group are accepted as well.
+FEEDFORWARD_ENGINES = ("lingbot_map", "vggt_omega", "vgg_ttt", "map_anything", "r3", "dvlt", "synthetic")
 
-MAX_FRAMES_MODES = ("spread", "first")
+MAX_FRAMES_MODES = ("spread", "first", "adaptive")
 POINT_DISPLAY_MODES = ("pointcloud", "points", "spheres")
+ANIMATION_MODES = ("progressive", "discrete")
 DEFAULT_POINT_SCALE = 0.004
 
 # Keys under ``output`` in feedforward.yaml (same names in reconstruct_config.json).
@@ -63,6 +66,15 @@ def load_yaml_config(path: str | Path) -> dict[str, Any]:
     return data
 
 
+def normalize_animation_mode(mode: str) -> str:
+    normalized = str(mode).strip().lower()
+    if normalized not in ANIMATION_MODES:
+        raise ValueError(
+            f"Unknown animation_mode '{mode}'. Choose one of: {', '.join(ANIMATION_MODES)}"
+        )
+    return normalized
+
+
 def _require(cfg: dict[str, Any], key: str, config_path: Path | None = None) -> Any:
     if key not in cfg or cfg[key] in (None, ""):
         prefix = f"{config_path}: " if config_path else ""
@@ -482,6 +494,31 @@ def _optional_int(value: Any) -> int | None:
     return int(value)
 
 
+def _optional_float(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    return float(value)
+
+
+def _cpu_threads(value: Any) -> int | None:
+    """Top-level ``cpu_threads``: ``auto`` / 0 / null = planned from affinity and cgroup quota."""
+    if value in (None, "", 0) or str(value).strip().lower() == "auto":
+        return None
+    return max(1, int(value))
+
+
+def _extract_workers(value: Any) -> int:
+    """``video.extract_workers``: 1 = serial, 0 / ``auto`` = chosen from duration and CPUs."""
+    if isinstance(value, str) and value.strip().lower() == "auto":
+        return 0
+    parsed = _optional_int(value)
+    if parsed is None:
+        return 1
+    if parsed < 0:
+        raise ValueError("video.extract_workers must be >= 0 (0 = auto)")
+    return parsed
+
+
 def _optional_positive_int(value: Any) -> int | None:
     parsed = _optional_int(value)
     if parsed is None or parsed <= 0:
@@ -542,9 +579,12 @@ def _optional_path(value: Any) -> Any:
 def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = None) -> dict[str, Any]:
     engine = _require(cfg, "engine", config_path)
     if engine not in FEEDFORWARD_ENGINES:
-        raise ValueError(
-            f"Invalid feedforward engine '{engine}'. Choose one of: {', '.join(FEEDFORWARD_ENGINES)}"
-        )
+        from .engines import engine_names
+
+        if engine not in engine_names():
+            raise ValueError(
+                f"Invalid feedforward engine '{engine}'. Choose one of: {', '.join(engine_names())}"
+            )
 
     lingbot_map = _nested(cfg, "lingbot_map")
     vggt_omega = _nested(cfg, "vggt_omega")
@@ -552,6 +592,7 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
     map_anything = _nested(cfg, "map_anything")
     r3 = _nested(cfg, "r3")
     dvlt = _nested(cfg, "dvlt")
+    synthetic = _nested(cfg, "synthetic")
     output = _nested(cfg, "output")
     video = _nested(cfg, "video")
     algo_3d_bbox = _nested(cfg, "algo_3d_bbox")
@@ -559,6 +600,7 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
 
     max_frames, max_frames_mode = resolve_input_frame_limits(cfg, engine)
     from .common import parse_random_points_limit
+    from .video_source import normalize_video_decode
 
     random_points_per_frame = parse_random_points_limit(
         _output_value(output, "random_points_per_frame"),
@@ -575,8 +617,20 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
         "output_path": cfg.get("output_path"),
         "engine": engine,
         "verbose": cfg.get("verbose", True),
+        "inference_cache": bool(cfg.get("inference_cache", True)),
+        "cpu_quantize": normalize_cpu_quantize(cfg.get("cpu_quantize")),
+        "cpu_threads": _cpu_threads(cfg.get("cpu_threads")),
         "video_fps": video.get("fps", DEFAULT_VIDEO_FPS),
         "video_quality": video.get("quality", 2),
+        "video_decode": normalize_video_decode(video.get("decode")),
+        "video_backend": str(video.get("backend") or "auto"),
+        "video_persist_frames": bool(video.get("persist_frames", True)),
+        "adaptive_motion_threshold": _optional_float(video.get("adaptive_motion_threshold")),
+        "adaptive_blur_reject": float(video.get("adaptive_blur_reject", 0.5)),
+        "video_extract_workers": _extract_workers(video.get("extract_workers", 1)),
+        "video_threads": _optional_positive_int(video.get("threads")),
+        "video_frame_cache": bool(video.get("frame_cache", True)),
+        "video_frame_cache_gb": _optional_float(video.get("frame_cache_gb")),
         "save_blend": output.get("save_blend"),
         "save_html": output.get("save_html"),
         "save_frames": bool(output.get("save_frames", False)),
@@ -592,6 +646,10 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
         "animation_mode": str(blend["animation_mode"]),
         "align_ground": output.get("align_ground", True),
         "only_start_frame_pose": bool(output.get("only_start_frame_pose", False)),
+        "pipelined_postprocess": bool(output.get("pipelined_postprocess", False)),
+        "memory_budget_gb": (
+            float(output["memory_budget_gb"]) if output.get("memory_budget_gb") else None
+        ),
         "keep_start_frame_point_cloud": bool(blend["keep_start_frame_point_cloud"]),
         "point_cloud_3d_nms": bool(
             output["point_cloud_3d_nms"]
@@ -665,6 +723,8 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
         "vggt_omega_enable_alignment": vggt_omega.get("enable_alignment", False),
         "vggt_omega_conf_percentile": vggt_omega.get("conf_percentile", 50.0),
         "vggt_omega_depth_edge_rtol": vggt_omega.get("depth_edge_rtol", 0.03),
+        "vggt_omega_chunk_size": _optional_int(vggt_omega.get("chunk_size")),
+        "vggt_omega_chunk_overlap": int(vggt_omega.get("chunk_overlap", 8)),
         "vgg_ttt_model_id": vgg_ttt.get("model_id", "nvidia/vgg-ttt"),
         "vgg_ttt_preprocess_mode": vgg_ttt.get("preprocess_mode", "crop"),
         "vgg_ttt_image_size": vgg_ttt.get("image_size", 518),
@@ -680,6 +740,9 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
         "map_anything_patch_size": map_anything.get("patch_size"),
         "map_anything_resize_mode": map_anything.get("resize_mode", "fixed_mapping"),
         "map_anything_size": map_anything.get("size"),
+        "map_anything_window_size": _optional_int(map_anything.get("window_size")),
+        "map_anything_window_stride": _optional_int(map_anything.get("window_stride")),
+        "map_anything_anchor_frames": int(map_anything.get("anchor_frames", 4)),
         "r3_checkpoint": _optional_path(r3.get("checkpoint")),
         "r3_model": r3.get("model", "r3_long"),
         "r3_config_name": r3.get("config_name", "r3-large"),
@@ -688,9 +751,20 @@ def parse_feedforward_config(cfg: dict[str, Any], config_path: Path | None = Non
         "r3_kv_backend": r3.get("kv_backend", "dense"),
         "r3_rel_pose_method": r3.get("rel_pose_method", "greedy"),
         "r3_metric_model_name": r3.get("metric_model_name", "depth-anything/DA3METRIC-LARGE"),
+        "r3_checkpoint_every": _optional_int(r3.get("checkpoint_every")),
+        "r3_resume": bool(r3.get("resume", False)),
         "dvlt_checkpoint": dvlt.get("checkpoint") or "nvidia/dvlt",
         "dvlt_img_size": dvlt.get("img_size", 504),
         "dvlt_patch_size": dvlt.get("patch_size", 14),
         "dvlt_conf_percentile": dvlt.get("conf_percentile", 50.0),
         "dvlt_depth_edge_rtol": dvlt.get("depth_edge_rtol", 0.03),
+        "synthetic_height": int(synthetic.get("height", 240)),
+        "synthetic_width": int(synthetic.get("width", 320)),
+        "synthetic_latency_per_frame": float(synthetic.get("latency_per_frame", 0.0)),
+        "synthetic_num_boxes": int(synthetic.get("num_boxes", 3)),
+        "synthetic_seed": int(synthetic.get("seed", 0)),
+        "synthetic_depth_noise": float(synthetic.get("depth_noise", 0.002)),
+        "synthetic_scene_scale": float(synthetic.get("scene_scale", 0.25)),
+        # Plugin engines read their own YAML section (``<engine>:``) as settings.
+        "engine_settings": None if engine in FEEDFORWARD_ENGINES else dict(_nested(cfg, engine)),
     }
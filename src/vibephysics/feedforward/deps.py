@@ -25,6 +25,7 @@ _PYPI_DEPS: dict[str, list[tuple[str, str]]] = {
         ("torch", "torch"),
         ("cv2", "opencv-python"),
         ("huggingface_hub", "huggingface_hub"),
+        ("safetensors", "safetensors"),
     ],
     "vgg_ttt": [
         ("torch", "torch"),
@@ -475,13 +476,28 @@ def _ensure_torch_dependencies(engine: str, *, auto_install: bool, verbose: bool
 
 
 def ensure_engine_dependencies(engine: str, *, verbose: bool = True) -> bool:
-    """Install PyPI + GitHub deps for a feedforward engine on first use."""
+    """
+    Install PyPI + GitHub deps for a feedforward engine on first use.
+
+    A successful check is stamped per environment (``probe_cache``), so later runs
+    and worker processes skip the module scan until packages or the driver change.
+    """
+    from .probe_cache import cached_probe
+
     if engine not in _PYPI_DEPS:
         raise ValueError(f"Unknown feedforward engine: {engine}")
 
     if engine == "detection_seg":
         configure_detection_seg_runtime()
 
+    return cached_probe(
+        f"engine_deps:{engine}",
+        lambda: _ensure_engine_dependencies(engine, verbose=verbose),
+        cache_if=bool,
+    )
+
+
+def _ensure_engine_dependencies(engine: str, *, verbose: bool) -> bool:
     auto_install = os.environ.get("VIBEPHYSICS_NO_AUTO_INSTALL", "").strip().lower() not in {
         "1",
         "true",
@@ -9,21 +9,25 @@ from collections.abc import Iterator
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
 
 from ..common import (
     c2w_to_w2c,
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
     feedforward_hf_hub_cache,
+    filter_depth_conf_edges,
     get_vram_gb,
     images_chw_to_hwc,
     limit_image_frames,
+    resolve_cpu_quantize,
     resolve_torch_device,
     to_numpy,
 )
 from ..deps import ensure_engine_dependencies
 from ..schema import FeedforwardPrediction
+from ..video_source import VideoFrameSource
+from ..weights import load_checkpoint_into
 
 DEFAULT_CACHE = feedforward_engine_dir("dvlt")
 DEFAULT_CHECKPOINT = "nvidia/dvlt"
@@ -31,33 +35,6 @@ DEFAULT_IMG_SIZE = 504
 DEFAULT_PATCH_SIZE = 14
 
 
-def _depth_edge(depth: np.ndarray, rtol: float = 0.03, kernel_size: int = 3) -> np.ndarray:
-    depth = np.asarray(depth)
-    original_shape = depth.shape
-    depth = depth.reshape(-1, *original_shape[-2:])
-
-    pad = kernel_size // 2
-    padded = np.pad(depth, ((0, 0), (pad, pad), (pad, pad)), mode="edge")
-    depth_max = np.full_like(depth, -np.inf)
-    depth_min = np.full_like(depth, np.inf)
-
-    for y in range(kernel_size):
-        for x in range(kernel_size):
-            window = padded[:, y : y + depth.shape[-2], x : x + depth.shape[-1]]
-            depth_max = np.maximum(depth_max, window)
-            depth_min = np.minimum(depth_min, window)
-
-    relative_jump = (depth_max - depth_min) / np.maximum(np.abs(depth), 1e-6)
-    return (relative_jump > rtol).reshape(original_shape)
-
-
-def _filter_depth_conf_edges(depth: np.ndarray, conf: np.ndarray, *, rtol: float = 0.03) -> np.ndarray:
-    conf = conf.copy()
-    depth_for_edges = depth[..., 0] if depth.ndim == 4 else depth
-    conf[_depth_edge(depth_for_edges, rtol=rtol)] = 0.0
-    return conf
-
-
 def is_available() -> bool:
     return importlib.util.find_spec("dvlt") is not None
 
@@ -89,6 +66,14 @@ def _dvlt_hf_cache() -> Iterator[None]:
                 os.environ[key] = value
 
 
+def _load_weights(model, checkpoint: str | Path, *, verbose: bool) -> None:
+    """Local ``.safetensors`` / ``.pt`` files load memory-mapped; Hub ids go through upstream."""
+    if Path(checkpoint).is_file():
+        load_checkpoint_into(model, checkpoint, strict=True, verbose=verbose)
+    else:
+        model.load_pretrained(str(checkpoint), strict=True)
+
+
 def run_dvlt(
     image_path: Path,
     *,
@@ -97,9 +82,12 @@ def run_dvlt(
     patch_size: int = DEFAULT_PATCH_SIZE,
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
     filter_depth_edges: bool = True,
     depth_edge_rtol: float = 0.03,
     conf_percentile: float = 50.0,
+    frame_source: VideoFrameSource | None = None,
+    cpu_quantize: str | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
     if not ensure_dependencies(verbose):
@@ -113,17 +101,22 @@ def run_dvlt(
     from dvlt.common.constants import DataField, PredictionField
     from dvlt.model.dvlt.model import DVLT
     from dvlt.util.preprocess import preprocess_images
+    from PIL import Image
 
-    all_images = discover_images(image_path)
+    all_images = frame_source.frame_paths() if frame_source is not None else discover_images(image_path)
     selected, indices, input_num_frames = limit_image_frames(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label="DVLT",
     )
     str_paths = [str(p) for p in selected]
-    pil_frames = [Image.open(p).convert("RGB") for p in selected]
+    if frame_source is not None:
+        pil_frames = [Image.fromarray(rgb) for rgb in frame_source.read_frames(indices)]
+    else:
+        pil_frames = [Image.open(p).convert("RGB") for p in selected]
 
     if verbose:
         print(
@@ -139,6 +132,7 @@ def run_dvlt(
             flush=True,
         )
 
+    cpu_quantize = resolve_cpu_quantize(cpu_quantize, device, verbose=verbose)
     mixed_precision = "bf16" if device != "cpu" else "no"
     accelerator = Accelerator(mixed_precision=mixed_precision)
     torch_device = accelerator.device
@@ -146,8 +140,15 @@ def run_dvlt(
     with _dvlt_hf_cache():
         if verbose:
             print(f"--- [vibephysics] Loading DVLT checkpoint: {checkpoint} ---", flush=True)
-        model = DVLT(img_size=int(img_size))
-        model.load_pretrained(str(checkpoint), strict=True)
+        model = cpu_quantized_model(
+            lambda: DVLT(img_size=int(img_size)),
+            load_weights=lambda model: _load_weights(model, checkpoint, verbose=verbose),
+            cpu_quantize=cpu_quantize,
+            checkpoint=checkpoint,
+            cache_dir=DEFAULT_CACHE,
+            variant=int(img_size),
+            verbose=verbose,
+        )
         model.setup_test(accelerator)
 
         batch = preprocess_images(
@@ -187,7 +188,7 @@ def run_dvlt(
         world_points = world_points[0]
 
     if filter_depth_edges:
-        conf = _filter_depth_conf_edges(depths, conf, rtol=depth_edge_rtol)
+        conf = filter_depth_conf_edges(depths, conf, rtol=depth_edge_rtol)
 
     extrinsic_w2c = c2w_to_w2c(extrinsic_c2w)
     images_tensor = batch[DataField.IMAGES]
@@ -219,6 +220,7 @@ def run_dvlt(
             "input_num_frames": input_num_frames,
             "max_frames_mode": max_frames_mode,
             "inference_device": str(device),
+            "cpu_quantize": cpu_quantize,
             "vram_gb": get_vram_gb(),
             "input_hw": [h, w],
             "conf_filter_mode": "percentile",
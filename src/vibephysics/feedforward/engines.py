@@ -0,0 +1,337 @@
+"""Feedforward engine registry: one ``EngineSpec`` per engine name.
+
+``reconstruct`` resolves the engine with a single :func:`get_engine` lookup and calls
+``spec.available()`` / ``spec.run(...)``; nothing in the core enumerates engines.
+Built-in engines are registered lazily (their packages import only when used).
+Third-party or test engines plug in with :func:`register_engine`, or from an installed
+package through the ``vibephysics.feedforward_engines`` entry-point group::
+
+    [project.entry-points."vibephysics.feedforward_engines"]
+    my_engine = "my_pkg.vibephysics_engine:SPEC"
+
+The entry point may name an ``EngineSpec`` instance or a zero-argument factory.
+Settings for plugin engines come from the engine's YAML section (``my_engine:``),
+merged over ``default_settings``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from .schema import FeedforwardPrediction
+    from .video_source import VideoFrameSource
+
+ENTRY_POINT_GROUP = "vibephysics.feedforward_engines"
+
+
+@runtime_checkable
+class EngineSpec(Protocol):
+    """What ``reconstruct`` needs from an engine."""
+
+    name: str
+    required_modules: tuple[str, ...]
+    default_settings: Mapping[str, Any]
+    install_hint: str
+    streams_frames: bool
+
+    def available(self) -> bool:
+        """True when the engine can run here (dependencies importable)."""
+
+    def run(
+        self,
+        image_path: Path,
+        settings: Mapping[str, Any],
+        *,
+        frame_source: VideoFrameSource | None = None,
+        verbose: bool = True,
+    ) -> FeedforwardPrediction:
+        """Run inference on the frames in ``image_path`` (or decoded from ``frame_source``)."""
+
+
+@dataclass(frozen=True)
+class ModuleEngine:
+    """
+    Engine implemented by a module exposing ``is_available()`` and a run function
+    taking ``image_path``, ``verbose`` and keyword settings.
+
+    ``settings_map`` maps run-function keywords to ``reconstruct()`` keywords, so the
+    flat ``reconstruct`` signature (``vggt_omega_resolution``, ...) feeds the engine.
+    ``uses_torch`` lets ``reconstruct`` size torch's CPU thread pools before the run.
+    ``takes_inference_lane`` engines get the shared batch / serve inference lane as an
+    ``inference_lane`` context factory and hold it only around model work, so their
+    frame decode overlaps other clips' inference.
+    ``input_size_settings`` names the run setting(s) holding the model input size: one
+    name for a square input, or ``(height, width)`` (see :func:`engine_input_size`).
+    """
+
+    name: str
+    module: str
+    run_function: str
+    install_hint: str
+    settings_map: Mapping[str, str] = field(default_factory=dict)
+    required_modules: tuple[str, ...] = ()
+    default_settings: Mapping[str, Any] = field(default_factory=dict)
+    streams_frames: bool = False
+    uses_torch: bool = True
+    takes_inference_lane: bool = False
+    input_size_settings: tuple[str, ...] = ()
+
+    def _module(self):
+        return importlib.import_module(self.module, package=__package__)
+
+    def available(self) -> bool:
+        if any(importlib.util.find_spec(name) is None for name in self.required_modules):
+            return False
+        check = getattr(self._module(), "is_available", None)
+        return bool(check()) if check is not None else True
+
+    def settings_from(self, reconstruct_kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        settings = dict(self.default_settings)
+        for setting, kwarg in self.settings_map.items():
+            if kwarg in reconstruct_kwargs:
+                settings[setting] = reconstruct_kwargs[kwarg]
+        return settings
+
+    def run(
+        self,
+        image_path: Path,
+        settings: Mapping[str, Any],
+        *,
+        frame_source: VideoFrameSource | None = None,
+        inference_lane: Callable[[], AbstractContextManager[None]] | None = None,
+        verbose: bool = True,
+    ) -> FeedforwardPrediction:
+        run_fn = getattr(self._module(), self.run_function)
+        kwargs = dict(settings)
+        if frame_source is not None:
+            kwargs["frame_source"] = frame_source
+        if inference_lane is not None:
+            kwargs["inference_lane"] = inference_lane
+        return run_fn(image_path=image_path, verbose=verbose, **kwargs)
+
+
+_AUTO_INSTALL_HINT = "pip install vibephysics (deps auto-install on first run{})"
+
+BUILTIN_ENGINES: dict[str, EngineSpec] = {
+    spec.name: spec
+    for spec in (
+        ModuleEngine(
+            name="lingbot_map",
+            module=".lingbot_map",
+            run_function="run_lingbot_map",
+            install_hint=_AUTO_INSTALL_HINT.format(""),
+            streams_frames=True,
+            takes_inference_lane=True,
+            input_size_settings=("image_size",),
+            settings_map={
+                "model_path": "lingbot_map_checkpoint",
+                "model_name": "lingbot_map_model",
+                "mode": "lingbot_map_mode",
+                "keyframe_interval": "keyframe_interval",
+                "max_streaming_keyframes": "lingbot_map_max_streaming_keyframes",
+                "window_size": "window_size",
+                "overlap_size": "overlap_size",
+                "overlap_keyframes": "overlap_keyframes",
+                "use_sdpa": "use_sdpa",
+                "image_size": "lingbot_map_image_size",
+                "preprocess_mode": "lingbot_map_preprocess_mode",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="vggt_omega",
+            module=".vggt_omega",
+            run_function="run_vggt_omega",
+            install_hint=_AUTO_INSTALL_HINT.format("; HF access required"),
+            input_size_settings=("image_resolution",),
+            settings_map={
+                "checkpoint": "vggt_omega_checkpoint",
+                "checkpoint_name": "vggt_omega_checkpoint_name",
+                "image_resolution": "vggt_omega_resolution",
+                "preprocess_mode": "vggt_omega_preprocess_mode",
+                "enable_alignment": "vggt_omega_enable_alignment",
+                "filter_depth_edges": "filter_edges",
+                "depth_edge_rtol": "vggt_omega_depth_edge_rtol",
+                "conf_percentile": "vggt_omega_conf_percentile",
+                "chunk_size": "vggt_omega_chunk_size",
+                "chunk_overlap": "vggt_omega_chunk_overlap",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="vgg_ttt",
+            module=".vgg_ttt",
+            run_function="run_vgg_ttt",
+            install_hint=_AUTO_INSTALL_HINT.format(""),
+            input_size_settings=("image_size",),
+            settings_map={
+                "model_id": "vgg_ttt_model_id",
+                "preprocess_mode": "vgg_ttt_preprocess_mode",
+                "image_size": "vgg_ttt_image_size",
+                "filter_depth_edges": "filter_edges",
+                "depth_edge_rtol": "vgg_ttt_depth_edge_rtol",
+                "conf_percentile": "vgg_ttt_conf_percentile",
+                "num_ttt_steps": "vgg_ttt_num_ttt_steps",
+                "memory_efficient_inference": "vgg_ttt_memory_efficient_inference",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="map_anything",
+            module=".map_anything",
+            run_function="run_map_anything",
+            install_hint=_AUTO_INSTALL_HINT.format(""),
+            input_size_settings=("resolution",),
+            settings_map={
+                "model_name": "map_anything_model",
+                "model_kwargs": "map_anything_model_kwargs",
+                "install_all_extras": "map_anything_install_all",
+                "resolution": "map_anything_resolution",
+                "norm_type": "map_anything_norm_type",
+                "patch_size": "map_anything_patch_size",
+                "resize_mode": "map_anything_resize_mode",
+                "size": "map_anything_size",
+                "window_size": "map_anything_window_size",
+                "window_stride": "map_anything_window_stride",
+                "anchor_frames": "map_anything_anchor_frames",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="r3",
+            module=".r3",
+            run_function="run_r3",
+            install_hint=_AUTO_INSTALL_HINT.format("; CUDA + xformers required"),
+            input_size_settings=("image_size",),
+            settings_map={
+                "checkpoint": "r3_checkpoint",
+                "model_name": "r3_model",
+                "config_name": "r3_config_name",
+                "mode": "r3_mode",
+                "image_size": "r3_image_size",
+                "kv_backend": "r3_kv_backend",
+                "rel_pose_method": "r3_rel_pose_method",
+                "metric_model_name": "r3_metric_model_name",
+                "checkpoint_every": "r3_checkpoint_every",
+                "resume": "r3_resume",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="dvlt",
+            module=".dvlt",
+            run_function="run_dvlt",
+            install_hint=_AUTO_INSTALL_HINT.format("; CUDA recommended"),
+            streams_frames=True,
+            input_size_settings=("img_size",),
+            settings_map={
+                "checkpoint": "dvlt_checkpoint",
+                "img_size": "dvlt_img_size",
+                "patch_size": "dvlt_patch_size",
+                "filter_depth_edges": "filter_edges",
+                "depth_edge_rtol": "dvlt_depth_edge_rtol",
+                "conf_percentile": "dvlt_conf_percentile",
+                "cpu_quantize": "cpu_quantize",
+            },
+        ),
+        ModuleEngine(
+            name="synthetic",
+            module=".synthetic",
+            run_function="run_synthetic",
+            install_hint="built in (no model or extra dependencies)",
+            streams_frames=True,
+            uses_torch=False,
+            input_size_settings=("height", "width"),
+            settings_map={
+                "height": "synthetic_height",
+                "width": "synthetic_width",
+                "latency_per_frame": "synthetic_latency_per_frame",
+                "num_boxes": "synthetic_num_boxes",
+                "seed": "synthetic_seed",
+                "depth_noise": "synthetic_depth_noise",
+                "scene_scale": "synthetic_scene_scale",
+            },
+        ),
+    )
+}
+
+_REGISTRY: dict[str, EngineSpec] = dict(BUILTIN_ENGINES)
+_entry_points_loaded = False
+
+
+def register_engine(spec: EngineSpec, *, replace: bool = False) -> EngineSpec:
+    """Add ``spec`` under ``spec.name``; built-in names are only replaced with ``replace=True``."""
+    if not isinstance(spec, EngineSpec):
+        raise TypeError(f"{spec!r} does not implement EngineSpec")
+    if spec.name in _REGISTRY and not replace:
+        raise ValueError(f"Feedforward engine '{spec.name}' is already registered")
+    _REGISTRY[spec.name] = spec
+    return spec
+
+
+def unregister_engine(name: str) -> None:
+    _REGISTRY.pop(name, None)
+
+
+def _load_entry_point_engines() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry in entry_points(group=ENTRY_POINT_GROUP):
+        if entry.name in _REGISTRY:
+            continue
+        try:
+            spec = entry.load()
+            if not isinstance(spec, EngineSpec) and callable(spec):
+                spec = spec()
+            register_engine(spec)
+        except Exception as exc:  # a broken plugin must not break the built-in engines
+            print(f"--- [vibephysics] Skipping feedforward engine plugin '{entry.name}': {exc} ---")
+
+
+def engine_names() -> tuple[str, ...]:
+    """Built-in engines first, then plugins in registration order."""
+    _load_entry_point_engines()
+    return tuple(_REGISTRY)
+
+
+def get_engine(name: str) -> EngineSpec:
+    spec = _REGISTRY.get(name)
+    if spec is None:
+        _load_entry_point_engines()
+        spec = _REGISTRY.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown engine '{name}'. Choose one of: {', '.join(engine_names())}")
+    return spec
+
+
+def is_builtin_engine(name: str) -> bool:
+    return name in BUILTIN_ENGINES
+
+
+def settings_for_engine(spec: EngineSpec, reconstruct_kwargs: Mapping[str, Any]) -> dict[str, Any]:
+    """Run-function settings: mapped ``reconstruct`` kwargs (built-ins) or ``engine_settings``."""
+    if isinstance(spec, ModuleEngine) and spec.settings_map:
+        return spec.settings_from(reconstruct_kwargs)
+    settings = dict(spec.default_settings)
+    settings.update(reconstruct_kwargs.get("engine_settings") or {})
+    return settings
+
+
+def engine_input_size(spec: EngineSpec, settings: Mapping[str, Any]) -> tuple[int, int] | None:
+    """Model input ``(height, width)`` from run ``settings``, or ``None`` when the engine does not say."""
+    names = tuple(getattr(spec, "input_size_settings", ()) or ())
+    values = [settings.get(name) for name in names[:2]]
+    if not values or not all(isinstance(v, int) and not isinstance(v, bool) and v > 0 for v in values):
+        return None
+    return (values[0], values[-1])
@@ -0,0 +1,306 @@
+"""Predict wall time and peak RSS of a reconstruct run from local run history.
+
+Each profiled ``reconstruct`` run appends its stage timings to the run history
+(``run_history.py``). This module fits, per engine and device, a linear cost model
+``seconds = a + b * megapixels`` for every stage (megapixels = frames x H x W / 1e6),
+and the same for run peak RSS, then applies it to a new input.
+
+Only runs that took the same path are fitted together: raw inference vs an
+inference-cache hit, and pipelined vs sequential per-frame postprocess, so stages of
+mutually exclusive paths are never summed into one wall time.
+
+Usage::
+
+    python -m vibephysics.feedforward.estimate clip.mov
+    python -m vibephysics.feedforward.estimate frames/ --engine vggt_omega --device cpu --json
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Stages that are not additive wall time (parallel CPU estimates, lane waits).
+_EXCLUDED_STAGE_SUFFIXES = ("(CPU est)",)
+_EXCLUDED_STAGES = frozenset({"inference_lane_wait"})
+# Per-window rows already counted in "inference".
+_EXCLUDED_STAGE_PREFIXES = ("inference[",)
+# A stage is part of the prediction when it ran in at least this share of matching runs.
+_STAGE_PRESENCE = 0.5
+# Only recorded by runs with ``output.pipelined_postprocess`` in effect.
+_PIPELINED_STAGE = "per_frame_3d_postprocess (pipelined)"
+
+
+@dataclass
+class LinearCost:
+    intercept: float
+    slope: float
+    samples: int
+
+    def predict(self, megapixels: float) -> float:
+        return max(self.intercept + self.slope * megapixels, 0.0)
+
+
+@dataclass
+class CostModel:
+    engine: str
+    device: str | None
+    runs: int
+    inference_cache_hit: bool = False
+    pipelined: bool = False
+    threads: int | None = None
+    stages: dict[str, LinearCost] = field(default_factory=dict)
+    peak_rss: LinearCost | None = None
+
+
+@dataclass
+class RunEstimate:
+    engine: str
+    device: str | None
+    num_frames: int
+    height: int
+    width: int
+    megapixels: float
+    runs: int
+    inference_cache_hit: bool
+    pipelined: bool
+    stages: dict[str, float]
+    wall_s: float
+    peak_rss_bytes: int | None
+
+
+def _megapixels(record: dict[str, Any]) -> float | None:
+    try:
+        return int(record["num_frames"]) * int(record["height"]) * int(record["width"]) / 1e6
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def run_path(record: dict[str, Any]) -> tuple[bool, bool]:
+    """``(inference_cache_hit, pipelined_postprocess)`` of a history record."""
+    return bool(record.get("inference_cache_hit")), _PIPELINED_STAGE in (record.get("stages") or {})
+
+
+def fit_linear(xs: list[float], ys: list[float]) -> LinearCost:
+    """Least-squares ``y = a + b x``; proportional through the origin when x does not vary."""
+    n = len(xs)
+    if n == 0:
+        return LinearCost(0.0, 0.0, 0)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if n < 2 or var_x <= 1e-12 * max(mean_x**2, 1.0):
+        slope = mean_y / mean_x if mean_x > 0 else 0.0
+        return LinearCost(0.0, slope, n)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+    if slope < 0.0:
+        # Noise on a flat stage: treat as constant cost.
+        return LinearCost(mean_y, 0.0, n)
+    return LinearCost(mean_y - slope * mean_x, slope, n)
+
+
+def _stage_counts(name: str) -> bool:
+    return (
+        name not in _EXCLUDED_STAGES
+        and not name.endswith(_EXCLUDED_STAGE_SUFFIXES)
+        and not name.startswith(_EXCLUDED_STAGE_PREFIXES)
+    )
+
+
+def fit_cost_model(
+    records: list[dict[str, Any]],
+    engine: str,
+    device: str | None = None,
+    *,
+    inference_cache_hit: bool = False,
+    pipelined: bool | None = None,
+    threads: int | None = None,
+) -> CostModel:
+    """
+    Fit per-stage costs from history runs of ``engine`` that took one path.
+
+    ``device`` and ``threads`` narrow the runs when any match. Runs must match
+    ``inference_cache_hit``; ``pipelined`` picks the postprocess mode (``None``: the
+    mode most of the remaining runs used).
+    """
+    matching = [record for record in records if record.get("engine") == engine]
+    for key, value in (("device", device), ("threads", threads)):
+        if value is not None:
+            same = [record for record in matching if record.get(key) == value]
+            if same:
+                matching = same
+    matching = [record for record in matching if _megapixels(record)]
+    matching = [record for record in matching if run_path(record)[0] == bool(inference_cache_hit)]
+    if pipelined is None:
+        modes = [run_path(record)[1] for record in matching]
+        pipelined = modes.count(True) > modes.count(False)
+    matching = [record for record in matching if run_path(record)[1] == pipelined]
+
+    model = CostModel(
+        engine=engine,
+        device=device,
+        runs=len(matching),
+        inference_cache_hit=bool(inference_cache_hit),
+        pipelined=bool(pipelined),
+        threads=threads,
+    )
+    if not matching:
+        return model
+
+    samples: dict[str, tuple[list[float], list[float]]] = {}
+    for record in matching:
+        megapixels = _megapixels(record)
+        for name, seconds in (record.get("stages") or {}).items():
+            if _stage_counts(name):
+                xs, ys = samples.setdefault(name, ([], []))
+                xs.append(megapixels)
+                ys.append(float(seconds))
+    for name, (xs, ys) in samples.items():
+        if len(xs) >= _STAGE_PRESENCE * len(matching):
+            model.stages[name] = fit_linear(xs, ys)
+
+    rss = [(_megapixels(record), float(record["peak_rss_bytes"])) for record in matching if record.get("peak_rss_bytes")]
+    if rss:
+        model.peak_rss = fit_linear([x for x, _ in rss], [y for _, y in rss])
+    return model
+
+
+def estimate_run(model: CostModel, num_frames: int, height: int, width: int) -> RunEstimate:
+    """Apply ``model`` to ``num_frames`` frames of ``height`` x ``width`` (as run history records them)."""
+    megapixels = num_frames * height * width / 1e6
+    stages = {name: cost.predict(megapixels) for name, cost in model.stages.items()}
+    return RunEstimate(
+        engine=model.engine,
+        device=model.device,
+        num_frames=num_frames,
+        height=int(height),
+        width=int(width),
+        megapixels=megapixels,
+        runs=model.runs,
+        inference_cache_hit=model.inference_cache_hit,
+        pipelined=model.pipelined,
+        stages=stages,
+        wall_s=sum(stages.values()),
+        peak_rss_bytes=int(model.peak_rss.predict(megapixels)) if model.peak_rss else None,
+    )
+
+
+def engine_frame_size(params: dict[str, Any], engine: str) -> tuple[int, int]:
+    """Model input ``(height, width)`` from parsed config params, read through the engine's settings."""
+    from .engines import get_engine, settings_for_engine
+    from .memory_plan import expected_frame_size
+
+    return expected_frame_size(engine, settings_for_engine(get_engine(engine), params))
+
+
+def print_estimate(estimate: RunEstimate) -> None:
+    from .reconstruct import _format_bytes, _format_seconds
+
+    device = estimate.device or "any device"
+    print(
+        f"\n--- [vibephysics] Estimate: {estimate.engine} on {device}, {estimate.num_frames} frames "
+        f"@ {estimate.height}x{estimate.width} ({estimate.megapixels:.1f} MP) from {estimate.runs} past runs ---"
+    )
+    if not estimate.stages:
+        print("No matching runs in history yet; run reconstruct on this engine first.")
+        return
+    width = max(len(name) for name in estimate.stages)
+    for name, seconds in estimate.stages.items():
+        print(f"{name:<{width}}  {_format_seconds(seconds):>8}")
+    print()
+    print(f"Predicted wall time: {_format_seconds(estimate.wall_s)}")
+    print(f"Predicted peak RSS:  {_format_bytes(estimate.peak_rss_bytes)}")
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    from .common import estimate_input_frame_count, preview_feedforward_input_plan
+    from .config import DEFAULT_FEEDFORWARD_CONFIG, FEEDFORWARD_ENGINES, load_yaml_config, parse_feedforward_config
+    from .run_history import load_run_history, run_history_path
+
+    parser = argparse.ArgumentParser(
+        description="Predict reconstruct wall time and peak RSS from local run history."
+    )
+    parser.add_argument("input", type=Path, help="Image folder, image, or video to estimate.")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=DEFAULT_FEEDFORWARD_CONFIG,
+        help=f"YAML config file (default: {DEFAULT_FEEDFORWARD_CONFIG.name})",
+    )
+    parser.add_argument(
+        "--engine",
+        default=None,
+        help=f"Override config engine: {', '.join(FEEDFORWARD_ENGINES)} or a registered plugin.",
+    )
+    parser.add_argument("--max_frames", "--max-frames", type=int, default=None, help="Override video.max_frames.")
+    parser.add_argument(
+        "--resolution",
+        type=int,
+        default=None,
+        help="Square model input size in pixels (default: the engine's configured height x width).",
+    )
+    parser.add_argument(
+        "--device",
+        choices=("cpu", "cuda"),
+        default=None,
+        help="Fit only runs on this device (default: all runs of the engine).",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=None,
+        help=f"Run history JSONL (default: {run_history_path()}).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the estimate as JSON.")
+    args = parser.parse_args()
+
+    try:
+        cfg = load_yaml_config(args.config)
+        cfg["image_path"] = str(args.input)
+        if args.engine:
+            cfg["engine"] = args.engine
+        params = parse_feedforward_config(cfg, config_path=args.config.resolve())
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(1)
+
+    engine = params["engine"]
+    max_frames = args.max_frames if args.max_frames is not None else params["max_frames"]
+    num_frames, _ = estimate_input_frame_count(
+        args.input,
+        max_frames=max_frames,
+        max_frames_mode=params["max_frames_mode"],
+        video_fps=params["video_fps"],
+    )
+    if num_frames is None:
+        print(f"[ERROR] Could not determine the frame count of {args.input}")
+        sys.exit(1)
+    height, width = (args.resolution, args.resolution) if args.resolution else engine_frame_size(params, engine)
+
+    model = fit_cost_model(load_run_history(args.history), engine, args.device)
+    estimate = estimate_run(model, num_frames, height, width)
+    if args.json:
+        print(json.dumps(asdict(estimate), indent=2))
+        return
+    print(
+        "--- [vibephysics] "
+        + preview_feedforward_input_plan(
+            engine,
+            args.input,
+            mode=params.get("lingbot_map_mode"),
+            max_frames=max_frames,
+            max_frames_mode=params["max_frames_mode"],
+            video_fps=params["video_fps"],
+        )
+        + " ---"
+    )
+    print_estimate(estimate)
+
+
+if __name__ == "__main__":
+    main()
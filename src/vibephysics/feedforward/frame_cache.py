@@ -0,0 +1,223 @@
+"""Shared, content-keyed cache of ffmpeg-extracted video frames.
+
+Entries live under ``feedforward_cache_root()/frames/<key>/`` where the key covers a
+video fingerprint (size, mtime and sampled content blocks — path independent) plus
+the extraction fps and JPEG quality. The per-video frame folder (``output/<stem>/``)
+is filled with hard links to the entry (copies across filesystems) and stamped with
+the key, so a changed video or changed ``video.fps`` / ``video.quality`` refreshes it
+instead of silently reusing stale frames, and the same clip under another path or
+project reuses one extraction.
+
+Least recently used entries are evicted once the cache exceeds ``video.frame_cache_gb``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable
+
+FRAME_CACHE_SCHEMA = 1
+FRAME_CACHE_STAMP_FILE = ".vibephysics_frame_cache"
+DEFAULT_FRAME_CACHE_GB = 20.0
+
+_ENTRY_FILE = "entry.json"
+_SAMPLE_BLOCKS = 16
+_SAMPLE_BLOCK_BYTES = 1 << 16
+
+
+def frame_cache_dir() -> Path:
+    """``.vibephysics/feedforward/frames/`` (honors ``VIBEPHYSICS_FEEDFORWARD_CACHE``)."""
+    from .common import feedforward_engine_dir
+
+    return feedforward_engine_dir("frames")
+
+
+def video_fingerprint(video_path: str | Path) -> str:
+    """Cheap content identity: size + mtime + evenly spaced 64 KiB blocks."""
+    video_path = Path(video_path)
+    stat = video_path.stat()
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    last = max(stat.st_size - _SAMPLE_BLOCK_BYTES, 0)
+    offsets = sorted({last * i // (_SAMPLE_BLOCKS - 1) for i in range(_SAMPLE_BLOCKS)})
+    with open(video_path, "rb") as handle:
+        for offset in offsets:
+            handle.seek(offset)
+            digest.update(handle.read(_SAMPLE_BLOCK_BYTES))
+    return digest.hexdigest()
+
+
+def frame_cache_key(video_path: str | Path, fps: float, quality: int) -> str:
+    payload = {
+        "schema": FRAME_CACHE_SCHEMA,
+        "video": video_fingerprint(video_path),
+        "fps": f"{float(fps):g}",
+        "quality": int(quality),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def read_frame_cache_stamp(frames_dir: Path) -> str | None:
+    path = Path(frames_dir) / FRAME_CACHE_STAMP_FILE
+    if not path.is_file():
+        return None
+    try:
+        return str(json.loads(path.read_text())["key"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _entry_files(entry_dir: Path) -> list[Path]:
+    return [path for path in entry_dir.iterdir() if path.is_file() and path.name != _ENTRY_FILE]
+
+
+def _lookup(key: str) -> Path | None:
+    entry_dir = frame_cache_dir() / key
+    marker = entry_dir / _ENTRY_FILE
+    if not marker.is_file():
+        return None
+    os.utime(marker)  # LRU clock
+    return entry_dir
+
+
+def _store(key: str, video_path: Path, extract: Callable[[Path], Path]) -> Path:
+    """Extract into a private temp dir, then publish it atomically as the entry."""
+    root = frame_cache_dir()
+    entry_dir = root / key
+    tmp_dir = root / f"{key}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    try:
+        extract(tmp_dir)
+        files = _entry_files(tmp_dir)
+        (tmp_dir / _ENTRY_FILE).write_text(
+            json.dumps(
+                {
+                    "schema": FRAME_CACHE_SCHEMA,
+                    "video": str(video_path),
+                    "num_frames": sum(1 for path in files if path.suffix.lower() == ".jpg"),
+                    "bytes": sum(path.stat().st_size for path in files),
+                    "created": time.time(),
+                },
+                indent=2,
+            )
+        )
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process published the same key first; keep theirs.
+            if not (entry_dir / _ENTRY_FILE).is_file():
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return entry_dir
+
+
+def _entry_bytes(entry_dir: Path) -> int:
+    try:
+        return int(json.loads((entry_dir / _ENTRY_FILE).read_text())["bytes"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return sum(path.stat().st_size for path in _entry_files(entry_dir))
+
+
+def evict_frame_cache(max_bytes: int, *, keep: str | None = None, verbose: bool = True) -> int:
+    """Delete least recently used entries until the cache fits ``max_bytes``; returns bytes freed."""
+    entries = []
+    for entry_dir in frame_cache_dir().iterdir():
+        marker = entry_dir / _ENTRY_FILE
+        if entry_dir.is_dir() and marker.is_file():
+            entries.append((marker.stat().st_mtime, entry_dir, _entry_bytes(entry_dir)))
+    total = sum(size for _, _, size in entries)
+    freed = 0
+    for _, entry_dir, size in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        if entry_dir.name == keep:
+            continue
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        freed += size
+    if freed and verbose:
+        from .reconstruct import _format_bytes
+
+        print(f"--- [vibephysics] Frame cache: evicted {_format_bytes(freed)} (LRU) ---")
+    return freed
+
+
+def _clear_frames_dir(frames_dir: Path) -> None:
+    from .common import IMAGE_EXTENSIONS, VIDEO_EXTRACT_FPS_FILE
+    from .reconstruct import EXTRACT_META_FILE
+
+    for path in frames_dir.iterdir():
+        if path.is_file() and (
+            path.suffix in IMAGE_EXTENSIONS
+            or path.name in (VIDEO_EXTRACT_FPS_FILE, EXTRACT_META_FILE, FRAME_CACHE_STAMP_FILE)
+        ):
+            path.unlink()
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def cached_video_frames(
+    video_path: Path,
+    frames_dir: Path,
+    *,
+    fps: float,
+    quality: int,
+    extract: Callable[[Path], Path],
+    max_gb: float | None = DEFAULT_FRAME_CACHE_GB,
+    verbose: bool = True,
+) -> Path:
+    """
+    Fill ``frames_dir`` with the frames of ``video_path`` at ``fps`` / ``quality``.
+
+    ``extract(output_dir)`` runs the actual extraction on a cache miss.
+    """
+    from .common import VIDEO_EXTRACT_FPS_FILE
+    from .reconstruct import _log_reusing_frames, existing_frames_in_dir
+
+    key = frame_cache_key(video_path, fps, quality)
+    frames_dir = Path(frames_dir).absolute()
+    existing = existing_frames_in_dir(frames_dir)
+    stamp = read_frame_cache_stamp(frames_dir) if frames_dir.is_dir() else None
+    if stamp == key and existing is not None:
+        _lookup(key)
+        if verbose:
+            print(f"--- [vibephysics] Using {len(existing)} cached frames in {frames_dir} ({key[:12]}) ---")
+        return frames_dir
+    if stamp is not None or (frames_dir / VIDEO_EXTRACT_FPS_FILE).is_file():
+        if verbose:
+            reason = "do not match" if stamp is not None else "cannot be validated against"
+            print(
+                f"--- [vibephysics] Frames in {frames_dir} {reason} {video_path.name} at "
+                f"{float(fps):g} fps / quality {quality}; refreshing ---"
+            )
+        _clear_frames_dir(frames_dir)
+    elif existing is not None:
+        # Frames placed there by hand: nothing to validate against, use as-is.
+        _log_reusing_frames(frames_dir, len(existing), float(fps), verbose)
+        return frames_dir
+
+    entry_dir = _lookup(key)
+    if entry_dir is None:
+        entry_dir = _store(key, video_path, extract)
+        if max_gb:
+            evict_frame_cache(int(float(max_gb) * 1024**3), keep=key, verbose=verbose)
+    elif verbose:
+        print(f"--- [vibephysics] Frame cache hit for {video_path.name} ({key[:12]}) ---")
+
+    frames_dir.mkdir(parents=True, exist_ok=True)
+    for source in _entry_files(entry_dir):
+        target = frames_dir / source.name
+        if target.exists():
+            target.unlink()
+        _link_or_copy(source, target)
+    (frames_dir / FRAME_CACHE_STAMP_FILE).write_text(json.dumps({"key": key, "video": str(video_path)}) + "\n")
+    return frames_dir
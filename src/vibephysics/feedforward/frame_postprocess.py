@@ -1,8 +1,13 @@
-"""Parallel per-frame 3D NMS (point cloud) and change-bbox detection."""
+"""Parallel per-frame 3D NMS (point cloud) and change-bbox detection.
+
+``FramePostprocessPipeline`` is the pipelined variant: once the engine returns, frames
+are filtered (confidence, subsample, 3D NMS) in the engine's world frame on background
+threads while ground align / Z-up run; the rigid transform those steps applied is then
+applied to the kept points in :meth:`FramePostprocessPipeline.finish`.
+"""
 
 from __future__ import annotations
 
-import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -19,11 +24,14 @@ from .algo_3d_bbox import (
     prepare_bbox_reference,
 )
 from .common import (
+    available_cpus,
     collect_single_frame_point_chunk,
     collect_single_frame_world_points,
     filter_points_3d_nms,
     is_blender_z_up,
     opencv_to_blender_points,
+    point_chunk_from_frame_arrays,
+    resolve_frame_images,
 )
 from .schema import FeedforwardPrediction
 
@@ -64,8 +72,7 @@ class _FrameWorkResult:
 
 
 def _default_max_workers(num_frames: int) -> int:
-    cpus = os.cpu_count() or 4
-    return max(1, min(int(num_frames), int(cpus)))
+    return max(1, min(int(num_frames), available_cpus()))
 
 
 def _frame_points_for_bbox(
@@ -526,3 +533,132 @@ def run_per_frame_postprocess(
         frame_id_chunks=frame_id_chunks,
         timings=timings,
     )
+
+
+class FramePostprocessPipeline:
+    """
+    Background confidence filter / subsample / 3D NMS fed one frame at a time.
+
+    All per-frame steps are invariant to a rigid world transform, so frames can be
+    processed in the engine's (OpenCV) world while ground align and Z-up conversion
+    still run. Pass the rotation / translation those steps applied to :meth:`finish`
+    to map kept points into the saved frame. Per-frame bbox work is not pipelined
+    (voxel grids are axis-aligned), so ``reconstruct`` skips the pipeline with
+    ``algo_3d_bbox``.
+
+    Use it as a context manager: leaving the block on an error cancels queued frames
+    and shuts the worker pool down (a no-op after :meth:`finish`).
+    """
+
+    def __init__(
+        self,
+        *,
+        min_confidence: float,
+        point_cloud_3d_nms: bool,
+        point_cloud_3d_nms_radius: float,
+        point_cloud_3d_nms_min_neighbors: int,
+        random_points_per_frame: int | float | None,
+        num_frames: int,
+        max_workers: int | None = None,
+    ) -> None:
+        self._chunk_kwargs = {
+            "min_confidence": min_confidence,
+            "point_cloud_3d_nms": point_cloud_3d_nms,
+            "point_cloud_3d_nms_radius": point_cloud_3d_nms_radius,
+            "point_cloud_3d_nms_min_neighbors": point_cloud_3d_nms_min_neighbors,
+            "random_points_per_frame": random_points_per_frame,
+        }
+        self._workers = max_workers if max_workers is not None else _default_max_workers(num_frames)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers,
+            thread_name_prefix="vibephysics-frame-post",
+        )
+        self._futures: dict[int, object] = {}
+        self._started_at = time.perf_counter()
+
+    def __enter__(self) -> "FramePostprocessPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.cancel()
+
+    def _process(self, frame_idx: int, world_points, image, conf) -> tuple[tuple | None, float]:
+        t0 = time.perf_counter()
+        chunk = point_chunk_from_frame_arrays(
+            world_points,
+            image,
+            conf,
+            frame_idx,
+            rng_seed=frame_idx,
+            **self._chunk_kwargs,
+        )
+        return chunk, time.perf_counter() - t0
+
+    def submit(self, frame_idx: int, world_points: np.ndarray, image: np.ndarray, conf: np.ndarray) -> None:
+        """Queue one finished frame (arrays must not be mutated in place afterwards)."""
+        self._futures[int(frame_idx)] = self._pool.submit(
+            self._process, int(frame_idx), world_points, image, conf
+        )
+
+    def submit_prediction(self, prediction: FeedforwardPrediction) -> None:
+        try:
+            images = resolve_frame_images(prediction.to_viz_dict())
+            for frame_idx in range(int(prediction.world_points.shape[0])):
+                self.submit(
+                    frame_idx,
+                    prediction.world_points[frame_idx],
+                    images[frame_idx],
+                    prediction.conf[frame_idx],
+                )
+        except BaseException:
+            self.cancel()
+            raise
+
+    def cancel(self) -> None:
+        """Drop frames not yet started and wait for running ones; safe to call repeatedly."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def finish(
+        self,
+        rotation: np.ndarray | None = None,
+        translation: np.ndarray | None = None,
+        *,
+        with_frame_ids: bool = True,
+    ) -> PerFramePostprocessResult:
+        """
+        Collect filtered chunks and map them into the saved world (``p' = R @ p + t``).
+
+        ``rotation`` / ``translation`` are what was applied to the prediction after
+        :meth:`submit_prediction` (identity / zero when omitted).
+        """
+        rotation = np.eye(3, dtype=np.float32) if rotation is None else np.asarray(rotation, dtype=np.float32)
+        translation = np.zeros(3, dtype=np.float32) if translation is None else np.asarray(translation, dtype=np.float32)
+
+        timings = PerFramePostprocessTimings()
+        result = PerFramePostprocessResult(bboxes=None, timings=timings)
+        for frame_idx in sorted(self._futures):
+            chunk, elapsed_s = self._futures[frame_idx].result()
+            timings.nms_cpu_s += elapsed_s
+            if chunk is None:
+                continue
+            pts, rgb, conf, removed = chunk
+            timings.nms_removed_total += removed
+            if len(pts) == 0:
+                continue
+            result.point_chunks.append((pts @ rotation.T + translation).astype(np.float32))
+            result.color_chunks.append(rgb)
+            result.conf_chunks.append(conf)
+            if with_frame_ids:
+                result.frame_id_chunks.append(np.full(len(pts), frame_idx, dtype=np.int32))
+        self._pool.shutdown(wait=True)
+        timings.wall_s = time.perf_counter() - self._started_at
+
+        if self._chunk_kwargs["point_cloud_3d_nms"] and timings.nms_removed_total > 0:
+            print(
+                f"[vibephysics] 3D NMS: removed {timings.nms_removed_total:,} isolated points "
+                f"(radius={float(self._chunk_kwargs['point_cloud_3d_nms_radius']):g} m, "
+                f"min_neighbors={int(self._chunk_kwargs['point_cloud_3d_nms_min_neighbors'])}, "
+                f"{self._workers} frame workers, pipelined)",
+                flush=True,
+            )
+        return result
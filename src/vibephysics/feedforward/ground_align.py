@@ -748,7 +748,8 @@ def _warn_spread_frame_sampling(predictions: dict | FeedforwardPrediction) -> No
         meta = predictions.metadata
     else:
         meta = predictions.get("metadata") or {}
-    if str(meta.get("max_frames_mode", "")).lower() != "spread":
+    mode = str(meta.get("max_frames_mode", "")).lower()
+    if mode not in ("spread", "adaptive"):
         return
     indices = meta.get("selected_indices")
     if not indices or len(indices) < 2:
@@ -756,7 +757,7 @@ def _warn_spread_frame_sampling(predictions: dict | FeedforwardPrediction) -> No
     span = int(max(indices) - min(indices))
     if span > len(indices) * 3:
         print(
-            "[vibephysics] Ground align warning: max_frames_mode=spread samples distant "
+            f"[vibephysics] Ground align warning: max_frames_mode={mode} samples distant "
             "poses; floor fit may look tilted in one view. Prefer max_frames_mode: first."
         )
 
@@ -1096,21 +1097,21 @@ def _store_floor_cluster_metadata(
         prediction.metadata["ground_align_floor_heights"] = [float(h) for h, _ in clusters]
 
 
-def align_prediction_ground(prediction: FeedforwardPrediction) -> bool:
+def align_prediction_ground(prediction: FeedforwardPrediction) -> np.ndarray | None:
     """
     Level mean floor tilt to horizontal in canonical OpenCV world coords (bumpy depth OK).
 
     Single entry point for all engines. Mutates ``world_points`` and ``extrinsic``
-    in place. Returns True when applied.
+    in place. Returns the applied world rotation (``p' = R @ p``), or None when skipped.
     """
     if prediction.metadata.get("ground_align_applied"):
-        return False
+        return None
 
     rotation, align_points, floor_clusters = _estimate_ground_rotation_matrix_opencv(prediction)
     if rotation is None or align_points is None:
         _record_ground_align_metadata(prediction, status="skipped_no_fit")
         print("[vibephysics] Ground align skipped: could not estimate floor tilt from low points.")
-        return False
+        return None
 
     tilt_before, _, _ = _residual_floor_slopes(np.eye(3), align_points)
     ok, tilt, slope_x, slope_y = _is_acceptable_ground_rotation(rotation, align_points)
@@ -1131,7 +1132,7 @@ def align_prediction_ground(prediction: FeedforwardPrediction) -> bool:
             f"euler=({math.degrees(euler[0]):.1f}°, {math.degrees(euler[1]):.1f}°, "
             f"{math.degrees(euler[2]):.1f}°)) — need ≥ {_MIN_TILT_IMPROVEMENT_DEG:g}° improvement."
         )
-        return False
+        return None
 
     euler_deg = tuple(math.degrees(a) for a in _matrix_to_euler_xyz(rotation))
     apply_world_rotation_to_prediction(prediction, rotation, euler_deg=euler_deg)
@@ -1150,7 +1151,7 @@ def align_prediction_ground(prediction: FeedforwardPrediction) -> bool:
         f"(dz/dx={slope_x:.4f}, dz/dy={slope_y:.4f})",
         flush=True,
     )
-    return True
+    return np.asarray(rotation, dtype=np.float64)
 
 
 def finalize_ground_align_z_shift(prediction: FeedforwardPrediction) -> float:
@@ -0,0 +1,177 @@
+"""On-disk cache of raw engine predictions (before pose / ground / Z-up post-processing).
+
+Re-running ``reconstruct`` to tune ``min_confidence``, NMS, ground alignment, or bbox
+parameters should not pay for model inference again. Entries are keyed by engine,
+engine settings (checkpoint, preprocess mode, frame limits, ...) and the content
+hashes of every input frame, so edited or re-extracted frames miss the cache.
+
+Entries hold only numeric and string arrays (metadata as JSON), so they load with
+``allow_pickle=False``. Least recently used entries are evicted past
+``VIBEPHYSICS_INFERENCE_CACHE_GB`` (default 20).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .schema import FeedforwardPrediction
+
+INFERENCE_CACHE_SCHEMA = 2
+DEFAULT_INFERENCE_CACHE_GB = 20.0
+_HASH_CHUNK_BYTES = 1 << 20
+_ARRAY_FIELDS = ("depth", "conf", "extrinsic", "intrinsic", "world_points", "images")
+# Engine settings that change how a run proceeds, not what it predicts.
+_RUN_CONTROL_SETTINGS = frozenset({"resume"})
+
+
+def inference_cache_dir() -> Path:
+    """``.vibephysics/feedforward/inference/`` (honors ``VIBEPHYSICS_FEEDFORWARD_CACHE``)."""
+    from .common import feedforward_engine_dir
+
+    return feedforward_engine_dir("inference")
+
+
+def _max_cache_bytes() -> int:
+    try:
+        gb = float(os.environ.get("VIBEPHYSICS_INFERENCE_CACHE_GB", DEFAULT_INFERENCE_CACHE_GB))
+    except ValueError:
+        gb = DEFAULT_INFERENCE_CACHE_GB
+    return int(gb * 1024**3)
+
+
+def file_content_hash(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def inference_cache_key(
+    engine: str,
+    settings: dict,
+    image_paths: list[Path],
+    *,
+    frame_keys: list[str] | None = None,
+) -> str:
+    """
+    Stable key from engine, engine kwargs and ordered frame content hashes.
+
+    ``frame_keys`` replaces per-file hashing for frames that only exist in memory
+    (streamed video: video fingerprint + sampling + frame index).
+    """
+    payload = {
+        "schema": INFERENCE_CACHE_SCHEMA,
+        "engine": engine,
+        "settings": {key: value for key, value in settings.items() if key not in _RUN_CONTROL_SETTINGS},
+        "frames": frame_keys if frame_keys is not None else [file_content_hash(path) for path in image_paths],
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return inference_cache_dir() / f"{key}.npz"
+
+
+def evict_inference_cache(max_bytes: int | None = None, *, keep: str | None = None) -> int:
+    """Delete least recently used entries (never ``keep``) until the cache fits ``max_bytes``; returns bytes freed."""
+    max_bytes = _max_cache_bytes() if max_bytes is None else int(max_bytes)
+    keep_path = _entry_path(keep) if keep is not None else None
+    entries = []
+    for path in inference_cache_dir().glob("*.npz"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        if path == keep_path:
+            continue
+        path.unlink(missing_ok=True)
+        freed += size
+    return freed
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def save_cached_prediction(
+    key: str,
+    prediction: FeedforwardPrediction,
+    image_paths: list[Path],
+) -> Path:
+    """
+    Store ``prediction`` exactly as the engine returned it (float32, uncompressed).
+
+    ``image_paths`` are stored as indices into the discovered input frames so a hit
+    stays valid when the same frames are re-extracted to another directory.
+    """
+    index_of = {str(Path(path).resolve()): idx for idx, path in enumerate(image_paths)}
+    frame_indices = [index_of.get(str(Path(path).resolve()), -1) for path in prediction.image_paths]
+    payload = {
+        name: getattr(prediction, name)
+        for name in _ARRAY_FIELDS
+        if getattr(prediction, name) is not None
+    }
+    payload["image_paths"] = np.array([str(path) for path in prediction.image_paths], dtype=str)
+    payload["frame_indices"] = np.asarray(frame_indices, dtype=np.int64)
+    payload["engine"] = np.array(str(prediction.engine))
+    payload["metadata"] = np.array(json.dumps(dict(prediction.metadata), default=_json_default))
+
+    path = _entry_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            np.savez(handle, **payload)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    evict_inference_cache(keep=key)
+    return path
+
+
+def load_cached_prediction(key: str, image_paths: list[Path]) -> FeedforwardPrediction | None:
+    """Return the cached raw prediction for ``key``, or None on a miss / unreadable entry."""
+    path = _entry_path(key)
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            payload = {name: data[name] for name in data.files}
+        metadata = json.loads(str(payload["metadata"]))
+    except (OSError, ValueError, KeyError):
+        return None
+    os.utime(path)  # LRU clock
+
+    cached_paths = [str(p) for p in payload["image_paths"].tolist()]
+    frame_indices = payload["frame_indices"].tolist()
+    resolved_paths = [
+        str(image_paths[idx]) if 0 <= idx < len(image_paths) else cached
+        for idx, cached in zip(frame_indices, cached_paths)
+    ]
+    return FeedforwardPrediction(
+        depth=payload["depth"],
+        conf=payload["conf"],
+        extrinsic=payload["extrinsic"],
+        intrinsic=payload["intrinsic"],
+        world_points=payload["world_points"],
+        image_paths=resolved_paths,
+        engine=str(payload["engine"]),
+        images=payload.get("images"),
+        metadata=metadata,
+    )
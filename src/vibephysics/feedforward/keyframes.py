@@ -0,0 +1,233 @@
+"""Content-adaptive frame selection (``video.max_frames_mode: adaptive``), CPU only.
+
+Every input frame is reduced to a small grayscale thumbnail and scored with:
+
+* motion — global displacement to the previous frame (phase correlation, as a
+  fraction of the thumbnail width) plus the mean absolute difference left after
+  undoing that shift (parallax, rotation, moving objects);
+* sharpness — variance of the Laplacian; frames below ``blur_reject`` x the median
+  are treated as motion-blurred and never picked.
+
+Frames are then placed evenly along the cumulative motion curve (``max_frames``
+target) or whenever the motion since the last pick reaches ``motion_threshold``, so
+static stretches get few frames and fast pans get many. The chosen source indices end
+up in ``metadata["selected_indices"]``, which keeps ``video_fps`` animation timing right.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .video_source import VideoFrameSource
+
+THUMBNAIL_WIDTH = 96
+DEFAULT_BLUR_REJECT = 0.5
+# Every step counts as at least this share of the mean motion, so a fully static
+# clip still degrades to an even spread instead of piling frames on one spot.
+_MOTION_FLOOR = 0.05
+
+
+@dataclass
+class KeyframeSelection:
+    indices: list[int]
+    motion: np.ndarray
+    sharpness: np.ndarray
+    rejected: list[int]
+    max_frames: int | None
+    motion_threshold: float | None
+    blur_reject: float
+
+    def to_metadata(self) -> dict[str, Any]:
+        return {
+            "mode": "adaptive",
+            "max_frames": self.max_frames,
+            "motion_threshold": self.motion_threshold,
+            "blur_reject": self.blur_reject,
+            "blur_rejected": len(self.rejected),
+            "total_motion": float(self.motion.sum()),
+        }
+
+
+def _thumbnail(image, width: int, height: int) -> np.ndarray:
+    from PIL import Image
+
+    return np.asarray(image.convert("L").resize((width, height), Image.BILINEAR), dtype=np.float32) / 255.0
+
+
+def _thumbnail_size(first_size: tuple[int, int], width: int) -> tuple[int, int]:
+    src_w, src_h = first_size
+    return width, max(8, round(width * src_h / max(src_w, 1)))
+
+
+def load_thumbnails(image_paths: list[Path], *, width: int = THUMBNAIL_WIDTH) -> list[np.ndarray]:
+    """Grayscale float32 thumbnails (JPEGs decoded at reduced scale), in input order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from PIL import Image
+
+    if not image_paths:
+        return []
+    with Image.open(image_paths[0]) as first:
+        size = _thumbnail_size(first.size, width)
+
+    def load(path: Path) -> np.ndarray:
+        with Image.open(path) as image:
+            image.draft("L", (size[0] * 2, size[1] * 2))
+            return _thumbnail(image, *size)
+
+    # PIL releases the GIL while decoding.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        return list(pool.map(load, image_paths))
+
+
+def thumbnails_from_source(frame_source: VideoFrameSource, *, width: int = THUMBNAIL_WIDTH) -> list[np.ndarray]:
+    from PIL import Image
+
+    thumbnails: list[np.ndarray] = []
+    size: tuple[int, int] | None = None
+    for _, rgb in frame_source.iter_frames():
+        if size is None:
+            size = _thumbnail_size((rgb.shape[1], rgb.shape[0]), width)
+        thumbnails.append(_thumbnail(Image.fromarray(rgb), *size))
+    return thumbnails
+
+
+def _phase_shift(reference: np.ndarray, moved: np.ndarray, window: np.ndarray) -> tuple[int, int]:
+    """Integer (dy, dx) that best maps ``moved`` back onto ``reference``."""
+    cross = np.fft.rfft2(reference * window) * np.conj(np.fft.rfft2(moved * window))
+    cross /= np.abs(cross) + 1e-9
+    corr = np.fft.irfft2(cross, s=reference.shape)
+    peak = np.unravel_index(int(np.argmax(corr)), corr.shape)
+    return tuple(int(p) if p <= n // 2 else int(p) - n for p, n in zip(peak, reference.shape))
+
+
+def motion_scores(thumbnails: list[np.ndarray]) -> np.ndarray:
+    """Motion from each frame's predecessor (0 for the first frame)."""
+    scores = np.zeros(len(thumbnails), dtype=np.float64)
+    if len(thumbnails) < 2:
+        return scores
+    height, width = thumbnails[0].shape
+    window = np.outer(np.hanning(height), np.hanning(width)).astype(np.float32)
+    for i in range(1, len(thumbnails)):
+        previous, current = thumbnails[i - 1], thumbnails[i]
+        dy, dx = _phase_shift(previous, current, window)
+        aligned = np.roll(current, (dy, dx), axis=(0, 1))
+        # Compare only the overlap that the roll did not wrap around.
+        ys = slice(max(dy, 0), height + min(dy, 0))
+        xs = slice(max(dx, 0), width + min(dx, 0))
+        residual = float(np.abs(aligned[ys, xs] - previous[ys, xs]).mean()) if aligned[ys, xs].size else 1.0
+        scores[i] = np.hypot(dy, dx) / width + residual
+    return scores
+
+
+def _laplacian(image: np.ndarray) -> np.ndarray:
+    # 5-point stencil with mirrored edges (same values as scipy.ndimage.laplace).
+    padded = np.pad(image, 1, mode="symmetric")
+    center = padded[1:-1, 1:-1]
+    return padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:] - 4 * center
+
+
+def sharpness_scores(thumbnails: list[np.ndarray]) -> np.ndarray:
+    return np.array([float(_laplacian(thumb).var()) for thumb in thumbnails], dtype=np.float64)
+
+
+def _spread_on_curve(cumulative: np.ndarray, candidates: np.ndarray, count: int) -> list[int]:
+    """``count`` candidates closest to evenly spaced points of the cumulative curve."""
+    targets = np.linspace(cumulative[candidates[0]], cumulative[candidates[-1]], count)
+    positions = cumulative[candidates]
+    chosen = {int(candidates[np.argmin(np.abs(positions - target))]) for target in targets}
+    remaining = [int(c) for c in candidates if int(c) not in chosen]
+    # Collisions on flat stretches: fill with the candidates farthest from any pick.
+    while len(chosen) < count and remaining:
+        picked = np.array(sorted(chosen))
+        gaps = [np.abs(cumulative[picked] - cumulative[c]).min() for c in remaining]
+        chosen.add(remaining.pop(int(np.argmax(gaps))))
+    return sorted(chosen)
+
+
+def select_adaptive_indices(
+    motion: np.ndarray,
+    sharpness: np.ndarray,
+    *,
+    max_frames: int | None = None,
+    motion_threshold: float | None = None,
+    blur_reject: float = DEFAULT_BLUR_REJECT,
+) -> tuple[list[int], list[int]]:
+    """
+    Returns (selected indices, blur-rejected indices).
+
+    ``motion_threshold`` picks a frame whenever the accumulated motion reaches it
+    (capped to ``max_frames`` by re-spreading); otherwise ``max_frames`` frames are
+    spread evenly over the cumulative motion.
+    """
+    total = len(motion)
+    if total == 0:
+        return [], []
+    keep = np.ones(total, dtype=bool)
+    if blur_reject > 0 and total > 1:
+        keep = np.asarray(sharpness) >= blur_reject * float(np.median(sharpness))
+        if not keep.any():
+            keep[:] = True
+    rejected = np.flatnonzero(~keep).tolist()
+    candidates = np.flatnonzero(keep)
+
+    floor = _MOTION_FLOOR * (float(motion[1:].mean()) if total > 1 else 0.0)
+    steps = np.maximum(motion, floor)
+    steps[0] = 0.0
+    cumulative = np.cumsum(steps)
+
+    if motion_threshold is not None and motion_threshold > 0:
+        selected = [int(candidates[0])]
+        for index in candidates[1:]:
+            if cumulative[index] - cumulative[selected[-1]] >= motion_threshold:
+                selected.append(int(index))
+        if max_frames is None or len(selected) <= max_frames:
+            return selected, rejected
+    count = len(candidates) if max_frames is None else min(int(max_frames), len(candidates))
+    if count >= len(candidates):
+        return [int(c) for c in candidates], rejected
+    return _spread_on_curve(cumulative, candidates, count), rejected
+
+
+def select_keyframes(
+    image_paths: list[Path],
+    *,
+    frame_source: VideoFrameSource | None = None,
+    max_frames: int | None = None,
+    motion_threshold: float | None = None,
+    blur_reject: float = DEFAULT_BLUR_REJECT,
+    verbose: bool = True,
+) -> KeyframeSelection:
+    """Score all input frames (decoded from ``frame_source`` when streaming) and pick keyframes."""
+    if max_frames is None and not motion_threshold:
+        raise ValueError("max_frames_mode 'adaptive' needs video.max_frames or video.adaptive_motion_threshold")
+    thumbnails = thumbnails_from_source(frame_source) if frame_source is not None else load_thumbnails(image_paths)
+    motion = motion_scores(thumbnails)
+    sharpness = sharpness_scores(thumbnails)
+    indices, rejected = select_adaptive_indices(
+        motion,
+        sharpness,
+        max_frames=max_frames,
+        motion_threshold=motion_threshold,
+        blur_reject=blur_reject,
+    )
+    if verbose:
+        print(
+            f"--- [vibephysics] Adaptive keyframes: {len(indices)}/{len(thumbnails)} frames "
+            f"({len(rejected)} rejected as blurred) ---",
+            flush=True,
+        )
+    return KeyframeSelection(
+        indices=indices,
+        motion=motion,
+        sharpness=sharpness,
+        rejected=rejected,
+        max_frames=max_frames,
+        motion_threshold=motion_threshold,
+        blur_reject=float(blur_reject),
+    )
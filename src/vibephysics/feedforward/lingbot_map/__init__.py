@@ -3,27 +3,41 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import importlib.util
+import io
+import queue
 import subprocess
 import sys
-from collections.abc import Iterator
+import threading
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import torch
+
 from ..common import (
     DEFAULT_LINGBOT_MAP_MODEL,
     c2w_to_w2c,
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
     get_vram_gb,
     images_chw_to_hwc,
     limit_image_frames,
+    pooled_model,
+    resolve_cpu_quantize,
     resolve_torch_device,
     to_numpy,
 )
 from ..schema import FeedforwardPrediction
+from ..video_source import VideoFrameSource
+from ..weights import load_checkpoint_state_dict, load_state_dict_into
 
 DEFAULT_CACHE = feedforward_engine_dir("lingbot_map")
 
@@ -38,6 +52,10 @@ _LINGBOT_MAP_TQDM_MODULES = (
     "lingbot_map.models.gct_stream_window_v2",
 )
 
+# Per-thread progress callbacks fed from LingBot's tqdm bars: (desc, n, total).
+ProgressCallback = Callable[[str, int, "int | None"], None]
+_PROGRESS_LISTENERS: dict[int, ProgressCallback] = {}
+
 _BATCHED_NDIMS = {
     "pose_enc": 3,
     "depth": 5,
@@ -198,8 +216,6 @@ def _suppress_lingbot_pretrained_print() -> Iterator[None]:
 
 def _load_model(args, device):
     """Load GCTStream from checkpoint (mirrors upstream demo.py)."""
-    import torch
-
     _apply_lingbot_pretrained_patch()
 
     if getattr(args, "mode", "streaming") == "windowed":
@@ -207,34 +223,50 @@ def _load_model(args, device):
     else:
         from lingbot_map.models.gct_stream import GCTStream
 
-    print("Building model...")
-    with _suppress_lingbot_pretrained_print():
-        model = GCTStream(
-            img_size=args.image_size,
-            patch_size=args.patch_size,
-            enable_3d_rope=args.enable_3d_rope,
-            max_frame_num=args.max_frame_num,
-            kv_cache_sliding_window=args.kv_cache_sliding_window,
-            kv_cache_scale_frames=args.num_scale_frames,
-            kv_cache_cross_frame_special=True,
-            kv_cache_include_scale_frames=True,
-            use_sdpa=args.use_sdpa,
-            camera_num_iterations=args.camera_num_iterations,
-            pretrained_path=None,
-        )
+    def build():
+        print("Building model...")
+        with _suppress_lingbot_pretrained_print():
+            return GCTStream(
+                img_size=args.image_size,
+                patch_size=args.patch_size,
+                enable_3d_rope=args.enable_3d_rope,
+                max_frame_num=args.max_frame_num,
+                kv_cache_sliding_window=args.kv_cache_sliding_window,
+                kv_cache_scale_frames=args.num_scale_frames,
+                kv_cache_cross_frame_special=True,
+                kv_cache_include_scale_frames=True,
+                use_sdpa=args.use_sdpa,
+                camera_num_iterations=args.camera_num_iterations,
+                pretrained_path=None,
+            )
 
-    if args.model_path:
+    def load_weights(model):
         print(f"Loading checkpoint: {args.model_path}")
-        ckpt = torch.load(args.model_path, map_location=device, weights_only=False)
-        state_dict = ckpt.get("model", ckpt)
-        missing, unexpected = model.load_state_dict(state_dict, strict=False)
+        state_dict = load_checkpoint_state_dict(args.model_path, device=str(device), keys=("model",))
+        missing, unexpected = load_state_dict_into(model, state_dict, strict=False)
         if missing:
             print(f"  Missing keys: {len(missing)}")
         if unexpected:
             print(f"  Unexpected keys: {len(unexpected)}")
         print("  Checkpoint loaded.")
-        del state_dict, ckpt
-
+        del state_dict
+
+    model = cpu_quantized_model(
+        build,
+        load_weights=load_weights if args.model_path else None,
+        cpu_quantize=getattr(args, "cpu_quantize", None),
+        checkpoint=args.model_path or None,
+        cache_dir=Path(args.model_path).parent if args.model_path else None,
+        variant=(
+            args.mode,
+            args.image_size,
+            args.patch_size,
+            args.num_scale_frames,
+            args.use_sdpa,
+            args.camera_num_iterations,
+        ),
+        verbose=False,
+    )
     return model.to(device).eval()
 
 
@@ -306,56 +338,101 @@ def _prepare_for_visualization(predictions, images=None):
 LINGBOT_PREPROCESS_MODES = ("crop", "pad", "center_square")
 
 
+def _center_square_array(source, *, target: int, patch_size: int) -> np.ndarray:
+    """One frame (path or RGB uint8 array) as a ``target`` x ``target`` x 3 uint8 array."""
+    from PIL import Image, ImageOps
+
+    if isinstance(source, np.ndarray):
+        img = Image.fromarray(source)
+    else:
+        img = Image.open(source)
+        img = ImageOps.exif_transpose(img)
+        if img.mode == "RGBA":
+            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img)
+        img = img.convert("RGB")
+
+    width, height = img.size
+    if width >= height:
+        new_height = target
+        new_width = round(width * (target / height) / patch_size) * patch_size
+    else:
+        new_width = target
+        new_height = round(height * (target / width) / patch_size) * patch_size
+
+    img = img.resize((new_width, new_height), Image.Resampling.BICUBIC)
+    left = (new_width - target) // 2
+    top = (new_height - target) // 2
+    return np.asarray(img.crop((left, top, left + target, top + target)), dtype=np.uint8)
+
+
 def _load_center_square_images(
     image_path_list: list[str],
     *,
     image_size: int = 518,
     patch_size: int = 14,
+    frames: list[np.ndarray] | None = None,
+    frame_keys: list[str] | None = None,
+    read_frames: Callable[[list[int]], list[np.ndarray]] | None = None,
+    out: "torch.Tensor | None" = None,
+    pin_memory: bool = False,
 ) -> "torch.Tensor":
     """
     Scale the short side to ``image_size``, then center-crop a square.
 
     For 1920x1080 this yields ~924x518, then a center 518x518 crop (less peripheral
     clutter than LingBot's default ``crop`` mode, which keeps the full 16:9 frame).
+    ``frames`` (RGB uint8, e.g. streamed video) replaces reading ``image_path_list``;
+    ``read_frames`` decodes only the given positions, on preprocess-cache misses.
+    Frames go through the shared preprocess cache keyed by ``frame_keys`` (file
+    content hashes by default); uncached frames are decoded in parallel.
+
+    Each worker writes its normalized crop straight into its slice of one (S, 3, H, W)
+    float32 batch: ``out`` when given, else a new tensor (page-locked with ``pin_memory``
+    for fast host-to-device copies). No per-frame tensors or stacked copy are made.
     """
-    if not image_path_list:
+    if not image_path_list and not frames and read_frames is None:
         raise ValueError("At least 1 image is required")
 
-    from PIL import Image, ImageOps
-    from torchvision import transforms as TF
+    import torch
 
-    to_tensor = TF.ToTensor()
-    images = []
-    target = int(image_size)
+    from ..preprocess_cache import fill_preprocessed_frames, frame_file_hashes
 
-    for image_path in image_path_list:
-        img = Image.open(image_path)
-        img = ImageOps.exif_transpose(img)
-        if img.mode == "RGBA":
-            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
-            img = Image.alpha_composite(background, img)
-        img = img.convert("RGB")
-
-        width, height = img.size
-        if width >= height:
-            new_height = target
-            new_width = round(width * (target / height) / patch_size) * patch_size
+    target = int(image_size)
+    if read_frames is None:
+        if frames is not None:
+            read_frames = lambda positions: [frames[pos] for pos in positions]  # noqa: E731
         else:
-            new_width = target
-            new_height = round(height * (target / width) / patch_size) * patch_size
-
-        img = img.resize((new_width, new_height), Image.Resampling.BICUBIC)
-        left = (new_width - target) // 2
-        top = (new_height - target) // 2
-        img = img.crop((left, top, left + target, top + target))
-        images.append(to_tensor(img))
-
-    import torch
+            read_frames = lambda positions: [image_path_list[pos] for pos in positions]  # noqa: E731
+    if frame_keys is None:
+        frame_keys = (
+            [hashlib.sha256(np.ascontiguousarray(frame)).hexdigest() for frame in frames]
+            if frames is not None
+            else frame_file_hashes(image_path_list)
+        )
 
-    stacked = torch.stack(images)
-    if len(image_path_list) == 1 and stacked.dim() == 3:
-        stacked = stacked.unsqueeze(0)
-    return stacked
+    shape = (len(frame_keys), 3, target, target)
+    if out is None:
+        out = torch.empty(shape, dtype=torch.float32, pin_memory=pin_memory)
+    elif tuple(out.shape) != shape or out.dtype != torch.float32 or out.device.type != "cpu":
+        raise ValueError(f"out must be a float32 CPU tensor of shape {shape}, got {out.dtype} {tuple(out.shape)}")
+    batch = out.numpy()
+    scale = np.float32(255.0)
+
+    def write(pos: int, frame: np.ndarray) -> None:
+        # Same values as torchvision ToTensor: uint8 HWC -> float CHW / 255, in place.
+        np.divide(np.asarray(frame).transpose(2, 0, 1), scale, out=batch[pos], dtype=np.float32)
+
+    fill_preprocessed_frames(
+        frame_keys,
+        mode="center_square",
+        image_size=target,
+        patch_size=patch_size,
+        read_frames=read_frames,
+        preprocess=lambda source: _center_square_array(source, target=target, patch_size=patch_size),
+        sink=write,
+    )
+    return out
 
 
 def _load_and_preprocess_images(
@@ -364,8 +441,13 @@ def _load_and_preprocess_images(
     preprocess_mode: str = "center_square",
     image_size: int = 518,
     patch_size: int = 14,
+    frames: list[np.ndarray] | None = None,
+    frame_keys: list[str] | None = None,
+    read_frames: Callable[[list[int]], list[np.ndarray]] | None = None,
+    out: "torch.Tensor | None" = None,
+    pin_memory: bool = False,
 ) -> "torch.Tensor":
-    if not image_path_list:
+    if not image_path_list and not frames and read_frames is None:
         raise ValueError("At least 1 image is required")
     if preprocess_mode not in LINGBOT_PREPROCESS_MODES:
         raise ValueError(
@@ -376,7 +458,14 @@ def _load_and_preprocess_images(
             image_path_list,
             image_size=image_size,
             patch_size=patch_size,
+            frames=frames,
+            frame_keys=frame_keys,
+            read_frames=read_frames,
+            out=out,
+            pin_memory=pin_memory,
         )
+    if frames is not None or read_frames is not None:
+        raise ValueError(f"preprocess_mode={preprocess_mode!r} reads image files; stream frames need center_square")
 
     from lingbot_map.utils.load_fn import load_and_preprocess_images as official_load
 
@@ -388,6 +477,163 @@ def _load_and_preprocess_images(
     )
 
 
+# Streaming mode: frames per decode chunk after the scale frames.
+PIPELINE_CHUNK_FRAMES = 16
+PIPELINE_QUEUE_CHUNKS = 2
+
+
+def _preprocess_chunks(
+    num_frames: int,
+    *,
+    mode: str,
+    window_size: int,
+    overlap_size: int,
+    num_scale_frames: int,
+    preprocess_mode: str,
+) -> list[tuple[int, int]]:
+    """Contiguous ``(start, stop)`` frame ranges, in the order inference first needs them."""
+    if preprocess_mode != "center_square" or num_frames <= 0:
+        # The official crop/pad loaders size the batch from all of its frames.
+        return [(0, num_frames)]
+    if mode == "windowed":
+        first, step = window_size, max(window_size - overlap_size, 1)
+    else:
+        first, step = num_scale_frames, PIPELINE_CHUNK_FRAMES
+    bounds = [0, min(max(int(first), 1), num_frames)]
+    while bounds[-1] < num_frames:
+        bounds.append(min(bounds[-1] + step, num_frames))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class _FramePipeline:
+    """
+    Decode + preprocess frame chunks on a background thread (each chunk's frames in
+    parallel) into a bounded queue; a second thread drains it into one preallocated
+    (S, 3, H, W) tensor on ``device``. Decoding overlaps checkpoint download, model
+    build and host-to-device copies, and at most ``queue_chunks`` decoded chunks wait
+    in memory. With a preallocated ``images`` batch, chunks that are already views of
+    it (decoded in place) are not copied again.
+
+    With ``defer_device_copy``, decoded chunks stay on the host (unbounded) until
+    :meth:`start_device_copy`, so decoding can run while another job holds the
+    inference lane without touching that job's device.
+    """
+
+    def __init__(
+        self,
+        load_chunk: Callable[[int, int], "torch.Tensor"],
+        chunks: list[tuple[int, int]],
+        num_frames: int,
+        device,
+        *,
+        images: "torch.Tensor | None" = None,
+        queue_chunks: int = PIPELINE_QUEUE_CHUNKS,
+        defer_device_copy: bool = False,
+    ):
+        self._load_chunk = load_chunk
+        self._chunks = chunks
+        self._num_frames = num_frames
+        self._device = device
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_chunks))
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+        self._device_ready = threading.Event()
+        if not defer_device_copy:
+            self._device_ready.set()
+        self.images = images
+        self.started_at = time.perf_counter()
+        # Seconds from start until the first chunk (the first window's frames) is decoded.
+        self.first_window_s: float | None = None
+        self.elapsed_s: float | None = None
+        self._threads = [
+            threading.Thread(target=self._produce, name="lingbot-map-decode", daemon=True),
+            threading.Thread(target=self._assemble, name="lingbot-map-assemble", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for start, stop in self._chunks:
+                if self._stop.is_set() or not self._put((start, self._load_chunk(start, stop))):
+                    return
+        except BaseException as exc:
+            self._errors.append(exc)
+        finally:
+            self._put(None)
+
+    def start_device_copy(self) -> None:
+        """Let decoded chunks move into ``images`` (see ``defer_device_copy``)."""
+        self._device_ready.set()
+
+    def _place(self, start: int, chunk: "torch.Tensor") -> None:
+        import torch
+
+        if self.images is None:
+            self.images = torch.empty((self._num_frames, *chunk.shape[1:]), dtype=chunk.dtype, device=self._device)
+        elif chunk.shape[1:] != self.images.shape[1:]:
+            raise RuntimeError(
+                f"Preprocessed frames {start}-{start + len(chunk) - 1} are {tuple(chunk.shape[1:])}, "
+                f"expected {tuple(self.images.shape[1:])}"
+            )
+        target = self.images[start : start + len(chunk)]
+        if chunk.data_ptr() != target.data_ptr():
+            target.copy_(chunk)
+
+    def _assemble(self) -> None:
+        pending: list[tuple[int, "torch.Tensor"]] = []
+        decoded = False
+        try:
+            while not decoded or pending:
+                if pending and self._device_ready.is_set():
+                    for start, chunk in pending:
+                        self._place(start, chunk)
+                    pending.clear()
+                    continue
+                if self._stop.is_set():
+                    return
+                if decoded:
+                    self._device_ready.wait(timeout=0.1)
+                    continue
+                try:
+                    item = self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    decoded = True
+                    continue
+                if self.first_window_s is None:
+                    self.first_window_s = time.perf_counter() - self.started_at
+                pending.append(item)
+        except BaseException as exc:
+            self._errors.append(exc)
+            self._stop.set()
+        finally:
+            self.elapsed_s = time.perf_counter() - self.started_at
+
+    def result(self) -> "torch.Tensor":
+        """The full (S, 3, H, W) batch; re-raises the first decode error."""
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+        return self.images
+
+    def close(self) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+
 # Official demo.py thresholds (streaming KV cache vs windowed cross-window alignment).
 STREAMING_FULL_KEYFRAME_MAX = 320
 WINDOWED_AUTO_THRESHOLD = 321
@@ -605,9 +851,37 @@ def _inference_dtype(device) -> "torch.dtype":
     return torch.float32
 
 
-def _forced_tqdm(*args, **kwargs):
+@contextlib.contextmanager
+def progress_listener(callback: ProgressCallback) -> Iterator[None]:
+    """
+    Receive LingBot-Map streaming/windowed progress on the calling thread.
+
+    ``callback(desc, n, total)`` runs on every tqdm refresh while this thread is inside
+    ``run_lingbot_map``; raising from it aborts inference (used for job cancellation).
+    """
+    ident = threading.get_ident()
+    _PROGRESS_LISTENERS[ident] = callback
+    try:
+        yield
+    finally:
+        _PROGRESS_LISTENERS.pop(ident, None)
+
+
+def _reporting_tqdm_class():
     from tqdm import tqdm as std_tqdm
 
+    class _ReportingTqdm(std_tqdm):
+        def update(self, n=1):
+            displayed = super().update(n)
+            callback = _PROGRESS_LISTENERS.get(threading.get_ident())
+            if callback is not None:
+                callback(str(self.desc or ""), int(self.n), self.total)
+            return displayed
+
+    return _ReportingTqdm
+
+
+def _forced_tqdm(*args, **kwargs):
     desc = str(kwargs.get("desc", args[0] if args else ""))
     unit = "windows" if "window" in desc.lower() else "frames"
     kwargs.setdefault("file", sys.stderr)
@@ -616,7 +890,12 @@ def _forced_tqdm(*args, **kwargs):
     kwargs.setdefault("dynamic_ncols", True)
     kwargs.setdefault("unit", unit)
     kwargs.setdefault("bar_format", "{desc}: {n_fmt}/{total_fmt} {unit} [{elapsed}<{remaining}]")
-    return std_tqdm(*args, **kwargs)
+    return _reporting_tqdm_class()(*args, **kwargs)
+
+
+def _quiet_forced_tqdm(*args, **kwargs):
+    kwargs["file"] = io.StringIO()
+    return _forced_tqdm(*args, **kwargs)
 
 
 def _estimate_window_count(num_frames: int, window_size: int, overlap_size: int) -> int:
@@ -630,9 +909,11 @@ def _estimate_window_count(num_frames: int, window_size: int, overlap_size: int)
 
 @contextlib.contextmanager
 def _lingbot_map_progress(enabled: bool = True) -> Iterator[None]:
-    if not enabled:
+    listening = threading.get_ident() in _PROGRESS_LISTENERS
+    if not enabled and not listening:
         yield
         return
+    forced = _forced_tqdm if enabled else _quiet_forced_tqdm
 
     saved: list[tuple[object, object]] = []
     for name in _LINGBOT_MAP_TQDM_MODULES:
@@ -644,7 +925,7 @@ def _lingbot_map_progress(enabled: bool = True) -> Iterator[None]:
                 continue
         if hasattr(mod, "tqdm"):
             saved.append((mod, mod.tqdm))
-            mod.tqdm = _forced_tqdm
+            mod.tqdm = forced
 
     try:
         yield
@@ -671,6 +952,10 @@ def run_lingbot_map(
     preprocess_mode: str = "center_square",
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
+    frame_source: VideoFrameSource | None = None,
+    cpu_quantize: str | None = None,
+    inference_lane: Callable[[], contextlib.AbstractContextManager[None]] | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
     if not ensure_dependencies(verbose):
@@ -682,34 +967,22 @@ def run_lingbot_map(
     import torch
     from lingbot_map.utils.geometry import unproject_depth_map_to_point_map
 
+    started_at = time.perf_counter()
     image_path = Path(image_path)
-    all_images = discover_images(image_path)
+    all_images = frame_source.frame_paths() if frame_source is not None else discover_images(image_path)
     input_num_frames = len(all_images)
     selected, indices, _ = limit_image_frames(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label="LingBot-Map",
     )
     paths = [str(p) for p in selected]
-    if verbose:
-        print(
-            f"--- [vibephysics] LingBot-Map: loading {len(paths)} images "
-            f"(preprocess={preprocess_mode}, size={image_size}) ---",
-            flush=True,
-        )
-
-    images = _load_and_preprocess_images(
-        paths,
-        preprocess_mode=preprocess_mode,
-        image_size=image_size,
-        patch_size=patch_size,
-    )
-    h, w = images.shape[-2], images.shape[-1]
-    num_frames = images.shape[0]
-    if verbose:
-        print(f"--- [vibephysics] Preprocessed to {w}x{h} ({num_frames} frames) ---", flush=True)
+    num_frames = len(paths)
+    if num_frames == 0:
+        raise ValueError("At least 1 image is required")
 
     device_info = resolve_torch_device(verbose=verbose)
     device = torch.device(device_info.device)
@@ -727,94 +1000,186 @@ def run_lingbot_map(
             auto_mode=mode_auto,
             vram_gb=device_info.cuda_total_memory_gb,
         )
-    if verbose:
-        print(
-            f"--- [vibephysics] {format_inference_plan(num_frames, mode='auto' if mode_auto else mode, keyframe_interval=keyframe_interval, max_streaming_keyframes=max_streaming_keyframes, vram_gb=device_info.cuda_total_memory_gb, window_size=window_size, overlap_size=overlap_size)} ---",
-            flush=True,
-        )
 
-    use_sdpa = _resolve_use_sdpa(use_sdpa, verbose=verbose)
+    frame_keys = None
+    if frame_source is not None:
+        source_keys = frame_source.frame_keys()
+        frame_keys = [source_keys[index] for index in indices]
+    # center_square on CPU decodes straight into the final batch; on CUDA each chunk
+    # lands in pinned memory and is copied to the device batch.
+    batch = None
+    if preprocess_mode == "center_square" and device.type == "cpu":
+        batch = torch.empty((num_frames, 3, int(image_size), int(image_size)), dtype=torch.float32)
+
+    # Chunks are decoded in order, so one front-to-back pass over the video serves them all.
+    reader = frame_source.sequential_reader(indices) if frame_source is not None else None
+
+    def load_chunk(start: int, stop: int) -> "torch.Tensor":
+        return _load_and_preprocess_images(
+            paths[start:stop],
+            preprocess_mode=preprocess_mode,
+            image_size=image_size,
+            patch_size=patch_size,
+            frame_keys=frame_keys[start:stop] if frame_keys is not None else None,
+            read_frames=(
+                (lambda positions: reader.read_frames([indices[start + pos] for pos in positions]))
+                if reader is not None
+                else None
+            ),
+            out=batch[start:stop] if batch is not None else None,
+            pin_memory=device.type == "cuda",
+        )
 
-    ckpt = model_path or download_checkpoint(model_name, verbose=verbose)
-    if verbose:
-        print(f"--- [vibephysics] Building LingBot-Map model (checkpoint: {ckpt}) ---", flush=True)
-    args = SimpleNamespace(
+    chunks = _preprocess_chunks(
+        num_frames,
         mode=mode,
-        image_size=image_size,
-        patch_size=patch_size,
-        enable_3d_rope=True,
-        max_frame_num=1024,
-        kv_cache_sliding_window=64,
-        num_scale_frames=num_scale_frames,
-        use_sdpa=use_sdpa,
-        camera_num_iterations=camera_num_iterations,
-        model_path=str(ckpt),
         window_size=window_size,
         overlap_size=overlap_size,
-        overlap_keyframes=overlap_keyframes,
-        keyframe_interval=keyframe_interval,
+        num_scale_frames=num_scale_frames,
+        preprocess_mode=preprocess_mode,
     )
+    if verbose:
+        print(
+            f"--- [vibephysics] LingBot-Map: loading {num_frames} images "
+            f"(preprocess={preprocess_mode}, size={image_size}; {len(chunks)} chunks decoded "
+            "in the background while the model loads) ---",
+            flush=True,
+        )
+        print(
+            f"--- [vibephysics] {format_inference_plan(num_frames, mode='auto' if mode_auto else mode, keyframe_interval=keyframe_interval, max_streaming_keyframes=max_streaming_keyframes, vram_gb=device_info.cuda_total_memory_gb, window_size=window_size, overlap_size=overlap_size)} ---",
+            flush=True,
+        )
+    # A shared inference lane (batch / serve) is held from model load to the end of
+    # inference; frames keep decoding on the host while we wait for it.
+    pipeline = _FramePipeline(
+        load_chunk,
+        chunks,
+        num_frames,
+        device,
+        images=batch,
+        defer_device_copy=inference_lane is not None and device.type != "cpu",
+    )
+    lane = contextlib.ExitStack()
+    try:
+        use_sdpa = _resolve_use_sdpa(use_sdpa, verbose=verbose)
+        cpu_quantize = resolve_cpu_quantize(cpu_quantize, device.type, verbose=verbose)
 
-    model = _load_model(args, device)
-    dtype = _inference_dtype(device)
-    if dtype != torch.float32 and getattr(model, "aggregator", None) is not None:
+        ckpt = model_path or download_checkpoint(model_name, verbose=verbose)
         if verbose:
-            print(f"--- [vibephysics] Casting aggregator to {dtype} ---", flush=True)
-        model.aggregator = model.aggregator.to(dtype=dtype)
-
-    if device.type == "cuda":
-        images = images.to(device)
-        torch.cuda.empty_cache()
+            print(f"--- [vibephysics] Building LingBot-Map model (checkpoint: {ckpt}) ---", flush=True)
+        args = SimpleNamespace(
+            mode=mode,
+            image_size=image_size,
+            patch_size=patch_size,
+            enable_3d_rope=True,
+            max_frame_num=1024,
+            kv_cache_sliding_window=64,
+            num_scale_frames=num_scale_frames,
+            use_sdpa=use_sdpa,
+            camera_num_iterations=camera_num_iterations,
+            model_path=str(ckpt),
+            window_size=window_size,
+            overlap_size=overlap_size,
+            overlap_keyframes=overlap_keyframes,
+            keyframe_interval=keyframe_interval,
+            cpu_quantize=cpu_quantize,
+        )
 
-    output_device = torch.device("cpu")
-    if verbose:
-        backend = "SDPA" if use_sdpa else "FlashInfer"
-        print(f"--- [vibephysics] {mode} inference (dtype={dtype}, {backend}) ---", flush=True)
-        if mode == "streaming":
-            print(
-                f"--- [vibephysics] Phase 1: {num_scale_frames} scale frames; "
-                f"Phase 2: frames {num_scale_frames}-{num_frames - 1} one-by-one "
-                f"(keyframe_interval={keyframe_interval}; 1 = every frame) ---",
-                flush=True,
-            )
-        else:
-            num_windows = _estimate_window_count(num_frames, window_size, overlap_size)
+        if inference_lane is not None:
+            lane.enter_context(inference_lane())
+        pipeline.start_device_copy()
+        model = pooled_model(
+            (
+                "lingbot_map",
+                str(ckpt),
+                mode,
+                image_size,
+                patch_size,
+                num_scale_frames,
+                use_sdpa,
+                camera_num_iterations,
+                str(device),
+                cpu_quantize,
+            ),
+            lambda: _load_model(args, device),
+            verbose=verbose,
+        )
+        dtype = _inference_dtype(device)
+        if dtype != torch.float32 and getattr(model, "aggregator", None) is not None:
+            if verbose:
+                print(f"--- [vibephysics] Casting aggregator to {dtype} ---", flush=True)
+            model.aggregator = model.aggregator.to(dtype=dtype)
+
+        images = pipeline.result()
+    except BaseException:
+        lane.close()
+        raise
+    finally:
+        pipeline.close()
+        if reader is not None:
+            reader.close()
+    with lane:
+        h, w = images.shape[-2], images.shape[-1]
+        if verbose:
             print(
-                f"--- [vibephysics] Windowed: {num_frames} source frames -> "
-                f"{num_windows} overlapping windows "
-                f"(window_size={window_size}, overlap_size={overlap_size}, "
-                f"keyframe_interval={keyframe_interval}) ---",
+                f"--- [vibephysics] Preprocessed to {w}x{h} ({num_frames} frames, "
+                f"{pipeline.elapsed_s:.1f}s decode) ---",
                 flush=True,
             )
+        if device.type == "cuda":
+            torch.cuda.empty_cache()
 
-    with _lingbot_map_progress(verbose):
-        with torch.no_grad():
-            if device.type == "cuda" and dtype != torch.float32:
-                autocast_ctx = torch.amp.autocast("cuda", dtype=dtype)
+        output_device = torch.device("cpu")
+        if verbose:
+            backend = "SDPA" if use_sdpa else "FlashInfer"
+            print(f"--- [vibephysics] {mode} inference (dtype={dtype}, {backend}) ---", flush=True)
+            if mode == "streaming":
+                print(
+                    f"--- [vibephysics] Phase 1: {num_scale_frames} scale frames; "
+                    f"Phase 2: frames {num_scale_frames}-{num_frames - 1} one-by-one "
+                    f"(keyframe_interval={keyframe_interval}; 1 = every frame) ---",
+                    flush=True,
+                )
             else:
-                from contextlib import nullcontext
-
-                autocast_ctx = nullcontext()
-            with autocast_ctx:
-                if mode == "streaming":
-                    predictions = model.inference_streaming(
-                        images,
-                        num_scale_frames=num_scale_frames,
-                        keyframe_interval=keyframe_interval,
-                        output_device=output_device,
-                    )
+                num_windows = _estimate_window_count(num_frames, window_size, overlap_size)
+                print(
+                    f"--- [vibephysics] Windowed: {num_frames} source frames -> "
+                    f"{num_windows} overlapping windows "
+                    f"(window_size={window_size}, overlap_size={overlap_size}, "
+                    f"keyframe_interval={keyframe_interval}) ---",
+                    flush=True,
+                )
+
+        time_to_inference_start_s = time.perf_counter() - started_at
+        with _lingbot_map_progress(verbose):
+            with torch.no_grad():
+                if device.type == "cuda" and dtype != torch.float32:
+                    autocast_ctx = torch.amp.autocast("cuda", dtype=dtype)
                 else:
-                    predictions = model.inference_windowed(
-                        images,
-                        window_size=window_size,
-                        overlap_size=overlap_size,
-                        overlap_keyframes=overlap_keyframes,
-                        num_scale_frames=num_scale_frames,
-                        keyframe_interval=keyframe_interval,
-                        output_device=output_device,
-                    )
-
-    images_for_post = predictions.get("images", images.cpu() if device.type == "cuda" else images)
+                    from contextlib import nullcontext
+
+                    autocast_ctx = nullcontext()
+                with autocast_ctx:
+                    if mode == "streaming":
+                        predictions = model.inference_streaming(
+                            images,
+                            num_scale_frames=num_scale_frames,
+                            keyframe_interval=keyframe_interval,
+                            output_device=output_device,
+                        )
+                    else:
+                        predictions = model.inference_windowed(
+                            images,
+                            window_size=window_size,
+                            overlap_size=overlap_size,
+                            overlap_keyframes=overlap_keyframes,
+                            num_scale_frames=num_scale_frames,
+                            keyframe_interval=keyframe_interval,
+                            output_device=output_device,
+                        )
+
+        images_for_post = predictions.get("images", images.cpu() if device.type == "cuda" else images)
+
     predictions, images_cpu = _postprocess(predictions, images_for_post)
     vis = _prepare_for_visualization(predictions, images_cpu)
 
@@ -865,10 +1230,14 @@ def run_lingbot_map(
             "max_frames_mode": max_frames_mode,
             "use_sdpa": use_sdpa,
             "inference_device": device_info.device,
+            "cpu_quantize": cpu_quantize,
             "vram_gb": get_vram_gb(),
             "preprocess_mode": preprocess_mode,
             "image_size": image_size,
             "input_hw": [int(h), int(w)],
+            "time_to_inference_start_s": time_to_inference_start_s,
+            "first_window_decoded_s": pipeline.first_window_s,
+            "preprocess_s": pipeline.elapsed_s,
             "w2c_as_camera_pose": True,
         },
     )
@@ -16,12 +16,15 @@ import numpy as np
 from ..common import (
     MAP_ANYTHING_GIT,
     c2w_to_w2c,
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
     feedforward_hf_hub_cache,
     feedforward_torch_hub_cache,
     get_vram_gb,
     limit_image_frames,
+    pooled_model,
+    resolve_cpu_quantize,
     resolve_torch_device,
     to_numpy,
 )
@@ -31,6 +34,7 @@ from ..deps import (
     install_map_anything_extra,
 )
 from ..schema import FeedforwardPrediction
+from ..window_align import apply_sim3, measure_window, overlap_sim3, plan_anchor_windows
 
 DEFAULT_MODEL_NAME = "vggt"
 DEFAULT_CACHE = feedforward_engine_dir("map_anything")
@@ -544,6 +548,39 @@ def _depth_from_outputs(predictions: list[dict[str, Any]]) -> np.ndarray:
     return (depth_along_ray * ray_directions[..., 2]).astype(np.float32)
 
 
+def _prediction_arrays(predictions: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """One forward pass's per-view outputs as stacked float32 arrays (w2c extrinsics)."""
+    world_points = _stack_key(predictions, "pts3d")
+    if world_points is None:
+        raise ValueError("Map-Anything output is missing pts3d.")
+
+    depth = _depth_from_outputs(predictions)
+    conf = _stack_key(predictions, "conf")
+    if conf is None:
+        conf = np.ones_like(depth, dtype=np.float32)
+    if conf.ndim == 4 and conf.shape[-1] == 1:
+        conf = conf[..., 0]
+
+    intrinsic = _intrinsics_from_outputs(predictions)
+    extrinsic_w2c = _c2w_to_w2c(_camera_poses_from_factory_outputs(predictions))
+
+    finite_points = np.isfinite(world_points).all(axis=-1)
+    finite_depth = np.isfinite(depth)
+    if not np.any(finite_points) or not np.any(finite_depth) or not np.isfinite(extrinsic_w2c).all():
+        raise RuntimeError(
+            "Map-Anything produced non-finite geometry. "
+            "On CPU this is commonly caused by mixed precision; AMP is disabled for CPU runs, "
+            "so rerun this command with the updated adapter."
+        )
+    return {
+        "world_points": world_points.astype(np.float32, copy=False),
+        "depth": depth.astype(np.float32, copy=False),
+        "conf": conf.astype(np.float32, copy=False),
+        "intrinsic": intrinsic.astype(np.float32, copy=False),
+        "extrinsic": extrinsic_w2c.astype(np.float32, copy=False),
+    }
+
+
 def run_map_anything(
     image_path: Path,
     model_name: str = DEFAULT_MODEL_NAME,
@@ -556,8 +593,22 @@ def run_map_anything(
     size: int | tuple[int, int] | None = None,
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
+    window_size: int | None = None,
+    window_stride: int | None = None,
+    anchor_frames: int = 4,
+    cpu_quantize: str | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
+    """
+    Run a Map-Anything factory model on the frames in ``image_path``.
+
+    ``window_size`` > 0 bounds the views per forward pass: after the first window,
+    each one re-runs ``anchor_frames`` views of the previous window ahead of the next
+    ``window_stride`` new frames (default: fill the window) and is chained onto the
+    earlier windows with a closed-form Sim(3) fit on the anchors, so model memory
+    stays flat however long the sequence is.
+    """
     if not ensure_dependencies(verbose, model_name=model_name, install_all=install_all_extras):
         raise RuntimeError(
             "Map-Anything not ready. Install with: "
@@ -577,6 +628,7 @@ def run_map_anything(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label=f"Map-Anything/{model_name}",
     )
@@ -589,78 +641,135 @@ def run_map_anything(
             flush=True,
         )
 
-    views = load_images(
-        paths,
-        resize_mode=resize_mode,
-        size=size,
-        norm_type=norm_type,
-        patch_size=patch_size,
-        resolution_set=resolution,
-        verbose=verbose,
-    )
-    rgb = _views_to_rgb(views, norm_type)
-    h, w = rgb.shape[1:3]
+    windows = plan_anchor_windows(len(paths), window_size, anchor_frames, window_stride)
+
+    def _load_views(window_frames: list[int]) -> list[dict[str, Any]]:
+        views = load_images(
+            [paths[index] for index in window_frames],
+            resize_mode=resize_mode,
+            size=size,
+            norm_type=norm_type,
+            patch_size=patch_size,
+            resolution_set=resolution,
+            verbose=verbose and len(windows) == 1,
+        )
+        _normalize_view_metadata(views, model_name)
+        return views
 
     device_info = resolve_torch_device(verbose=verbose)
     device = device_info.device
     if device == "cpu" and verbose:
         print("--- [vibephysics] Warning: Map-Anything factory models may be slow on CPU ---", flush=True)
 
-    _normalize_view_metadata(views, model_name)
+    cpu_quantize = resolve_cpu_quantize(cpu_quantize, device, verbose=verbose)
     kwargs = _resolve_model_kwargs(model_name, model_kwargs, verbose=verbose)
 
+    if len(windows) > 1 and verbose:
+        print(
+            f"--- [vibephysics] Map-Anything: {len(windows)} windows of <= {window_size} views "
+            f"({anchor_frames} anchor frames each, Sim(3)-chained) ---",
+            flush=True,
+        )
+
+    window_stats: list[dict] = []
+    rgb = depth = conf = intrinsic = extrinsic_w2c = world_points = None
     with _cpu_cuda_shim(device):
         if verbose:
             print(f"--- [vibephysics] Building Map-Anything factory model '{model_name}' ---", flush=True)
-        model = _build_model(model_name, kwargs, device, verbose=verbose)
-        views_device = _move_views_to_device(views, device)
-        with torch.no_grad():
-            if model_name in CORE_PRETRAINED_MODEL_NAMES:
-                if verbose:
-                    print("--- [vibephysics] Running Map-Anything model.infer() ---", flush=True)
-                predictions = model.infer(
-                    views_device,
-                    use_amp=(device == "cuda"),
-                    amp_dtype="bf16",
-                )
-            else:
-                if verbose:
-                    print("--- [vibephysics] Running Map-Anything model.forward() ---", flush=True)
-                predictions = model(views_device)
-
-    world_points = _stack_key(predictions, "pts3d")
-    if world_points is None:
-        raise ValueError("Map-Anything output is missing pts3d.")
-
-    depth = _depth_from_outputs(predictions)
-    conf = _stack_key(predictions, "conf")
-    if conf is None:
-        conf = np.ones_like(depth, dtype=np.float32)
-    if conf.ndim == 4 and conf.shape[-1] == 1:
-        conf = conf[..., 0]
-
-    intrinsic = _intrinsics_from_outputs(predictions)
-    extrinsic_w2c = _c2w_to_w2c(_camera_poses_from_factory_outputs(predictions))
-
-    finite_points = np.isfinite(world_points).all(axis=-1)
-    finite_depth = np.isfinite(depth)
-    if not np.any(finite_points) or not np.any(finite_depth) or not np.isfinite(extrinsic_w2c).all():
-        raise RuntimeError(
-            "Map-Anything produced non-finite geometry. "
-            "On CPU this is commonly caused by mixed precision; AMP is disabled for CPU runs, "
-            "so rerun this command with the updated adapter."
+        model = pooled_model(
+            ("map_anything", model_name, repr(sorted(kwargs.items())), str(device), cpu_quantize),
+            lambda: cpu_quantized_model(
+                lambda: _build_model(model_name, dict(kwargs), device, verbose=verbose),
+                cpu_quantize=cpu_quantize,
+                verbose=verbose,
+            ),
+            verbose=verbose,
         )
+        for index, (window_frames, num_anchors) in enumerate(windows):
+            with measure_window(window_stats, window_frames[num_anchors], window_frames[-1] + 1) as record:
+                views = _load_views(window_frames)
+                window_rgb = _views_to_rgb(views, norm_type)
+                views_device = _move_views_to_device(views, device)
+                del views
+                with torch.no_grad():
+                    if model_name in CORE_PRETRAINED_MODEL_NAMES:
+                        if verbose and index == 0:
+                            print("--- [vibephysics] Running Map-Anything model.infer() ---", flush=True)
+                        predictions = model.infer(
+                            views_device,
+                            use_amp=(device == "cuda"),
+                            amp_dtype="bf16",
+                        )
+                    else:
+                        if verbose and index == 0:
+                            print("--- [vibephysics] Running Map-Anything model.forward() ---", flush=True)
+                        predictions = model(views_device)
+                del views_device
+                window = _prediction_arrays(predictions)
+                del predictions
+
+                if depth is None:
+                    total = len(paths)
+                    rgb = np.empty((total, *window_rgb.shape[1:]), dtype=np.float32)
+                    depth = np.empty((total, *window["depth"].shape[1:]), dtype=np.float32)
+                    conf = np.empty_like(depth)
+                    intrinsic = np.empty((total, 3, 3), dtype=np.float32)
+                    extrinsic_w2c = np.empty((total, 3, 4), dtype=np.float32)
+                    world_points = np.empty((*depth.shape, 3), dtype=np.float32)
+                elif window["depth"].shape[1:] != depth.shape[1:]:
+                    raise RuntimeError(
+                        f"Map-Anything window {index + 1} preprocessed to {window['depth'].shape[1:]}, "
+                        f"expected {depth.shape[1:]}; mixed image sizes need map_anything.window_size: 0"
+                    )
+
+                if num_anchors:
+                    anchors = window_frames[:num_anchors]
+                    scale, rotation, translation, rmse = overlap_sim3(
+                        world_points[anchors],
+                        conf[anchors],
+                        extrinsic_w2c[anchors],
+                        window["world_points"][:num_anchors],
+                        window["conf"][:num_anchors],
+                        window["extrinsic"][:num_anchors],
+                    )
+                    window["extrinsic"], window["depth"], window["world_points"] = apply_sim3(
+                        scale,
+                        rotation,
+                        translation,
+                        extrinsic=window["extrinsic"],
+                        depth=window["depth"],
+                        world_points=window["world_points"],
+                    )
+                    record.update(scale=scale, align_rmse=rmse, anchors=[int(frame) for frame in anchors])
+                    if verbose:
+                        print(
+                            f"--- [vibephysics] Map-Anything window {index + 1}/{len(windows)} "
+                            f"(frames {window_frames[num_anchors]}-{window_frames[-1]}): "
+                            f"scale {scale:.3f}, anchor RMSE {rmse:.4f} ---",
+                            flush=True,
+                        )
+
+                # Anchor views keep their earlier prediction; only new frames are written.
+                new = slice(window_frames[num_anchors], window_frames[-1] + 1)
+                rgb[new] = window_rgb[num_anchors:]
+                depth[new] = window["depth"][num_anchors:]
+                conf[new] = window["conf"][num_anchors:]
+                intrinsic[new] = window["intrinsic"][num_anchors:]
+                extrinsic_w2c[new] = window["extrinsic"][num_anchors:]
+                world_points[new] = window["world_points"][num_anchors:]
+                del window, window_rgb
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
+    h, w = rgb.shape[1:3]
 
     return FeedforwardPrediction(
-        images=rgb.astype(np.float32),
-        depth=depth.astype(np.float32),
-        conf=conf.astype(np.float32),
-        extrinsic=extrinsic_w2c.astype(np.float32),
-        intrinsic=intrinsic.astype(np.float32),
-        world_points=world_points.astype(np.float32),
+        images=rgb,
+        depth=depth,
+        conf=conf,
+        extrinsic=extrinsic_w2c,
+        intrinsic=intrinsic,
+        world_points=world_points,
         image_paths=paths,
         engine="map_anything",
         metadata={
@@ -674,6 +783,11 @@ def run_map_anything(
             "input_num_frames": input_num_frames,
             "max_frames_mode": max_frames_mode,
             "inference_device": device,
+            "cpu_quantize": cpu_quantize,
+            "window_size": int(window_size or 0),
+            "window_stride": int(window_stride or 0),
+            "anchor_frames": int(anchor_frames),
+            "inference_windows": window_stats,
             "vram_gb": get_vram_gb(),
             "input_hw": [int(h), int(w)],
             "w2c_as_camera_pose": False,
@@ -0,0 +1,234 @@
+"""Host-memory planner for the post-inference stages (post-process, NPZ save).
+
+Long clips keep every frame's world_points / depth / conf / images resident on the
+host; per-frame point chunks and the float16 NPZ encode come on top. This module
+estimates that peak from frame count, resolution and output options, and — given a
+``memory_budget_gb`` — switches to split NPZ files and then to stronger
+``random_points_per_frame`` until the estimate fits.
+
+Estimates are upper bounds: every pixel is assumed to pass the confidence filter.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .common import RandomPointsLimit, resolve_random_sample_count
+
+GIB = 1024**3
+
+# world_points (3 x f32) + depth (f32) + conf (f32) + images (3 x f32) per pixel.
+DEFAULT_ARRAY_BYTES_PER_PIXEL = 12 + 4 + 4 + 12
+# One colored point in the post-process chunks: points f32 x3, colors u8 x3, conf f32, frame id i32.
+POINT_RECORD_BYTES = 12 + 3 + 4 + 4
+DEFAULT_PLAN_RESOLUTION = 518
+
+
+@dataclass
+class MemoryPlan:
+    num_frames: int
+    height: int
+    width: int
+    arrays_bytes: int
+    chunk_bytes: int
+    points_bytes: int
+    encode_bytes: int
+    split_files: bool
+    random_points_per_frame: RandomPointsLimit | None
+    budget_bytes: int | None = None
+    adjustments: list[str] = field(default_factory=list)
+
+    @property
+    def postprocess_bytes(self) -> int:
+        """Per-frame chunks plus the merged point cloud built from them."""
+        return self.chunk_bytes + self.points_bytes
+
+    @property
+    def save_bytes(self) -> int:
+        return self.points_bytes + self.encode_bytes
+
+    @property
+    def peak_bytes(self) -> int:
+        return self.arrays_bytes + max(self.postprocess_bytes, self.save_bytes)
+
+    @property
+    def fits(self) -> bool:
+        return self.budget_bytes is None or self.peak_bytes <= self.budget_bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "num_frames": self.num_frames,
+            "resolution": [self.height, self.width],
+            "arrays_bytes": self.arrays_bytes,
+            "postprocess_bytes": self.postprocess_bytes,
+            "encode_bytes": self.encode_bytes,
+            "peak_bytes": self.peak_bytes,
+            "budget_bytes": self.budget_bytes,
+            "split_files": self.split_files,
+            "random_points_per_frame": self.random_points_per_frame,
+            "adjustments": list(self.adjustments),
+        }
+
+
+def _gb(num_bytes: int) -> str:
+    return f"{num_bytes / GIB:.1f} GB"
+
+
+def expected_frame_size(engine: str, engine_kwargs: dict) -> tuple[int, int]:
+    """Model input ``(height, width)`` guess for a pre-inference plan (518 square when unset)."""
+    from .engines import engine_input_size, get_engine
+
+    size = engine_input_size(get_engine(engine), engine_kwargs)
+    return size if size is not None else (DEFAULT_PLAN_RESOLUTION, DEFAULT_PLAN_RESOLUTION)
+
+
+def estimate_memory_plan(
+    num_frames: int,
+    height: int,
+    width: int,
+    *,
+    arrays_bytes: int | None = None,
+    random_points_per_frame: RandomPointsLimit | None = None,
+    total_random_points: RandomPointsLimit | None = None,
+    point_cloud_3d_nms: bool = False,
+    algo_3d_bbox: bool = False,
+    split_files: bool = False,
+    budget_bytes: int | None = None,
+) -> MemoryPlan:
+    """Estimate host peak for post-process + save with the given output options."""
+    num_frames = max(int(num_frames), 0)
+    pixels = int(height) * int(width)
+    if arrays_bytes is None:
+        arrays_bytes = num_frames * pixels * DEFAULT_ARRAY_BYTES_PER_PIXEL
+    sampled = random_points_per_frame is not None or total_random_points is not None
+
+    chunk_points = 0
+    final_points = 0
+    if sampled or point_cloud_3d_nms or algo_3d_bbox:
+        per_frame = (
+            resolve_random_sample_count(random_points_per_frame, pixels)
+            if random_points_per_frame is not None
+            else pixels
+        )
+        chunk_points = num_frames * per_frame
+        final_points = (
+            resolve_random_sample_count(total_random_points, chunk_points)
+            if total_random_points is not None
+            else chunk_points
+        )
+
+    # float16 copies made by the NPZ writer; split files encode one array at a time.
+    depth_f16 = num_frames * pixels * 2
+    conf_f16 = num_frames * pixels * 2
+    if sampled:
+        arrays_f16 = [depth_f16, final_points * 6, final_points * 2]
+    else:
+        world_f16 = num_frames * pixels * 6
+        # The monolithic dense save also writes world_points_from_depth.
+        arrays_f16 = [depth_f16, conf_f16, world_f16] + ([] if split_files else [world_f16])
+    encode_bytes = max(arrays_f16) if split_files else sum(arrays_f16)
+
+    return MemoryPlan(
+        num_frames=num_frames,
+        height=int(height),
+        width=int(width),
+        arrays_bytes=int(arrays_bytes),
+        chunk_bytes=chunk_points * POINT_RECORD_BYTES,
+        points_bytes=final_points * POINT_RECORD_BYTES,
+        encode_bytes=int(encode_bytes),
+        split_files=split_files,
+        random_points_per_frame=random_points_per_frame,
+        budget_bytes=budget_bytes,
+    )
+
+
+def fit_memory_budget(
+    num_frames: int,
+    height: int,
+    width: int,
+    *,
+    memory_budget_gb: float | None,
+    arrays_bytes: int | None = None,
+    random_points_per_frame: RandomPointsLimit | None = None,
+    total_random_points: RandomPointsLimit | None = None,
+    point_cloud_3d_nms: bool = False,
+    algo_3d_bbox: bool = False,
+    split_files: bool = False,
+) -> MemoryPlan:
+    """
+    Plan post-process + save, switching options until the estimate fits the budget.
+
+    Order: split NPZ files (bounds the encode to one array), then the largest
+    ``random_points_per_frame`` that fits. ``algo_3d_bbox`` needs dense points, so
+    sampling is never tightened for it.
+    """
+    budget_bytes = int(float(memory_budget_gb) * GIB) if memory_budget_gb else None
+    options = dict(
+        arrays_bytes=arrays_bytes,
+        total_random_points=total_random_points,
+        point_cloud_3d_nms=point_cloud_3d_nms,
+        algo_3d_bbox=algo_3d_bbox,
+        budget_bytes=budget_bytes,
+    )
+    plan = estimate_memory_plan(
+        num_frames,
+        height,
+        width,
+        random_points_per_frame=random_points_per_frame,
+        split_files=split_files,
+        **options,
+    )
+    if plan.fits:
+        return plan
+
+    adjustments: list[str] = []
+    if not plan.split_files:
+        plan = estimate_memory_plan(
+            num_frames,
+            height,
+            width,
+            random_points_per_frame=random_points_per_frame,
+            split_files=True,
+            **options,
+        )
+        adjustments.append("split_files")
+    if not plan.fits and not algo_3d_bbox and num_frames > 0:
+        pixels = int(height) * int(width)
+        current = (
+            resolve_random_sample_count(random_points_per_frame, pixels)
+            if random_points_per_frame is not None
+            else pixels
+        )
+        low, high = 0, current - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            candidate = estimate_memory_plan(
+                num_frames, height, width, random_points_per_frame=mid, split_files=True, **options
+            )
+            if candidate.fits:
+                low = mid
+            else:
+                high = mid - 1
+        if low >= 1:
+            plan = estimate_memory_plan(
+                num_frames, height, width, random_points_per_frame=low, split_files=True, **options
+            )
+            adjustments.append(f"random_points_per_frame={low}")
+    plan.adjustments = adjustments
+    return plan
+
+
+def format_memory_plan(plan: MemoryPlan, *, estimated_resolution: bool = False) -> str:
+    resolution = f"{plan.height}x{plan.width}" + (" (est.)" if estimated_resolution else "")
+    text = (
+        f"Memory plan: {plan.num_frames} frames @ {resolution} -> host peak ~{_gb(plan.peak_bytes)} "
+        f"(arrays {_gb(plan.arrays_bytes)}, postprocess {_gb(plan.postprocess_bytes)}, "
+        f"npz encode {_gb(plan.encode_bytes)})"
+    )
+    if plan.budget_bytes is not None:
+        text += f"; budget {_gb(plan.budget_bytes)}"
+        if plan.adjustments:
+            text += f" -> {', '.join(plan.adjustments)}"
+        if not plan.fits:
+            text += " [still over budget]"
+    return text
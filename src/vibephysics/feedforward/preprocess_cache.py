@@ -0,0 +1,194 @@
+"""On-disk cache of preprocessed (resized / cropped) input frames, shared across runs.
+
+Each entry is one frame as an HxWx3 uint8 ``.npy`` file, read back as a memmap, keyed
+by the frame's content hash (or streamed-video frame key) plus preprocess mode, image
+size and patch size. Any engine that preprocesses in-process with the same settings
+(today LingBot-Map ``center_square``) reuses the entry, so comparing engines or
+sweeping inference settings on one clip decodes and resizes every frame once.
+
+uint8 storage is lossless for loaders that resize in PIL and then scale by 1/255.
+Set ``VIBEPHYSICS_NO_PREPROCESS_CACHE=1`` to bypass it; least recently used entries
+are evicted past ``VIBEPHYSICS_PREPROCESS_CACHE_GB`` (default 10).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+PREPROCESS_CACHE_SCHEMA = 1
+DEFAULT_PREPROCESS_CACHE_GB = 10.0
+
+
+def preprocess_cache_enabled() -> bool:
+    return os.environ.get("VIBEPHYSICS_NO_PREPROCESS_CACHE", "").strip().lower() not in {"1", "true", "yes"}
+
+
+def preprocess_cache_dir() -> Path:
+    """``.vibephysics/feedforward/preprocessed/`` (honors ``VIBEPHYSICS_FEEDFORWARD_CACHE``)."""
+    from .common import feedforward_engine_dir
+
+    return feedforward_engine_dir("preprocessed")
+
+
+def _max_cache_bytes() -> int:
+    try:
+        gb = float(os.environ.get("VIBEPHYSICS_PREPROCESS_CACHE_GB", DEFAULT_PREPROCESS_CACHE_GB))
+    except ValueError:
+        gb = DEFAULT_PREPROCESS_CACHE_GB
+    return int(gb * 1024**3)
+
+
+def decode_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def frame_file_hashes(paths: Sequence[str | Path]) -> list[str]:
+    """Content hashes of image files, computed in parallel."""
+    from .inference_cache import file_content_hash
+
+    with ThreadPoolExecutor(max_workers=decode_workers()) as pool:
+        return list(pool.map(file_content_hash, paths))
+
+
+def preprocess_key(frame_key: str, *, mode: str, image_size: int, patch_size: int) -> str:
+    payload = {
+        "schema": PREPROCESS_CACHE_SCHEMA,
+        "frame": frame_key,
+        "mode": mode,
+        "image_size": int(image_size),
+        "patch_size": int(patch_size),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return preprocess_cache_dir() / f"{key}.npy"
+
+
+def _load_entry(key: str) -> np.ndarray | None:
+    path = _entry_path(key)
+    try:
+        array = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if array.dtype != np.uint8 or array.ndim != 3:
+        return None
+    os.utime(path)  # LRU clock
+    return array
+
+
+def _store_entry(key: str, array: np.ndarray) -> None:
+    path = _entry_path(key)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{id(array)}.tmp.npy")
+    try:
+        np.save(tmp_path, np.ascontiguousarray(array, dtype=np.uint8))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def evict_preprocess_cache(max_bytes: int | None = None) -> int:
+    """Delete least recently used entries until the cache fits ``max_bytes``; returns bytes freed."""
+    max_bytes = _max_cache_bytes() if max_bytes is None else int(max_bytes)
+    entries = []
+    for path in preprocess_cache_dir().glob("*.npy"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        freed += size
+    return freed
+
+
+def fill_preprocessed_frames(
+    frame_keys: Sequence[str],
+    *,
+    mode: str,
+    image_size: int,
+    patch_size: int,
+    read_frames: Callable[[list[int]], Sequence[object]],
+    preprocess: Callable[[object], np.ndarray],
+    sink: Callable[[int, np.ndarray], None],
+    verbose: bool = False,
+) -> int:
+    """
+    Hand each preprocessed uint8 HxWx3 frame of ``frame_keys`` to ``sink(position, frame)``
+    on a thread pool: cache hits as memmaps, misses computed by ``preprocess`` and stored.
+    Frames are not collected, so ``sink`` decides where each one lands. Returns the hit count.
+    """
+    enabled = preprocess_cache_enabled()
+    keys = [
+        preprocess_key(frame_key, mode=mode, image_size=image_size, patch_size=patch_size)
+        for frame_key in frame_keys
+    ]
+    hits = [(pos, _load_entry(key)) for pos, key in enumerate(keys)] if enabled else []
+    hits = [(pos, array) for pos, array in hits if array is not None]
+    cached = {pos for pos, _ in hits}
+    missing = [pos for pos in range(len(keys)) if pos not in cached]
+
+    def compute(pos: int, source: object) -> None:
+        array = preprocess(source)
+        if enabled:
+            _store_entry(keys[pos], array)
+        sink(pos, array)
+
+    with ThreadPoolExecutor(max_workers=decode_workers()) as pool:
+        futures = [pool.submit(sink, pos, array) for pos, array in hits]
+        del hits
+        if missing:
+            sources = read_frames(missing)
+            futures += [pool.submit(compute, pos, source) for pos, source in zip(missing, sources)]
+            del sources
+        for future in futures:
+            future.result()
+    if missing and enabled:
+        evict_preprocess_cache()
+    if verbose and enabled:
+        print(
+            f"--- [vibephysics] Preprocess cache: {len(keys) - len(missing)}/{len(keys)} frames reused ---",
+            flush=True,
+        )
+    return len(keys) - len(missing)
+
+
+def load_preprocessed_frames(
+    frame_keys: Sequence[str],
+    *,
+    mode: str,
+    image_size: int,
+    patch_size: int,
+    read_frames: Callable[[list[int]], Sequence[object]],
+    preprocess: Callable[[object], np.ndarray],
+    verbose: bool = False,
+) -> list[np.ndarray]:
+    """Preprocessed frames of :func:`fill_preprocessed_frames` as a list, in ``frame_keys`` order."""
+    results: list[np.ndarray | None] = [None] * len(frame_keys)
+
+    def collect(pos: int, array: np.ndarray) -> None:
+        results[pos] = array
+
+    fill_preprocessed_frames(
+        frame_keys,
+        mode=mode,
+        image_size=image_size,
+        patch_size=patch_size,
+        read_frames=read_frames,
+        preprocess=preprocess,
+        sink=collect,
+        verbose=verbose,
+    )
+    return results
@@ -0,0 +1,212 @@
+"""Process- and disk-level cache for startup probes (torch device, engine dependencies).
+
+Resolving the device initializes CUDA and shells out to ``nvidia-smi``; checking engine
+dependencies runs ``find_spec`` over every requirement. Both answers only change when
+the interpreter, the installed packages, the NVIDIA driver or the visible GPUs change, so results are
+memoized per process and stamped under ``feedforward_cache_root()/probe_stamp.json``
+for later runs and worker processes. Set ``VIBEPHYSICS_NO_PROBE_CACHE=1`` to re-probe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import sysconfig
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+PROBE_STAMP_SCHEMA = 2
+PROBE_STAMP_FILE = "probe_stamp.json"
+
+_NVIDIA_DRIVER_FILES = ("/sys/module/nvidia/version", "/proc/driver/nvidia/version")
+_NVIDIA_GPU_INFO_GLOB = "/proc/driver/nvidia/gpus/*/information"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ProbeEvent:
+    name: str
+    source: str  # "probed", "stamp" (on-disk) or "memory" (earlier in this process)
+    elapsed_s: float
+
+
+# Guards the shared tables below; never held while a probe runs.
+_PROBE_LOCK = threading.RLock()
+# One lock per probe name, held while it runs, so a slow probe (e.g. a pip install)
+# blocks only callers of that same probe.
+_PROBE_NAME_LOCKS: dict[str, threading.Lock] = {}
+_PROBE_MEMORY: dict[str, Any] = {}
+_PROBE_EVENTS: list[ProbeEvent] = []
+
+
+def probe_cache_enabled() -> bool:
+    return os.environ.get("VIBEPHYSICS_NO_PROBE_CACHE", "").strip().lower() not in {"1", "true", "yes"}
+
+
+def _distribution_version(name: str) -> str | None:
+    from importlib import metadata
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def nvidia_driver_stamp() -> str | None:
+    """Loaded NVIDIA kernel driver version, read from sysfs/procfs (no subprocess)."""
+    for candidate in _NVIDIA_DRIVER_FILES:
+        try:
+            text = Path(candidate).read_text().strip()
+        except OSError:
+            continue
+        if text:
+            return text.splitlines()[0]
+    return None
+
+
+def nvidia_gpu_stamp() -> list[str]:
+    """Model and UUID of every GPU the NVIDIA driver exposes, from procfs (no subprocess)."""
+    import glob
+
+    gpus = []
+    for path in sorted(glob.glob(_NVIDIA_GPU_INFO_GLOB)):
+        try:
+            lines = Path(path).read_text().splitlines()
+        except OSError:
+            continue
+        fields = dict(line.split(":", 1) for line in lines if ":" in line)
+        gpus.append(f"{fields.get('Model', '').strip()}|{fields.get('GPU UUID', '').strip()}")
+    return gpus
+
+
+def _site_packages_mtimes() -> dict[str, int]:
+    paths = sysconfig.get_paths()
+    mtimes: dict[str, int] = {}
+    for key in ("purelib", "platlib"):
+        path = paths.get(key)
+        if not path or path in mtimes:
+            continue
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = 0
+    return mtimes
+
+
+def probe_stamp_key() -> str:
+    """Identity of the probed environment: interpreter, torch build, driver, GPUs, installed packages."""
+    payload = {
+        "schema": PROBE_STAMP_SCHEMA,
+        "executable": sys.executable,
+        "python": sys.version,
+        "torch": _distribution_version("torch"),
+        "driver": nvidia_driver_stamp(),
+        "gpus": nvidia_gpu_stamp(),
+        "cuda_visible_devices": os.environ.get("CUDA_VISIBLE_DEVICES"),
+        "site_packages": _site_packages_mtimes(),
+    }
+    blob = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def _stamp_path() -> Path:
+    from .common import feedforward_cache_root
+
+    return feedforward_cache_root() / PROBE_STAMP_FILE
+
+
+def _read_stamp(key: str) -> dict[str, Any]:
+    try:
+        stamp = json.loads(_stamp_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(stamp, dict) or stamp.get("key") != key:
+        return {}
+    probes = stamp.get("probes")
+    return probes if isinstance(probes, dict) else {}
+
+
+def _write_stamp_entry(key: str, name: str, value: Any) -> None:
+    probes = _read_stamp(key)
+    probes[name] = value
+    path = _stamp_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"key": key, "probes": probes}, indent=2, default=str))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # read-only cache dir: fall back to per-process memoization
+
+
+def cached_probe(
+    name: str,
+    probe: Callable[[], T],
+    *,
+    encode: Callable[[T], Any] = lambda value: value,
+    decode: Callable[[Any], T] = lambda value: value,
+    cache_if: Callable[[T], bool] = lambda value: True,
+) -> T:
+    """
+    Return ``probe()`` memoized in-process and stamped on disk.
+
+    Results rejected by ``cache_if`` (e.g. a failed dependency check) and probes that
+    raise are never cached, so the next call probes again.
+    """
+    started_at = time.perf_counter()
+    with _PROBE_LOCK:
+        name_lock = _PROBE_NAME_LOCKS.setdefault(name, threading.Lock())
+    with name_lock:
+        with _PROBE_LOCK:
+            if name in _PROBE_MEMORY:
+                _PROBE_EVENTS.append(ProbeEvent(name, "memory", time.perf_counter() - started_at))
+                return _PROBE_MEMORY[name]
+
+        use_stamp = probe_cache_enabled()
+        key = probe_stamp_key() if use_stamp else ""
+        entry = _read_stamp(key).get(name) if use_stamp else None
+        value: T | None = None
+        if entry is not None:
+            try:
+                value, source = decode(entry), "stamp"
+            except (TypeError, ValueError, KeyError):
+                value = None
+        if value is None:
+            value, source = probe(), "probed"
+            if not cache_if(value):
+                with _PROBE_LOCK:
+                    _PROBE_EVENTS.append(ProbeEvent(name, source, time.perf_counter() - started_at))
+                return value
+            if use_stamp:
+                # Re-key: the probe itself may have installed packages.
+                with _PROBE_LOCK:
+                    _write_stamp_entry(probe_stamp_key(), name, encode(value))
+
+        with _PROBE_LOCK:
+            _PROBE_MEMORY[name] = value
+            _PROBE_EVENTS.append(ProbeEvent(name, source, time.perf_counter() - started_at))
+        return value
+
+
+def clear_probe_cache(*, remove_stamp: bool = False) -> None:
+    """Forget in-process probe results (and optionally the on-disk stamp)."""
+    with _PROBE_LOCK:
+        _PROBE_MEMORY.clear()
+        if remove_stamp:
+            _stamp_path().unlink(missing_ok=True)
+
+
+def probe_event_count() -> int:
+    with _PROBE_LOCK:
+        return len(_PROBE_EVENTS)
+
+
+def probe_events(since: int = 0) -> list[ProbeEvent]:
+    with _PROBE_LOCK:
+        return list(_PROBE_EVENTS[since:])
@@ -12,16 +12,21 @@ import numpy as np
 
 from ..common import (
     R3_GIT,
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
     get_vram_gb,
     images_chw_to_hwc,
     limit_image_frames,
+    pooled_model,
+    resolve_cpu_quantize,
     to_numpy,
     unproject_depth_map_to_point_map,
 )
 from ..deps import ensure_engine_dependencies, pip_install
 from ..schema import FeedforwardPrediction
+from ..stream_checkpoint import StreamCheckpoint, run_segments
+from ..weights import load_checkpoint_state_dict, load_state_dict_into
 
 DEFAULT_CACHE = feedforward_engine_dir("r3")
 
@@ -256,19 +261,7 @@ def download_checkpoint(
 
 def _load_state_dict(model, ckpt_path: str, device) -> None:
     """Load R3 weights with the key remapping used by upstream infer.py."""
-    import torch
-
-    if ckpt_path.endswith(".safetensors"):
-        from safetensors.torch import load_file
-
-        checkpoint = load_file(ckpt_path, device=str(device) if device.type == "cuda" else "cpu")
-    else:
-        checkpoint = torch.load(
-            ckpt_path,
-            map_location=device if device.type == "cuda" else "cpu",
-            weights_only=False,
-        )
-    state_dict = checkpoint.get("state_dict", checkpoint.get("model", checkpoint))
+    state_dict = load_checkpoint_state_dict(ckpt_path, device=str(device) if device.type == "cuda" else "cpu")
 
     model_keys = model.state_dict()
     new_state_dict = {}
@@ -286,7 +279,7 @@ def _load_state_dict(model, ckpt_path: str, device) -> None:
 
     filtered = {k: v for k, v in new_state_dict.items() if k in model_keys}
     print(f"Matched {len(filtered)} keys from checkpoint out of {len(model_keys)} model keys.")
-    model.load_state_dict(filtered, strict=False)
+    load_state_dict_into(model, filtered, strict=False)
 
 
 def _build_model_kwargs(
@@ -335,6 +328,82 @@ def _build_model_kwargs(
     return kwargs
 
 
+def _online_state(model) -> dict[str, dict]:
+    """
+    R3's streaming state between forward calls: the plain attributes and buffers of
+    every submodule (KV cache, keyframe bank, frame counters, ...). Live references;
+    ``StreamCheckpoint.save`` pickles them right away.
+    """
+    import torch
+
+    internals = set(vars(torch.nn.Module()))
+    state = {}
+    for name, module in model.named_modules():
+        attrs = {
+            key: value
+            for key, value in vars(module).items()
+            if key not in internals and not isinstance(value, torch.nn.Module) and not callable(value)
+        }
+        state[name] = {"attrs": attrs, "buffers": dict(module._buffers)}
+    return state
+
+
+def _restore_online_state(model, state: dict[str, dict]) -> None:
+    modules = dict(model.named_modules())
+    for name, entry in state.items():
+        module = modules.get(name)
+        if module is None:
+            raise ValueError(f"R3 stream checkpoint names unknown module '{name}'")
+        module.__dict__.update(entry["attrs"])
+        module._buffers.update(entry["buffers"])
+
+
+def _prediction_outputs(predictions, *, start: int = 0, stop: int | None = None) -> dict[str, np.ndarray]:
+    """
+    One online forward call on views ``[start, stop)`` as numpy (w2c 3x4 extrinsics).
+
+    ``output_frame_ids`` local to the call (``0 <= id < stop - start``) are shifted by
+    ``start``; otherwise they are taken as global and must lie in ``[start, stop)``.
+    """
+    from R3.utils.pose_enc import pose_encoding_to_extri_intri
+
+    h, w = predictions["images"].shape[-2:]
+    extrinsic_t, intrinsic_t = pose_encoding_to_extri_intri(predictions["pose_enc"], (h, w))
+
+    extrinsic_w2c = to_numpy(extrinsic_t[0])  # [S, 4, 4] (or [S, 3, 4])
+    if extrinsic_w2c.ndim == 3 and extrinsic_w2c.shape[-2:] == (4, 4):
+        extrinsic_w2c = extrinsic_w2c[:, :3, :4]
+    intrinsic = to_numpy(intrinsic_t[0])
+
+    depth = to_numpy(predictions["depth"][0])  # [S, H, W, 1]
+    if depth.ndim == 4:
+        depth = depth[..., 0]
+    conf = to_numpy(predictions["depth_conf"][0])  # [S, H, W]
+
+    num_out = depth.shape[0]
+    output_frame_ids = [int(fid) for fid in predictions.get("output_frame_ids", range(num_out))]
+    if len(output_frame_ids) != num_out:
+        output_frame_ids = list(range(num_out))
+    frame_ids = np.asarray(output_frame_ids, dtype=np.int64)
+    stop = int(start) + num_out if stop is None else int(stop)
+    if len(frame_ids) and (frame_ids.min() < 0 or frame_ids.max() >= stop - int(start)):
+        if frame_ids.min() < int(start) or frame_ids.max() >= stop:
+            raise RuntimeError(
+                f"R3 output_frame_ids {frame_ids.tolist()} are neither local to nor inside "
+                f"frames {start}-{stop - 1} of this call"
+            )
+    else:
+        frame_ids = frame_ids + int(start)
+    return {
+        "extrinsic": extrinsic_w2c.astype(np.float32),
+        "intrinsic": intrinsic.astype(np.float32),
+        "depth": depth.astype(np.float32),
+        "conf": conf.astype(np.float32),
+        "output_frame_ids": frame_ids,
+        "image_hw": np.asarray([int(h), int(w)], dtype=np.int64),
+    }
+
+
 def _resolve_r3_device(verbose: bool = True) -> "torch.device":
     """
     Resolve R3 device with an experimental MPS option.
@@ -390,8 +459,20 @@ def run_r3(
     metric_model_name: str = "depth-anything/DA3METRIC-LARGE",
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
+    checkpoint_every: int | None = None,
+    resume: bool = False,
+    cpu_quantize: str | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
+    """
+    Run R3 online inference on the frames in ``image_path``.
+
+    ``checkpoint_every`` > 0 feeds the frames to R3 in segments of that many, keeping
+    its online state between calls, and checkpoints the state, processed frame ids
+    and outputs after each segment (``stream_checkpoint``). ``resume=True`` continues
+    an interrupted run with the same inputs and settings from its last checkpoint.
+    """
     if not ensure_dependencies(verbose):
         reason = macos_experimental_reason()
         if reason is not None:
@@ -407,7 +488,6 @@ def run_r3(
     from R3.models.r3 import R3 as DA3Wrapper
     from R3.utils.config_resolve import resolve_model_config
     from R3.utils.input_io import prepare_image_views
-    from R3.utils.pose_enc import pose_encoding_to_extri_intri
     from depth_anything_3.utils.geometry import affine_inverse  # noqa: F401  (parity with infer.py)
 
     resolved_mode = resolve_mode(mode)
@@ -419,6 +499,7 @@ def run_r3(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label="R3",
     )
@@ -461,9 +542,32 @@ def run_r3(
     )
     if verbose:
         print(f"--- [vibephysics] Building R3 model (checkpoint: {ckpt}) ---", flush=True)
-    model = DA3Wrapper(**model_kwargs).to(device)
-    _load_state_dict(model, str(ckpt), device)
-    model.eval()
+    cpu_quantize = resolve_cpu_quantize(cpu_quantize, device.type, verbose=verbose)
+
+    def _load_model():
+        model = cpu_quantized_model(
+            lambda: DA3Wrapper(**model_kwargs).to(device),
+            load_weights=lambda model: _load_state_dict(model, str(ckpt), device),
+            cpu_quantize=cpu_quantize,
+            checkpoint=ckpt,
+            cache_dir=Path(ckpt).parent,
+            variant=(str(model_config["config"]), sorted(model_kwargs.items())),
+            verbose=verbose,
+        )
+        return model.eval()
+
+    model = pooled_model(
+        (
+            "r3",
+            str(ckpt),
+            str(model_config["config"]),
+            repr(sorted(model_kwargs.items())),
+            str(device),
+            cpu_quantize,
+        ),
+        _load_model,
+        verbose=verbose,
+    )
 
     views = prepare_image_views(str_paths, image_size, revisit=0, update=True)
     # Save un-normalized RGB before the model applies ImageNet normalization.
@@ -490,6 +594,23 @@ def run_r3(
     if verbose:
         print(f"--- [vibephysics] R3 online inference on {len(views)} frames ---", flush=True)
 
+    store = None
+    if checkpoint_every and checkpoint_every > 0:
+        from ..inference_cache import inference_cache_key
+
+        identity_settings = {
+            "checkpoint": str(ckpt),
+            "config": str(model_config["config"]),
+            "model_kwargs": sorted(model_kwargs.items()),
+            "image_size": image_size,
+            "forward_kwargs": forward_kwargs,
+            "cpu_quantize": cpu_quantize,
+            "checkpoint_every": int(checkpoint_every),
+        }
+        store = StreamCheckpoint("r3", inference_cache_key("r3", identity_settings, selected))
+    elif resume and verbose:
+        print("--- [vibephysics] Warning: resume needs r3.checkpoint_every > 0; starting at frame 0 ---")
+
     with torch.no_grad():
         if device.type == "cuda":
             autocast_ctx = torch.autocast("cuda", dtype=torch.bfloat16)
@@ -499,25 +620,26 @@ def run_r3(
             autocast_ctx = nullcontext()
         with autocast_ctx:
             model.clear_online_state()
-            predictions = model(views, **forward_kwargs)
-
-    h, w = predictions["images"].shape[-2:]
-    extrinsic_t, intrinsic_t = pose_encoding_to_extri_intri(predictions["pose_enc"], (h, w))
-
-    extrinsic_w2c = to_numpy(extrinsic_t[0])  # [S, 4, 4] (or [S, 3, 4])
-    if extrinsic_w2c.ndim == 3 and extrinsic_w2c.shape[-2:] == (4, 4):
-        extrinsic_w2c = extrinsic_w2c[:, :3, :4]
-    intrinsic = to_numpy(intrinsic_t[0])
-
-    depth = to_numpy(predictions["depth"][0])  # [S, H, W, 1]
-    if depth.ndim == 4:
-        depth = depth[..., 0]
-    conf = to_numpy(predictions["depth_conf"][0])  # [S, H, W]
-
-    num_out = depth.shape[0]
-    output_frame_ids = [int(fid) for fid in predictions.get("output_frame_ids", range(num_out))]
-    if len(output_frame_ids) != num_out:
-        output_frame_ids = list(range(num_out))
+            segments = run_segments(
+                len(views),
+                lambda start, stop: _prediction_outputs(model(views[start:stop], **forward_kwargs), start=start, stop=stop),
+                every=checkpoint_every,
+                checkpoint=store,
+                resume=resume,
+                snapshot=lambda: _online_state(model),
+                restore=lambda state: _restore_online_state(model, state),
+                verbose=verbose,
+            )
+
+    h, w = (int(value) for value in segments[0]["image_hw"])
+    merged = {
+        key: np.concatenate([segment[key] for segment in segments]) for key in segments[0] if key != "image_hw"
+    }
+    extrinsic_w2c = merged["extrinsic"]
+    intrinsic = merged["intrinsic"]
+    depth = merged["depth"]
+    conf = merged["conf"]
+    output_frame_ids = [int(fid) for fid in merged["output_frame_ids"]]
 
     rgb = np.stack(
         [np.clip(original_imgs[src], 0.0, 1.0) for src in output_frame_ids],
@@ -549,12 +671,14 @@ def run_r3(
             "kv_backend": kv_backend,
             "rel_pose_method": rel_pose_method,
             "metric_scale": preset["metric_scale"],
-            "num_frames": num_out,
+            "num_frames": len(output_frame_ids),
             "input_num_frames": input_num_frames,
             "selected_indices": indices,
             "output_frame_ids": output_frame_ids,
+            "checkpoint_every": int(checkpoint_every or 0),
             "max_frames_mode": max_frames_mode,
             "inference_device": device.type,
+            "cpu_quantize": cpu_quantize,
             "vram_gb": get_vram_gb(),
             "input_hw": [int(h), int(w)],
             "w2c_as_camera_pose": False,
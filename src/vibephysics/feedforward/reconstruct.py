@@ -4,29 +4,26 @@ from __future__ import annotations
 
 import ctypes
 import json
+import math
 import os
 import subprocess
 import sys
 import threading
 import time
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
-
-try:
-    import torch  # noqa: F401
-    import torchvision  # noqa: F401
-except ImportError:
-    pass
+from typing import Any, Callable, Iterator
 
 from .common import (
     DEFAULT_LINGBOT_MAP_MODEL,
     DEFAULT_VIDEO_FPS,
     IMAGE_EXTENSIONS,
     VIDEO_EXTRACT_FPS_FILE,
+    apply_cpu_thread_plan,
     discover_images,
+    format_cpu_thread_plan,
     get_vram_gb,
     is_dvlt_engine,
     is_lingbot_map_engine,
@@ -34,10 +31,17 @@ from .common import (
     is_vgg_ttt_engine,
     is_vggt_omega_engine,
     persist_preprocessed_frames,
+    plan_cpu_threads,
     resolve_confidence_threshold,
 )
-from .config import FEEDFORWARD_ENGINES
+from .config import FEEDFORWARD_ENGINES, MAX_FRAMES_MODES, normalize_animation_mode
 from .schema import save_compact_prediction, save_prediction, save_reconstruct_config
+from .video_source import (
+    VIDEO_DECODE_MODES,
+    VideoFrameSource,
+    engine_streams_frames,
+    normalize_video_decode,
+)
 
 VIDEO_EXTENSIONS = {".mov", ".mp4", ".avi", ".mkv", ".webm", ".m4v", ".MOV", ".MP4", ".MKV", ".WEBM", ".M4V"}
 
@@ -149,13 +153,139 @@ def _log_reusing_frames(
         )
 
 
+# Less video than this per worker does not pay for another ffmpeg process (seek + warm-up).
+_MIN_EXTRACT_SEGMENT_SECONDS = 10.0
+# Each segment decodes from this far before its first output tick, so the source frame
+# shown at that tick (the latest one at or before it) is always decoded.
+_EXTRACT_SEEK_MARGIN_SECONDS = 1.0
+
+
+def resolve_extract_workers(workers: int | None, duration: float | None, fps: float) -> int:
+    """
+    ffmpeg processes for one extraction: ``workers`` when positive, else (0 / None = auto)
+    one per ``_MIN_EXTRACT_SEGMENT_SECONDS`` of video, up to half the CPUs.
+    Unknown duration always extracts serially.
+    """
+    if duration is None or duration <= 0:
+        return 1
+    total_ticks = max(int(duration * fps), 1)
+    if workers is None or int(workers) <= 0:
+        by_duration = max(1, int(duration // _MIN_EXTRACT_SEGMENT_SECONDS))
+        workers = min(by_duration, max(1, (os.cpu_count() or 1) // 2))
+    return max(1, min(int(workers), total_ticks))
+
+
+def plan_extract_segments(duration: float, fps: float, workers: int) -> list[tuple[int, int | None]]:
+    """Contiguous output-frame ranges ``[start, end)`` (0-based); the last one is open-ended."""
+    total_ticks = max(int(duration * fps), 1)
+    workers = max(1, min(int(workers), total_ticks))
+    bounds = [round(k * total_ticks / workers) for k in range(workers)]
+    return [(bounds[k], bounds[k + 1] if k + 1 < workers else None) for k in range(workers)]
+
+
+def _ffmpeg_extract_command(
+    video_path: Path,
+    output_pattern: Path,
+    fps: float,
+    quality: int,
+    *,
+    threads: int | None = None,
+    segment: tuple[int, int | None] | None = None,
+) -> list[str]:
+    """
+    ffmpeg command for the whole video, or for one ``segment`` of output frames.
+
+    A segment seeks (keyframe + accurate decode) to a whole number of output ticks
+    before its start, so the ``fps`` filter rounds source timestamps on the same tick
+    grid as a serial run; ``trim`` then keeps exactly its ticks and ``-start_number``
+    continues the shared ``frame_%04d.jpg`` numbering.
+    """
+    cmd = ["ffmpeg"]
+    if threads:
+        cmd.extend(["-threads", str(int(threads))])
+    vf_parts = [f"fps={fps}"]
+    if segment is not None:
+        start, end = segment
+        seek_tick = max(0, start - math.ceil(_EXTRACT_SEEK_MARGIN_SECONDS * fps) - 1)
+        if seek_tick:
+            cmd.extend(["-ss", f"{seek_tick / fps:.6f}"])
+        trim = f"trim=start_pts={start - seek_tick}"
+        if end is not None:
+            trim += f":end_pts={end - seek_tick}"
+        vf_parts.extend([trim, "setpts=PTS-STARTPTS"])
+    cmd.extend(["-i", str(video_path), "-q:v", str(quality), "-vf", ",".join(vf_parts)])
+    if segment is not None:
+        cmd.extend(["-start_number", str(segment[0] + 1)])
+    cmd.extend([str(output_pattern), "-y"])
+    return cmd
+
+
+def _run_ffmpeg(cmd: list[str], video_path: Path, *, capture_output: bool) -> None:
+    try:
+        subprocess.run(cmd, check=True, capture_output=capture_output)
+    except FileNotFoundError as exc:
+        raise RuntimeError("ffmpeg not found. Install ffmpeg to use video input.") from exc
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"ffmpeg failed to extract frames from {video_path}") from exc
+
+
+def _frames_contiguous(frames: list[Path]) -> bool:
+    try:
+        numbers = sorted(int(path.stem.rsplit("_", 1)[-1]) for path in frames)
+    except ValueError:
+        return False
+    return numbers == list(range(1, len(numbers) + 1))
+
+
+def _extract_segments_parallel(
+    video_path: Path,
+    output_pattern: Path,
+    fps: float,
+    quality: int,
+    segments: list[tuple[int, int | None]],
+    *,
+    threads: int | None,
+    verbose: bool,
+) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Split the thread budget so N workers do not each start one thread per core.
+    budget = int(threads) if threads else (os.cpu_count() or 1)
+    per_worker = max(1, budget // len(segments))
+    commands = [
+        _ffmpeg_extract_command(
+            video_path, output_pattern, fps, quality, threads=per_worker, segment=segment
+        )
+        for segment in segments
+    ]
+    if verbose:
+        for cmd in commands:
+            print(f"Running: {' '.join(cmd)}")
+    with ThreadPoolExecutor(max_workers=len(commands), thread_name_prefix="vibephysics-ffmpeg") as pool:
+        futures = [pool.submit(_run_ffmpeg, cmd, video_path, capture_output=True) for cmd in commands]
+        for future in futures:
+            future.result()
+
+
 def extract_video_frames(
     video_path: Path,
     output_dir: Path | None = None,
     fps: float | None = None,
     quality: int = 2,
     verbose: bool = True,
+    *,
+    workers: int | None = 1,
+    threads: int | None = None,
 ) -> Path:
+    """
+    Extract ``frame_%04d.jpg`` at ``fps`` with ffmpeg.
+
+    ``workers`` > 1 (or 0 = auto) splits the video into time segments extracted by
+    parallel ffmpeg processes; numbering and frame count match the serial run, which
+    is used as fallback when the segments do not line up. ``threads`` caps the total
+    ffmpeg threads (default: ffmpeg's own choice serially, CPU count split across
+    workers in parallel).
+    """
     video_path = Path(video_path).absolute()
     if output_dir is None:
         output_dir = default_video_frames_dir(video_path)
@@ -171,26 +301,42 @@ def extract_video_frames(
         raise FileNotFoundError(f"Video file does not exist: {video_path}")
 
     output_dir.mkdir(parents=True, exist_ok=True)
-
     output_pattern = output_dir / "frame_%04d.jpg"
-    vf_parts = [f"fps={extract_fps}"]
-    cmd = ["ffmpeg", "-i", str(video_path), "-q:v", str(quality)]
-    if vf_parts:
-        cmd.extend(["-vf", ",".join(vf_parts)])
-    cmd.extend([str(output_pattern), "-y"])
 
-    if verbose:
-        print(f"--- [vibephysics] Extracting frames from {video_path.name} at {extract_fps:g} fps ---")
-        print(f"Running: {' '.join(cmd)}")
+    num_workers = 1
+    if workers is None or int(workers) != 1:
+        from .common import probe_video_duration
 
-    try:
-        subprocess.run(cmd, check=True, capture_output=not verbose)
-    except FileNotFoundError as exc:
-        raise RuntimeError("ffmpeg not found. Install ffmpeg to use video input.") from exc
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"ffmpeg failed to extract frames from {video_path}") from exc
+        duration = probe_video_duration(video_path)
+        num_workers = resolve_extract_workers(workers, duration, extract_fps)
+
+    extracted: list[Path] = []
+    if num_workers > 1:
+        segments = plan_extract_segments(duration, extract_fps, num_workers)
+        if verbose:
+            print(
+                f"--- [vibephysics] Extracting frames from {video_path.name} at {extract_fps:g} fps "
+                f"with {len(segments)} parallel ffmpeg workers ---"
+            )
+        _extract_segments_parallel(
+            video_path, output_pattern, extract_fps, quality, segments, threads=threads, verbose=verbose
+        )
+        extracted = sorted(output_dir.glob("frame_*.jpg"))
+        if not _frames_contiguous(extracted):
+            if verbose:
+                print("--- [vibephysics] Parallel extraction left gaps in frame numbering; re-extracting serially ---")
+            for path in extracted:
+                path.unlink()
+            extracted = []
+
+    if not extracted:
+        cmd = _ffmpeg_extract_command(video_path, output_pattern, extract_fps, quality, threads=threads)
+        if verbose:
+            print(f"--- [vibephysics] Extracting frames from {video_path.name} at {extract_fps:g} fps ---")
+            print(f"Running: {' '.join(cmd)}")
+        _run_ffmpeg(cmd, video_path, capture_output=not verbose)
+        extracted = sorted(output_dir.glob("frame_*.jpg"))
 
-    extracted = sorted(output_dir.glob("frame_*.jpg"))
     if not extracted:
         raise RuntimeError(f"No frames extracted from {video_path}")
     write_extract_fps(output_dir, extract_fps)
@@ -199,14 +345,56 @@ def extract_video_frames(
     return output_dir
 
 
+def _prepare_streamed_video(
+    video_path: Path,
+    *,
+    video_fps: float | None,
+    video_quality: int,
+    video_backend: str,
+    persist_frames: bool,
+    verbose: bool,
+) -> tuple[Path, VideoFrameSource | None]:
+    """
+    ``video.decode: stream`` input: (video path, frame source) for in-process decoding,
+    or (frames dir, None) after decoding to JPEGs when they must be persisted.
+    """
+    target_dir = default_video_frames_dir(video_path)
+    extract_fps = DEFAULT_VIDEO_FPS if video_fps is None else float(video_fps)
+    existing_images = existing_frames_in_dir(target_dir)
+    if existing_images is not None:
+        _log_reusing_frames(target_dir, len(existing_images), extract_fps, verbose)
+        return target_dir, None
+
+    source = VideoFrameSource(video_path, extract_fps, backend=video_backend)
+    if persist_frames:
+        return source.persist_jpegs(target_dir, quality=video_quality, verbose=verbose), None
+    if verbose:
+        print(
+            f"--- [vibephysics] Streaming {len(source)} frames from {video_path.name} at "
+            f"{extract_fps:g} fps ({source.backend}; no JPEG extraction) ---",
+            flush=True,
+        )
+    return video_path, source
+
+
 def resolve_input(
     input_path: str | Path,
     video_fps: float | None = None,
     video_quality: int = 2,
     frames_dir: Path | None = None,
     verbose: bool = True,
+    *,
+    extract_workers: int | None = 1,
+    extract_threads: int | None = None,
+    frame_cache: bool = True,
+    frame_cache_gb: float | None = None,
 ) -> Path:
-    """Resolve feedforward input to an image folder or single image path."""
+    """
+    Resolve feedforward input to an image folder or single image path.
+
+    With ``frame_cache`` video frames come from the shared extraction cache
+    (``frame_cache.py``), validated against the video content, fps and quality.
+    """
     input_path = Path(input_path).absolute()
 
     if input_path.is_dir():
@@ -219,17 +407,39 @@ def resolve_input(
         target_dir = Path(frames_dir).absolute() if frames_dir else default_video_frames_dir(input_path)
         extract_fps = DEFAULT_VIDEO_FPS if video_fps is None else float(video_fps)
         existing_images = existing_frames_in_dir(target_dir)
-        if existing_images is not None:
+        if existing_images is not None and not (frame_cache and input_path.is_file()):
             _log_reusing_frames(target_dir, len(existing_images), extract_fps, verbose)
             return target_dir
         if not input_path.is_file():
             raise FileNotFoundError(f"Video file does not exist: {input_path}")
+        if frame_cache:
+            from .frame_cache import DEFAULT_FRAME_CACHE_GB, cached_video_frames
+
+            return cached_video_frames(
+                input_path,
+                target_dir,
+                fps=extract_fps,
+                quality=video_quality,
+                extract=lambda output_dir: extract_video_frames(
+                    input_path,
+                    output_dir=output_dir,
+                    fps=extract_fps,
+                    quality=video_quality,
+                    verbose=verbose,
+                    workers=extract_workers,
+                    threads=extract_threads,
+                ),
+                max_gb=DEFAULT_FRAME_CACHE_GB if frame_cache_gb is None else frame_cache_gb,
+                verbose=verbose,
+            )
         return extract_video_frames(
             input_path,
             output_dir=target_dir,
             fps=video_fps,
             quality=video_quality,
             verbose=verbose,
+            workers=extract_workers,
+            threads=extract_threads,
         )
 
     if not input_path.exists():
@@ -366,18 +576,15 @@ class _MemorySampler:
 
 
 def reset_cuda_peak_memory() -> None:
-    try:
-        import torch
-    except ImportError:
-        return
-    if torch.cuda.is_available():
+    # Engines import torch themselves; no import here keeps torch-free engines (synthetic) light.
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
         torch.cuda.reset_peak_memory_stats()
 
 
 def cuda_peak_memory_bytes() -> int | None:
-    try:
-        import torch
-    except ImportError:
+    torch = sys.modules.get("torch")
+    if torch is None:
         return None
     if torch.cuda.is_available():
         return int(torch.cuda.max_memory_allocated())
@@ -396,18 +603,30 @@ class StageRecord:
 class RunProfiler:
     enabled: bool = True
     stages: list[StageRecord] = field(default_factory=list)
+    notes: dict[str, str] = field(default_factory=dict)
+    cpu_threads: dict[str, Any] | None = None
+    time_to_inference_start_s: float | None = None
+    total_elapsed_s: float | None = None
+    run_peak_rss_bytes: int | None = None
+    on_stage: Callable[[str], None] | None = field(default=None, repr=False)
     _total_sampler: _MemorySampler | None = field(default=None, repr=False)
     _total_started_at: float | None = field(default=None, repr=False)
+    _probe_mark: int = field(default=0, repr=False)
 
     def start(self) -> None:
         if not self.enabled:
             return
+        from .probe_cache import probe_event_count
+
+        self._probe_mark = probe_event_count()
         self._total_started_at = time.perf_counter()
         self._total_sampler = _MemorySampler()
         self._total_sampler.start()
 
     @contextmanager
     def stage(self, name: str, *, track_cuda_peak: bool = False) -> Iterator[None]:
+        if self.on_stage is not None:
+            self.on_stage(name)
         if not self.enabled:
             yield
             return
@@ -432,11 +651,75 @@ class RunProfiler:
                 )
             )
 
-    def record_stage(self, name: str, elapsed_s: float) -> None:
-        """Append a timed stage (e.g. estimated CPU time from parallel work)."""
+    def record_stage(self, name: str, elapsed_s: float, *, peak_rss_bytes: int | None = None) -> None:
+        """Append a timed stage (e.g. estimated CPU time from parallel work, or an engine window)."""
         if not self.enabled:
             return
-        self.stages.append(StageRecord(name=name, elapsed_s=float(elapsed_s)))
+        self.stages.append(StageRecord(name=name, elapsed_s=float(elapsed_s), peak_rss_bytes=peak_rss_bytes))
+
+    def run_elapsed_s(self) -> float | None:
+        """Seconds since :meth:`start` (``None`` when disabled or not started)."""
+        if not self.enabled or self._total_started_at is None:
+            return None
+        return time.perf_counter() - self._total_started_at
+
+    def note(self, label: str, value: str) -> None:
+        """Attach a one-line fact (e.g. cache hit/miss) to the run summary."""
+        if not self.enabled:
+            return
+        self.notes[label] = str(value)
+
+    def finish(self) -> None:
+        """Stop the run-level RSS sampler and freeze total wall time / peak RSS."""
+        if not self.enabled or self.total_elapsed_s is not None:
+            return
+        total_elapsed = sum(stage.elapsed_s for stage in self.stages)
+        if self._total_started_at is not None:
+            total_elapsed = time.perf_counter() - self._total_started_at
+
+        run_peak_rss = max((stage.peak_rss_bytes or 0) for stage in self.stages) if self.stages else 0
+        if self._total_sampler is not None:
+            run_peak_rss = max(self._total_sampler.stop() or 0, run_peak_rss)
+            self._total_sampler = None
+        self.total_elapsed_s = total_elapsed
+        self.run_peak_rss_bytes = run_peak_rss or None
+
+    def append_history(
+        self,
+        *,
+        engine: str,
+        num_frames: int,
+        height: int | None,
+        width: int | None,
+        inference_cache_hit: bool = False,
+    ) -> Path | None:
+        """Record this run's stage timings in the local run history (see ``run_history``)."""
+        if not self.enabled or not self.stages:
+            return None
+        from .run_history import append_run_record, current_device_and_threads, timestamp
+
+        self.finish()
+        stages: dict[str, float] = {}
+        for stage in self.stages:
+            stages[stage.name] = stages.get(stage.name, 0.0) + stage.elapsed_s
+        device, threads = current_device_and_threads()
+        return append_run_record(
+            {
+                "timestamp": timestamp(),
+                "engine": engine,
+                "device": device,
+                "threads": threads,
+                "cpu_threads": self.cpu_threads,
+                "time_to_inference_start_s": self.time_to_inference_start_s,
+                "num_frames": int(num_frames),
+                "height": height,
+                "width": width,
+                "inference_cache_hit": bool(inference_cache_hit),
+                "total_s": self.total_elapsed_s,
+                "peak_rss_bytes": self.run_peak_rss_bytes,
+                "stages": stages,
+            }
+        )
 
     def print_summary(
         self,
@@ -448,15 +731,9 @@ class RunProfiler:
         if not self.enabled or not self.stages:
             return
 
-        total_elapsed = sum(stage.elapsed_s for stage in self.stages)
-        if self._total_started_at is not None:
-            total_elapsed = time.perf_counter() - self._total_started_at
-
-        run_peak_rss = max((stage.peak_rss_bytes or 0) for stage in self.stages) or None
-        if self._total_sampler is not None:
-            run_peak_rss = self._total_sampler.stop()
-            run_peak_rss = max(run_peak_rss or 0, *(stage.peak_rss_bytes or 0 for stage in self.stages)) or None
-
+        self.finish()
+        total_elapsed = self.total_elapsed_s
+        run_peak_rss = self.run_peak_rss_bytes
         run_peak_vram = max((stage.peak_vram_bytes or 0) for stage in self.stages) or None
         show_vram = run_peak_vram is not None and run_peak_vram > 0
 
@@ -470,6 +747,11 @@ class RunProfiler:
         print(f"Engine:  {engine}")
         print(f"Frames:  {num_frames}")
         print(f"Output:  {output_path}")
+        for label, value in self.notes.items():
+            print(f"{label}: {value}")
+        if self.time_to_inference_start_s is not None:
+            print(f"Time to inference start: {_format_seconds(self.time_to_inference_start_s)}")
+        self._print_startup_probes()
         print()
         if show_vram:
             header = (
@@ -509,15 +791,27 @@ class RunProfiler:
         print("Peak memory is the high-water mark for this Python process — not summed across stages.")
         print()
 
+    def _print_startup_probes(self) -> None:
+        """Device / dependency probes of this run and where each answer came from."""
+        from .probe_cache import probe_events
 
-_INSTALL_HINTS = {
-    "lingbot_map": "pip install vibephysics (deps auto-install on first run)",
-    "vggt_omega": "pip install vibephysics (deps auto-install on first run; HF access required)",
-    "vgg_ttt": "pip install vibephysics (deps auto-install on first run)",
-    "map_anything": "pip install vibephysics (deps auto-install on first run)",
-    "r3": "pip install vibephysics (deps auto-install on first run; CUDA + xformers required)",
-    "dvlt": "pip install vibephysics (deps auto-install on first run; CUDA recommended)",
-}
+        events = probe_events(self._probe_mark)
+        if not events:
+            return
+        first: dict[str, tuple[str, float]] = {}
+        reuses: dict[str, int] = {}
+        for event in events:
+            if event.name in first:
+                reuses[event.name] = reuses.get(event.name, 0) + 1
+            else:
+                first[event.name] = (event.source, event.elapsed_s)
+        name_width = max(len(name) for name in first)
+        print("Startup probes:")
+        for name, (source, elapsed_s) in first.items():
+            line = f"  {name:<{name_width}}  {source:<6}  {_format_seconds(elapsed_s):>8}"
+            if reuses.get(name):
+                line += f"  (+{reuses[name]} cached lookups)"
+            print(line)
 
 
 def _precomputed_points_from_post(
@@ -539,6 +833,24 @@ def _precomputed_points_from_post(
     )
 
 
+# bpy scene state is process-global; serialize .blend exports when reconstruct runs in threads.
+_BPY_EXPORT_LOCK = threading.Lock()
+
+
+@contextmanager
+def _hold_inference_lane(lane: threading.Lock | None, profiler: RunProfiler) -> Iterator[None]:
+    """Serialize model work on a shared lane (batch / serve) and time the wait."""
+    if lane is None:
+        yield
+        return
+    with profiler.stage("inference_lane_wait"):
+        lane.acquire()
+    try:
+        yield
+    finally:
+        lane.release()
+
+
 def _require_bpy() -> None:
     try:
         import bpy  # noqa: F401
@@ -646,42 +958,12 @@ def _export_plotly_html(
     return html_path
 
 
-def _engine_available(engine: str) -> bool:
-    if engine == "lingbot_map":
-        from .lingbot_map import is_available
-
-        return is_available()
-    if engine == "vggt_omega":
-        from .vggt_omega import is_available
-
-        return is_available()
-    if engine == "vgg_ttt":
-        from .vgg_ttt import is_available
-
-        return is_available()
-    if engine == "map_anything":
-        from .map_anything import is_available
-
-        return is_available()
-    if engine == "r3":
-        from .r3 import is_available
-
-        return is_available()
-    if engine == "dvlt":
-        from .dvlt import is_available
-
-        return is_available()
-    return False
+def _ensure_engine(engine: str) -> None:
+    from .engines import get_engine
 
-
-def _ensure_engine(engine: str, vggt_omega_checkpoint: str | Path | None) -> None:
-    if engine not in FEEDFORWARD_ENGINES:
-        raise ValueError(f"Unknown engine '{engine}'. Choose one of: {', '.join(FEEDFORWARD_ENGINES)}")
-
-    if not _engine_available(engine):
-        raise RuntimeError(
-            f"Engine '{engine}' is not available. Install with: {_INSTALL_HINTS[engine]}"
-        )
+    spec = get_engine(engine)
+    if not spec.available():
+        raise RuntimeError(f"Engine '{engine}' is not available. Install with: {spec.install_hint}")
 
 
 def reconstruct(
@@ -707,6 +989,8 @@ def reconstruct(
     point_cloud_3d_nms: bool | None = None,
     point_cloud_3d_nms_radius: float | None = None,
     point_cloud_3d_nms_min_neighbors: int | None = None,
+    pipelined_postprocess: bool = False,
+    memory_budget_gb: float | None = None,
     algo_3d_bbox: bool = False,
     algo_3d_bbox_reference_frame: int = 0,
     algo_3d_bbox_voxel_size: float = 0.02,
@@ -730,6 +1014,8 @@ def reconstruct(
     detection_seg_save_masks: bool = True,
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    adaptive_motion_threshold: float | None = None,
+    adaptive_blur_reject: float = 0.5,
     keyframe_interval: int | None = None,
     lingbot_map_max_streaming_keyframes: int | None = None,
     lingbot_map_mode: str | None = None,
@@ -749,6 +1035,8 @@ def reconstruct(
     vggt_omega_enable_alignment: bool = False,
     vggt_omega_conf_percentile: float = 50.0,
     vggt_omega_depth_edge_rtol: float = 0.03,
+    vggt_omega_chunk_size: int | None = None,
+    vggt_omega_chunk_overlap: int = 8,
     vgg_ttt_model_id: str = "nvidia/vgg-ttt",
     vgg_ttt_preprocess_mode: str = "crop",
     vgg_ttt_image_size: int = 518,
@@ -764,6 +1052,9 @@ def reconstruct(
     map_anything_patch_size: int | None = None,
     map_anything_resize_mode: str = "fixed_mapping",
     map_anything_size: int | tuple[int, int] | None = None,
+    map_anything_window_size: int | None = None,
+    map_anything_window_stride: int | None = None,
+    map_anything_anchor_frames: int = 4,
     r3_checkpoint: str | Path | None = None,
     r3_model: str | None = None,
     r3_config_name: str = "r3-large",
@@ -772,15 +1063,40 @@ def reconstruct(
     r3_kv_backend: str = "dense",
     r3_rel_pose_method: str = "greedy",
     r3_metric_model_name: str = "depth-anything/DA3METRIC-LARGE",
+    r3_checkpoint_every: int | None = None,
+    r3_resume: bool = False,
     dvlt_checkpoint: str | Path = "nvidia/dvlt",
     dvlt_img_size: int = 504,
     dvlt_patch_size: int = 14,
     dvlt_conf_percentile: float = 50.0,
     dvlt_depth_edge_rtol: float = 0.03,
+    synthetic_height: int = 240,
+    synthetic_width: int = 320,
+    synthetic_latency_per_frame: float = 0.0,
+    synthetic_num_boxes: int = 3,
+    synthetic_seed: int = 0,
+    synthetic_depth_noise: float = 0.002,
+    synthetic_scene_scale: float = 0.25,
     video_fps: float | None = None,
     video_quality: int = 2,
+    video_decode: str = "ffmpeg",
+    video_backend: str = "auto",
+    video_persist_frames: bool = True,
+    video_extract_workers: int | None = 1,
+    video_threads: int | None = None,
+    video_frame_cache: bool = True,
+    video_frame_cache_gb: float | None = None,
+    inference_cache: bool = True,
+    force_inference: bool = False,
+    cpu_quantize: str | None = None,
+    cpu_threads: int | None = None,
+    inference_lane: threading.Lock | None = None,
+    engine_settings: dict | None = None,
+    profiler: RunProfiler | None = None,
     verbose: bool = True,
 ) -> Path:
+    # Snapshot of the call: engine specs map these kwargs to their run settings.
+    call_kwargs = dict(locals())
     from .config import (
         algo_3d_bbox_default,
         blend_default,
@@ -817,8 +1133,6 @@ def reconstruct(
             output_default("total_random_points"),
             name="output.total_random_points",
         )
-    from .visual import _normalize_animation_mode
-
     if algo_3d_bbox_min_visualize_changed_voxels is None:
         algo_3d_bbox_min_visualize_changed_voxels = int(
             algo_3d_bbox_default("min_visualize_changed_voxels")
@@ -830,140 +1144,182 @@ def reconstruct(
     if point_cloud_3d_nms_min_neighbors is None:
         point_cloud_3d_nms_min_neighbors = int(output_default("point_cloud_3d_nms_min_neighbors"))
 
-    animation_mode = _normalize_animation_mode(animation_mode)
-    profiler = RunProfiler(enabled=verbose)
+    animation_mode = normalize_animation_mode(animation_mode)
+    if profiler is None:
+        from .run_history import run_history_enabled
+
+        # Quiet runs still profile so the run history (and ``estimate``) learns from them.
+        profiler = RunProfiler(enabled=verbose or run_history_enabled())
     profiler.start()
 
     source_path = Path(image_path).absolute()
+    frame_source = None
     with profiler.stage("prepare_input"):
-        image_path = resolve_input(
-            source_path,
-            video_fps=video_fps,
-            video_quality=video_quality,
-            verbose=verbose,
-        )
-        all_images = discover_images(image_path)
+        if normalize_video_decode(video_decode) == "stream" and looks_like_video_path(source_path):
+            image_path, frame_source = _prepare_streamed_video(
+                source_path,
+                video_fps=video_fps,
+                video_quality=video_quality,
+                video_backend=video_backend,
+                persist_frames=video_persist_frames
+                or not engine_streams_frames(engine, lingbot_map_preprocess_mode=lingbot_map_preprocess_mode),
+                verbose=verbose,
+            )
+        else:
+            image_path = resolve_input(
+                source_path,
+                video_fps=video_fps,
+                video_quality=video_quality,
+                verbose=verbose,
+                extract_workers=video_extract_workers,
+                extract_threads=video_threads,
+                frame_cache=video_frame_cache,
+                frame_cache_gb=video_frame_cache_gb,
+            )
+        all_images = frame_source.frame_paths() if frame_source is not None else discover_images(image_path)
         num_frames = len(all_images)
         source_video_fps = resolve_source_video_fps(image_path, video_fps)
 
     vram_gb = get_vram_gb()
-    _ensure_engine(engine, vggt_omega_checkpoint)
 
     if verbose:
         print(f"--- [vibephysics] Engine: {engine} ({num_frames} frames) ---")
-        if engine == "lingbot_map":
-            from .lingbot_map import format_inference_plan
-
-            print(
-                f"--- [vibephysics] {format_inference_plan(num_frames, mode=lingbot_map_mode, keyframe_interval=keyframe_interval, max_streaming_keyframes=lingbot_map_max_streaming_keyframes, vram_gb=vram_gb, window_size=window_size, overlap_size=overlap_size)} ---"
-            )
 
-    with profiler.stage("inference", track_cuda_peak=True):
-        if engine == "lingbot_map":
-            from .lingbot_map import run_lingbot_map
-
-            prediction = run_lingbot_map(
-                image_path=image_path,
-                model_path=Path(lingbot_map_checkpoint) if lingbot_map_checkpoint else None,
-                model_name=lingbot_map_model,
-                mode=lingbot_map_mode,
-                keyframe_interval=keyframe_interval,
-                max_streaming_keyframes=lingbot_map_max_streaming_keyframes,
-                window_size=window_size,
-                overlap_size=overlap_size,
-                overlap_keyframes=overlap_keyframes,
-                use_sdpa=use_sdpa,
-                image_size=lingbot_map_image_size,
-                preprocess_mode=lingbot_map_preprocess_mode,
+    from .engines import get_engine, settings_for_engine
+
+    engine_spec = get_engine(engine)
+    engine_kwargs = settings_for_engine(engine_spec, call_kwargs)
+    # A shared inference lane (batch / serve) means other jobs post-process during our inference.
+    thread_plan = plan_cpu_threads(cpu_threads, overlap_postprocess=inference_lane is not None)
+    torch_threads = None
+    engine_kwargs["max_frames"] = max_frames
+    engine_kwargs["max_frames_mode"] = max_frames_mode
+    keyframe_selection = None
+    if max_frames_mode == "adaptive":
+        from .keyframes import select_keyframes
+
+        with profiler.stage("keyframe_selection"):
+            keyframe_selection = select_keyframes(
+                all_images,
+                frame_source=frame_source,
                 max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
+                motion_threshold=adaptive_motion_threshold,
+                blur_reject=adaptive_blur_reject,
                 verbose=verbose,
             )
-        elif engine == "vggt_omega":
-            from .vggt_omega import run_vggt_omega
-
-            prediction = run_vggt_omega(
-                image_path=image_path,
-                checkpoint=vggt_omega_checkpoint,
-                checkpoint_name=vggt_omega_checkpoint_name,
-                image_resolution=vggt_omega_resolution,
-                preprocess_mode=vggt_omega_preprocess_mode,
-                enable_alignment=vggt_omega_enable_alignment,
-                max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
-                filter_depth_edges=filter_edges,
-                depth_edge_rtol=vggt_omega_depth_edge_rtol,
-                conf_percentile=vggt_omega_conf_percentile,
-                verbose=verbose,
+        engine_kwargs["frame_indices"] = keyframe_selection.indices
+
+    prediction = None
+    cache_key = None
+    cache_hit = False
+    if inference_cache:
+        from .inference_cache import inference_cache_key, load_cached_prediction
+
+        with profiler.stage("inference_cache_lookup"):
+            cache_key = inference_cache_key(
+                engine,
+                engine_kwargs,
+                all_images,
+                frame_keys=frame_source.frame_keys() if frame_source is not None else None,
             )
-        elif engine == "vgg_ttt":
-            from .vgg_ttt import run_vgg_ttt
-
-            prediction = run_vgg_ttt(
-                image_path=image_path,
-                model_id=vgg_ttt_model_id,
-                preprocess_mode=vgg_ttt_preprocess_mode,
-                image_size=vgg_ttt_image_size,
-                max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
-                filter_depth_edges=filter_edges,
-                depth_edge_rtol=vgg_ttt_depth_edge_rtol,
-                conf_percentile=vgg_ttt_conf_percentile,
-                num_ttt_steps=vgg_ttt_num_ttt_steps,
-                memory_efficient_inference=vgg_ttt_memory_efficient_inference,
-                verbose=verbose,
+            if not force_inference:
+                prediction = load_cached_prediction(cache_key, all_images)
+        cache_hit = prediction is not None
+        if cache_hit:
+            profiler.note("Inference cache", f"hit ({cache_key[:12]})")
+            if verbose:
+                print(
+                    f"--- [vibephysics] Reusing cached {engine} inference ({cache_key[:12]}); "
+                    "pass --force-inference to re-run the model ---",
+                    flush=True,
+                )
+        else:
+            profiler.note(
+                "Inference cache",
+                "bypassed (--force-inference)" if force_inference else "miss",
             )
-        elif engine == "map_anything":
-            from .map_anything import run_map_anything
-
-            prediction = run_map_anything(
-                image_path=image_path,
-                model_name=map_anything_model,
-                model_kwargs=map_anything_model_kwargs,
-                install_all_extras=map_anything_install_all,
-                resolution=map_anything_resolution,
-                norm_type=map_anything_norm_type,
-                patch_size=map_anything_patch_size,
-                resize_mode=map_anything_resize_mode,
-                size=map_anything_size,
-                max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
-                verbose=verbose,
+
+    if prediction is None:
+        _ensure_engine(engine)
+
+        if verbose and engine == "lingbot_map":
+            from .lingbot_map import format_inference_plan
+
+            print(
+                f"--- [vibephysics] {format_inference_plan(num_frames, mode=lingbot_map_mode, keyframe_interval=keyframe_interval, max_streaming_keyframes=lingbot_map_max_streaming_keyframes, vram_gb=vram_gb, window_size=window_size, overlap_size=overlap_size)} ---"
             )
-        elif engine == "r3":
-            from .r3 import run_r3
-
-            prediction = run_r3(
-                image_path=image_path,
-                checkpoint=r3_checkpoint,
-                model_name=r3_model,
-                config_name=r3_config_name,
-                mode=r3_mode,
-                image_size=r3_image_size,
-                kv_backend=r3_kv_backend,
-                rel_pose_method=r3_rel_pose_method,
-                metric_model_name=r3_metric_model_name,
-                max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
-                verbose=verbose,
+        if verbose:
+            from .memory_plan import expected_frame_size, fit_memory_budget, format_memory_plan
+
+            height, width = expected_frame_size(engine, engine_kwargs)
+            expected_plan = fit_memory_budget(
+                num_frames,
+                height,
+                width,
+                memory_budget_gb=memory_budget_gb,
+                random_points_per_frame=random_points_per_frame,
+                total_random_points=total_random_points,
+                point_cloud_3d_nms=point_cloud_3d_nms,
+                algo_3d_bbox=algo_3d_bbox,
+                split_files=split_files,
             )
-        elif engine == "dvlt":
-            from .dvlt import run_dvlt
-
-            prediction = run_dvlt(
-                image_path=image_path,
-                checkpoint=dvlt_checkpoint,
-                img_size=dvlt_img_size,
-                patch_size=dvlt_patch_size,
-                max_frames=max_frames,
-                max_frames_mode=max_frames_mode,
-                filter_depth_edges=filter_edges,
-                depth_edge_rtol=dvlt_depth_edge_rtol,
-                conf_percentile=dvlt_conf_percentile,
-                verbose=verbose,
+            print(f"--- [vibephysics] {format_memory_plan(expected_plan, estimated_resolution=True)} ---")
+
+        @contextmanager
+        def model_lane() -> Iterator[None]:
+            nonlocal torch_threads
+            with _hold_inference_lane(inference_lane, profiler):
+                if getattr(engine_spec, "uses_torch", False) and vram_gb is None:
+                    torch_threads = apply_cpu_thread_plan(thread_plan)
+                yield
+
+        # Engines that take the lane decode frames while waiting for it; others wait first.
+        lane_in_engine = inference_lane is not None and getattr(engine_spec, "takes_inference_lane", False)
+        run_kwargs = {"inference_lane": model_lane} if lane_in_engine else {}
+        with nullcontext() if lane_in_engine else model_lane():
+            inference_offset_s = profiler.run_elapsed_s()
+            stage_mark = len(profiler.stages)
+            with profiler.stage("inference", track_cuda_peak=True):
+                prediction = engine_spec.run(
+                    image_path,
+                    engine_kwargs,
+                    frame_source=frame_source,
+                    verbose=verbose,
+                    **run_kwargs,
+                )
+        if lane_in_engine and profiler.enabled:
+            # The lane wait inside the run is its own stage; keep it out of "inference".
+            lane_wait_s = sum(
+                stage.elapsed_s for stage in profiler.stages[stage_mark:] if stage.name == "inference_lane_wait"
             )
-        else:
-            raise ValueError(f"Unknown engine: {engine}")
+            profiler.stages[-1].elapsed_s -= lane_wait_s
+        # Engines that pipeline decode into inference report when the model call started.
+        inference_start_s = prediction.metadata.get("time_to_inference_start_s")
+        if inference_start_s is not None and inference_offset_s is not None:
+            profiler.time_to_inference_start_s = inference_offset_s + float(inference_start_s)
+        if keyframe_selection is not None:
+            prediction.metadata["keyframe_selection"] = keyframe_selection.to_metadata()
+        windows = prediction.metadata.get("inference_windows") or []
+        if len(windows) > 1:
+            # Sub-rows of "inference" (excluded from the estimate model).
+            for index, window in enumerate(windows, start=1):
+                profiler.record_stage(
+                    f"inference[{index}/{len(windows)}] frames {window['start']}-{window['stop'] - 1}",
+                    window["elapsed_s"],
+                    peak_rss_bytes=window.get("peak_rss_bytes"),
+                )
+
+        if cache_key is not None:
+            from .inference_cache import save_cached_prediction
+
+            with profiler.stage("inference_cache_store"):
+                cache_file = save_cached_prediction(cache_key, prediction, all_images)
+            if verbose:
+                print(f"--- [vibephysics] Cached raw inference at {cache_file} ---", flush=True)
+
+    profiler.note("CPU threads", format_cpu_thread_plan(thread_plan, torch_threads=torch_threads))
+    if profiler.enabled:
+        profiler.cpu_threads = {**thread_plan.to_dict(), "torch_threads": torch_threads}
 
     export_min_confidence = min_confidence
     if is_vggt_omega_engine(prediction.engine):
@@ -996,254 +1352,333 @@ def reconstruct(
                     flush=True,
                 )
 
-    if align_ground:
-        from .ground_align import align_prediction_ground
-
-        with profiler.stage("ground_align"):
-            align_prediction_ground(prediction)
+    from .memory_plan import fit_memory_budget, format_memory_plan
+
+    height, width = (int(dim) for dim in prediction.world_points.shape[1:3])
+    memory_plan = fit_memory_budget(
+        int(prediction.world_points.shape[0]),
+        height,
+        width,
+        memory_budget_gb=memory_budget_gb,
+        arrays_bytes=sum(
+            int(array.nbytes)
+            for array in (prediction.world_points, prediction.depth, prediction.conf, prediction.images)
+            if array is not None
+        ),
+        random_points_per_frame=random_points_per_frame,
+        total_random_points=total_random_points,
+        point_cloud_3d_nms=point_cloud_3d_nms,
+        algo_3d_bbox=algo_3d_bbox,
+        split_files=split_files,
+    )
+    split_files = memory_plan.split_files
+    random_points_per_frame = memory_plan.random_points_per_frame
+    if memory_plan.budget_bytes is not None:
+        profiler.note("Memory plan", format_memory_plan(memory_plan).removeprefix("Memory plan: "))
+    if verbose and (memory_plan.adjustments or not memory_plan.fits):
+        print(f"--- [vibephysics] {format_memory_plan(memory_plan)} ---", flush=True)
+
+    frame_pipeline = None
+    if pipelined_postprocess and point_cloud_3d_nms:
+        if algo_3d_bbox:
+            if verbose:
+                print(
+                    "--- [vibephysics] pipelined_postprocess: algo_3d_bbox needs final-frame voxels; "
+                    "running per-frame postprocess after ground align ---",
+                    flush=True,
+                )
+        else:
+            from .frame_postprocess import FramePostprocessPipeline
 
-    from .common import convert_prediction_to_blender_zup
+            with profiler.stage("frame_pipeline_submit"):
+                frame_pipeline = FramePostprocessPipeline(
+                    min_confidence=export_min_confidence,
+                    point_cloud_3d_nms=point_cloud_3d_nms,
+                    point_cloud_3d_nms_radius=point_cloud_3d_nms_radius,
+                    point_cloud_3d_nms_min_neighbors=point_cloud_3d_nms_min_neighbors,
+                    random_points_per_frame=random_points_per_frame,
+                    num_frames=int(prediction.world_points.shape[0]),
+                    max_workers=min(int(prediction.world_points.shape[0]), thread_plan.postprocess_workers),
+                )
+                frame_pipeline.submit_prediction(prediction)
 
-    with profiler.stage("save_artifacts"):
-        convert_prediction_to_blender_zup(prediction)
+    # Cancels queued per-frame work if anything below raises before finish().
+    with frame_pipeline if frame_pipeline is not None else nullcontext():
+        # Rigid world transform applied below (p' = R @ p + t), for the pipelined chunks.
+        world_rotation = None
+        world_z_shift = 0.0
         if align_ground:
-            from .ground_align import finalize_ground_align_z_shift
-
-            finalize_ground_align_z_shift(prediction)
-        prediction.metadata = dict(prediction.metadata)
-        prediction.metadata["video_fps"] = source_video_fps
-        from .common import random_points_limit_enabled
-
-        save_sampled = random_points_limit_enabled(
-            random_points_per_frame
-        ) or random_points_limit_enabled(total_random_points)
-
-        detection_result = None
-        detection_meta: dict | None = None
-        if detection_seg:
-            from .detection_seg import (
-                DetectionSegConfig,
-                run_detection_segmentation,
-                save_detection_masks,
-            )
+            from .ground_align import align_prediction_ground
+
+            with profiler.stage("ground_align"):
+                world_rotation = align_prediction_ground(prediction)
+
+        from .common import convert_prediction_to_blender_zup
+
+        with profiler.stage("save_artifacts"):
+            zup_rotation = convert_prediction_to_blender_zup(prediction)
+            if zup_rotation is not None:
+                world_rotation = zup_rotation if world_rotation is None else zup_rotation @ world_rotation
+            if align_ground:
+                from .ground_align import finalize_ground_align_z_shift
+
+                world_z_shift = finalize_ground_align_z_shift(prediction)
+            prediction.metadata = dict(prediction.metadata)
+            prediction.metadata["video_fps"] = source_video_fps
+            from .common import random_points_limit_enabled
+
+            save_sampled = random_points_limit_enabled(
+                random_points_per_frame
+            ) or random_points_limit_enabled(total_random_points)
+
+            detection_result = None
+            detection_meta: dict | None = None
+            if detection_seg:
+                from .detection_seg import (
+                    DetectionSegConfig,
+                    run_detection_segmentation,
+                    save_detection_masks,
+                )
 
-            from .config import parse_detection_seg_classes
+                from .config import parse_detection_seg_classes
 
-            if detection_seg_classes is not None:
-                det_classes, det_colors = parse_detection_seg_classes(
-                    detection_seg_classes
+                if detection_seg_classes is not None:
+                    det_classes, det_colors = parse_detection_seg_classes(
+                        detection_seg_classes
+                    )
+                    if detection_seg_class_colors:
+                        det_colors = {**det_colors, **detection_seg_class_colors}
+                elif detection_seg_class_colors:
+                    det_colors = dict(detection_seg_class_colors)
+                    det_classes = list(detection_seg_class_colors.keys())
+                else:
+                    from .config import detection_seg_default
+
+                    det_classes, det_colors = parse_detection_seg_classes(
+                        detection_seg_default("classes")
+                    )
+                with _hold_inference_lane(inference_lane, profiler), profiler.stage("detection_seg"):
+                    detection_result = run_detection_segmentation(
+                        prediction,
+                        DetectionSegConfig(
+                            enabled=True,
+                            model=detection_seg_model,
+                            classes=list(det_classes),
+                            class_colors=det_colors,
+                            threshold=float(detection_seg_threshold),
+                            save_masks=bool(detection_seg_save_masks),
+                        ),
+                        verbose=verbose,
+                    )
+                detection_meta = {
+                    "enabled": True,
+                    "model": detection_result.model,
+                    "classes": detection_result.classes,
+                    "threshold": detection_result.threshold,
+                    "label_to_id": detection_result.label_to_id,
+                    "class_colors": {
+                        cls: list(rgba) for cls, rgba in detection_result.class_colors.items()
+                    },
+                }
+
+            post_result = None
+            if frame_pipeline is not None:
+                with profiler.stage("per_frame_3d_postprocess (pipelined)"):
+                    post_result = frame_pipeline.finish(world_rotation, (0.0, 0.0, world_z_shift))
+                profiler.record_stage(
+                    "point_cloud_3d_nms (CPU est)",
+                    post_result.timings.nms_cpu_s,
                 )
-                if detection_seg_class_colors:
-                    det_colors = {**det_colors, **detection_seg_class_colors}
-            elif detection_seg_class_colors:
-                det_colors = dict(detection_seg_class_colors)
-                det_classes = list(detection_seg_class_colors.keys())
+            need_per_frame_post = (point_cloud_3d_nms or algo_3d_bbox) and post_result is None
+            if need_per_frame_post:
+                from .frame_postprocess import run_per_frame_postprocess
+
+                if algo_3d_bbox and verbose and (
+                    random_points_limit_enabled(random_points_per_frame)
+                    or random_points_limit_enabled(total_random_points)
+                ):
+                    print(
+                        "--- [vibephysics] algo_3d_bbox uses dense world_points; "
+                        "set --random_points_per_frame 0 for best results ---",
+                        flush=True,
+                    )
+                with profiler.stage("per_frame_3d_postprocess"):
+                    post_result = run_per_frame_postprocess(
+                        prediction,
+                        min_confidence=export_min_confidence,
+                        point_cloud_3d_nms=point_cloud_3d_nms,
+                        point_cloud_3d_nms_radius=point_cloud_3d_nms_radius,
+                        point_cloud_3d_nms_min_neighbors=point_cloud_3d_nms_min_neighbors,
+                        to_blender=True,
+                        with_frame_ids=True,
+                        random_points_per_frame=random_points_per_frame,
+                        algo_3d_bbox=algo_3d_bbox,
+                        bbox_reference_frame=algo_3d_bbox_reference_frame,
+                        max_workers=min(int(prediction.world_points.shape[0]), thread_plan.postprocess_workers),
+                        bbox_kwargs={
+                            "voxel_size": algo_3d_bbox_voxel_size,
+                            "min_changed_voxels": algo_3d_bbox_min_changed_voxels,
+                            "min_change_fraction": algo_3d_bbox_min_change_fraction,
+                            "min_cluster_voxels": algo_3d_bbox_min_cluster_voxels,
+                            "cluster_gap_close": algo_3d_bbox_cluster_gap_close,
+                            "min_points_per_voxel": algo_3d_bbox_min_points_per_voxel,
+                            "shell_min_new_neighbors": algo_3d_bbox_shell_min_new_neighbors,
+                            "min_interior_voxels": algo_3d_bbox_min_interior_voxels,
+                            "min_interior_fraction": algo_3d_bbox_min_interior_fraction,
+                            "bbox_dense_min_neighbors": algo_3d_bbox_bbox_dense_min_neighbors,
+                            "bbox_min_dense_voxels": algo_3d_bbox_bbox_min_dense_voxels,
+                            "padding": algo_3d_bbox_padding,
+                            "verbose": verbose,
+                        },
+                        detection_seg=detection_result,
+                    )
+                if post_result is not None:
+                    if point_cloud_3d_nms:
+                        profiler.record_stage(
+                            "point_cloud_3d_nms (CPU est)",
+                            post_result.timings.nms_cpu_s,
+                        )
+                    if algo_3d_bbox:
+                        profiler.record_stage(
+                            "algo_3d_bbox (CPU est)",
+                            post_result.timings.bbox_cpu_s,
+                        )
+            algo_3d_bboxes = post_result.bboxes if post_result is not None and algo_3d_bbox else None
+
+            output_path = prepare_output_directory(image_path, output_path, engine=engine, verbose=verbose)
+            if detection_result is not None and detection_seg_save_masks:
+                from .detection_seg import save_detection_masks
+
+                mask_root = save_detection_masks(output_path, detection_result)
+                if verbose:
+                    print(f"[vibephysics] detection_seg: saved masks under {mask_root}", flush=True)
+            prediction.metadata["source_image_paths"] = list(prediction.image_paths)
+            if save_frames:
+                prediction.image_paths = persist_preprocessed_frames(output_path, prediction)
+                prediction.metadata["preprocessed_frames_dir"] = str((output_path / "frames").resolve())
             else:
-                from .config import detection_seg_default
-
-                det_classes, det_colors = parse_detection_seg_classes(
-                    detection_seg_default("classes")
-                )
-            with profiler.stage("detection_seg"):
-                detection_result = run_detection_segmentation(
-                    prediction,
-                    DetectionSegConfig(
-                        enabled=True,
-                        model=detection_seg_model,
-                        classes=list(det_classes),
-                        class_colors=det_colors,
-                        threshold=float(detection_seg_threshold),
-                        save_masks=bool(detection_seg_save_masks),
-                    ),
-                    verbose=verbose,
-                )
-            detection_meta = {
-                "enabled": True,
-                "model": detection_result.model,
-                "classes": detection_result.classes,
-                "threshold": detection_result.threshold,
-                "label_to_id": detection_result.label_to_id,
-                "class_colors": {
-                    cls: list(rgba) for cls, rgba in detection_result.class_colors.items()
+                prediction.metadata["preprocessed_frames_dir"] = None
+            config = {
+                "engine": engine,
+                "source_path": str(source_path),
+                "image_path": str(image_path),
+                "num_frames": num_frames,
+                "max_frames": max_frames,
+                "max_frames_mode": max_frames_mode,
+                "vram_gb": vram_gb,
+                "conf_percentile": (
+                    vggt_omega_conf_percentile
+                    if is_vggt_omega_engine(engine)
+                    else vgg_ttt_conf_percentile
+                    if is_vgg_ttt_engine(engine)
+                    else dvlt_conf_percentile
+                    if is_dvlt_engine(engine)
+                    else None
+                ),
+                "mask_sky": mask_sky,
+                "video_fps": source_video_fps,
+                "video_fps_config": video_fps,
+                "video_decode": {
+                    "mode": "stream" if frame_source is not None else "files",
+                    "backend": frame_source.backend if frame_source is not None else None,
+                    "persist_frames": frame_source is None,
+                },
+                "cpu_threads": {**thread_plan.to_dict(), "torch_threads": torch_threads},
+                "inference_cache": {
+                    "enabled": inference_cache,
+                    "key": cache_key,
+                    "hit": cache_hit,
+                },
+                "output": {
+                    "random_points_per_frame": random_points_per_frame,
+                    "total_random_points": total_random_points,
+                    "sampled_points": save_sampled,
+                    "split_files": split_files,
+                    "save_html": save_html,
+                    "save_frames": save_frames,
+                    "min_confidence": export_min_confidence,
+                    "filter_edges": filter_edges,
+                    "align_ground": align_ground,
+                    "only_start_frame_pose": only_start_frame_pose,
+                    "point_cloud_3d_nms": point_cloud_3d_nms,
+                    "point_cloud_3d_nms_radius": point_cloud_3d_nms_radius,
+                    "point_cloud_3d_nms_min_neighbors": point_cloud_3d_nms_min_neighbors,
+                    "pipelined_postprocess": frame_pipeline is not None,
+                    "memory_budget_gb": memory_budget_gb,
+                    "memory_plan": memory_plan.to_dict(),
+                    "algo_3d_bbox": algo_3d_bbox,
                 },
+                "blend": {
+                    "point_scale": point_scale,
+                    "point_display": point_display,
+                    "animate": animate,
+                    "animation_fps": animation_fps,
+                    "animation_mode": animation_mode,
+                    "keep_start_frame_point_cloud": keep_start_frame_point_cloud,
+                },
+                "algo_3d_bbox_min_visualize_changed_voxels": algo_3d_bbox_min_visualize_changed_voxels,
+                "detection_seg": detection_seg,
+                "detection_seg_model": detection_seg_model,
+                "detection_seg_classes": detection_seg_classes,
+                "detection_seg_threshold": detection_seg_threshold,
+                "detection_seg_save_masks": detection_seg_save_masks,
+                "prediction_metadata": prediction.metadata,
             }
+            save_reconstruct_config(output_path / "reconstruct_config.json", config)
+            if algo_3d_bboxes is not None:
+                from .algo_3d_bbox import (
+                    DETECTION_SEG_BBOX_METHOD,
+                    save_algo_3d_bboxes,
+                )
 
-        post_result = None
-        need_per_frame_post = point_cloud_3d_nms or algo_3d_bbox
-        if need_per_frame_post:
-            from .frame_postprocess import run_per_frame_postprocess
-
-            if algo_3d_bbox and verbose and (
-                random_points_limit_enabled(random_points_per_frame)
-                or random_points_limit_enabled(total_random_points)
-            ):
-                print(
-                    "--- [vibephysics] algo_3d_bbox uses dense world_points; "
-                    "set --random_points_per_frame 0 for best results ---",
-                    flush=True,
+                save_algo_3d_bboxes(
+                    output_path / "algo_3d_bbox.json",
+                    algo_3d_bboxes,
+                    reference_frame=algo_3d_bbox_reference_frame,
+                    method=(
+                        DETECTION_SEG_BBOX_METHOD
+                        if detection_result is not None
+                        else "voxel_diff_blob"
+                    ),
+                    voxel_size=algo_3d_bbox_voxel_size,
+                    min_changed_voxels=algo_3d_bbox_min_changed_voxels,
+                    min_change_fraction=algo_3d_bbox_min_change_fraction,
+                    min_cluster_voxels=algo_3d_bbox_min_cluster_voxels,
+                    cluster_gap_close=algo_3d_bbox_cluster_gap_close,
+                    min_points_per_voxel=algo_3d_bbox_min_points_per_voxel,
+                    shell_min_new_neighbors=algo_3d_bbox_shell_min_new_neighbors,
+                    min_interior_voxels=algo_3d_bbox_min_interior_voxels,
+                    min_interior_fraction=algo_3d_bbox_min_interior_fraction,
+                    bbox_dense_min_neighbors=algo_3d_bbox_bbox_dense_min_neighbors,
+                    bbox_min_dense_voxels=algo_3d_bbox_bbox_min_dense_voxels,
+                    padding=algo_3d_bbox_padding,
+                    min_visualize_changed_voxels=algo_3d_bbox_min_visualize_changed_voxels,
+                    detection_seg=detection_meta,
                 )
-            with profiler.stage("per_frame_3d_postprocess"):
-                post_result = run_per_frame_postprocess(
+            precomputed_points = _precomputed_points_from_post(
+                post_result,
+                total_random_points=total_random_points,
+            )
+            if save_sampled:
+                precomputed = precomputed_points
+                save_compact_prediction(
+                    output_path / "predictions.npz",
                     prediction,
                     min_confidence=export_min_confidence,
+                    random_points_per_frame=random_points_per_frame,
+                    total_random_points=total_random_points,
                     point_cloud_3d_nms=point_cloud_3d_nms,
                     point_cloud_3d_nms_radius=point_cloud_3d_nms_radius,
                     point_cloud_3d_nms_min_neighbors=point_cloud_3d_nms_min_neighbors,
-                    to_blender=True,
-                    with_frame_ids=True,
-                    random_points_per_frame=random_points_per_frame,
-                    algo_3d_bbox=algo_3d_bbox,
-                    bbox_reference_frame=algo_3d_bbox_reference_frame,
-                    bbox_kwargs={
-                        "voxel_size": algo_3d_bbox_voxel_size,
-                        "min_changed_voxels": algo_3d_bbox_min_changed_voxels,
-                        "min_change_fraction": algo_3d_bbox_min_change_fraction,
-                        "min_cluster_voxels": algo_3d_bbox_min_cluster_voxels,
-                        "cluster_gap_close": algo_3d_bbox_cluster_gap_close,
-                        "min_points_per_voxel": algo_3d_bbox_min_points_per_voxel,
-                        "shell_min_new_neighbors": algo_3d_bbox_shell_min_new_neighbors,
-                        "min_interior_voxels": algo_3d_bbox_min_interior_voxels,
-                        "min_interior_fraction": algo_3d_bbox_min_interior_fraction,
-                        "bbox_dense_min_neighbors": algo_3d_bbox_bbox_dense_min_neighbors,
-                        "bbox_min_dense_voxels": algo_3d_bbox_bbox_min_dense_voxels,
-                        "padding": algo_3d_bbox_padding,
-                        "verbose": verbose,
-                    },
-                    detection_seg=detection_result,
+                    precomputed_points=precomputed,
+                    split_files=split_files,
+                )
+            else:
+                save_prediction(
+                    output_path / "predictions.npz",
+                    prediction,
+                    split_files=split_files,
                 )
-            if post_result is not None:
-                if point_cloud_3d_nms:
-                    profiler.record_stage(
-                        "point_cloud_3d_nms (CPU est)",
-                        post_result.timings.nms_cpu_s,
-                    )
-                if algo_3d_bbox:
-                    profiler.record_stage(
-                        "algo_3d_bbox (CPU est)",
-                        post_result.timings.bbox_cpu_s,
-                    )
-        algo_3d_bboxes = post_result.bboxes if post_result is not None and algo_3d_bbox else None
-
-        output_path = prepare_output_directory(image_path, output_path, engine=engine, verbose=verbose)
-        if detection_result is not None and detection_seg_save_masks:
-            from .detection_seg import save_detection_masks
-
-            mask_root = save_detection_masks(output_path, detection_result)
-            if verbose:
-                print(f"[vibephysics] detection_seg: saved masks under {mask_root}", flush=True)
-        prediction.metadata["source_image_paths"] = list(prediction.image_paths)
-        if save_frames:
-            prediction.image_paths = persist_preprocessed_frames(output_path, prediction)
-            prediction.metadata["preprocessed_frames_dir"] = str((output_path / "frames").resolve())
-        else:
-            prediction.metadata["preprocessed_frames_dir"] = None
-        config = {
-            "engine": engine,
-            "source_path": str(source_path),
-            "image_path": str(image_path),
-            "num_frames": num_frames,
-            "max_frames": max_frames,
-            "max_frames_mode": max_frames_mode,
-            "vram_gb": vram_gb,
-            "conf_percentile": (
-                vggt_omega_conf_percentile
-                if is_vggt_omega_engine(engine)
-                else vgg_ttt_conf_percentile
-                if is_vgg_ttt_engine(engine)
-                else dvlt_conf_percentile
-                if is_dvlt_engine(engine)
-                else None
-            ),
-            "mask_sky": mask_sky,
-            "video_fps": source_video_fps,
-            "video_fps_config": video_fps,
-            "output": {
-                "random_points_per_frame": random_points_per_frame,
-                "total_random_points": total_random_points,
-                "sampled_points": save_sampled,
-                "split_files": split_files,
-                "save_html": save_html,
-                "save_frames": save_frames,
-                "min_confidence": export_min_confidence,
-                "filter_edges": filter_edges,
-                "align_ground": align_ground,
-                "only_start_frame_pose": only_start_frame_pose,
-                "point_cloud_3d_nms": point_cloud_3d_nms,
-                "point_cloud_3d_nms_radius": point_cloud_3d_nms_radius,
-                "point_cloud_3d_nms_min_neighbors": point_cloud_3d_nms_min_neighbors,
-                "algo_3d_bbox": algo_3d_bbox,
-            },
-            "blend": {
-                "point_scale": point_scale,
-                "point_display": point_display,
-                "animate": animate,
-                "animation_fps": animation_fps,
-                "animation_mode": animation_mode,
-                "keep_start_frame_point_cloud": keep_start_frame_point_cloud,
-            },
-            "algo_3d_bbox_min_visualize_changed_voxels": algo_3d_bbox_min_visualize_changed_voxels,
-            "detection_seg": detection_seg,
-            "detection_seg_model": detection_seg_model,
-            "detection_seg_classes": detection_seg_classes,
-            "detection_seg_threshold": detection_seg_threshold,
-            "detection_seg_save_masks": detection_seg_save_masks,
-            "prediction_metadata": prediction.metadata,
-        }
-        save_reconstruct_config(output_path / "reconstruct_config.json", config)
-        if algo_3d_bboxes is not None:
-            from .algo_3d_bbox import (
-                DETECTION_SEG_BBOX_METHOD,
-                save_algo_3d_bboxes,
-            )
-
-            save_algo_3d_bboxes(
-                output_path / "algo_3d_bbox.json",
-                algo_3d_bboxes,
-                reference_frame=algo_3d_bbox_reference_frame,
-                method=(
-                    DETECTION_SEG_BBOX_METHOD
-                    if detection_result is not None
-                    else "voxel_diff_blob"
-                ),
-                voxel_size=algo_3d_bbox_voxel_size,
-                min_changed_voxels=algo_3d_bbox_min_changed_voxels,
-                min_change_fraction=algo_3d_bbox_min_change_fraction,
-                min_cluster_voxels=algo_3d_bbox_min_cluster_voxels,
-                cluster_gap_close=algo_3d_bbox_cluster_gap_close,
-                min_points_per_voxel=algo_3d_bbox_min_points_per_voxel,
-                shell_min_new_neighbors=algo_3d_bbox_shell_min_new_neighbors,
-                min_interior_voxels=algo_3d_bbox_min_interior_voxels,
-                min_interior_fraction=algo_3d_bbox_min_interior_fraction,
-                bbox_dense_min_neighbors=algo_3d_bbox_bbox_dense_min_neighbors,
-                bbox_min_dense_voxels=algo_3d_bbox_bbox_min_dense_voxels,
-                padding=algo_3d_bbox_padding,
-                min_visualize_changed_voxels=algo_3d_bbox_min_visualize_changed_voxels,
-                detection_seg=detection_meta,
-            )
-        precomputed_points = _precomputed_points_from_post(
-            post_result,
-            total_random_points=total_random_points,
-        )
-        if save_sampled:
-            precomputed = precomputed_points
-            save_compact_prediction(
-                output_path / "predictions.npz",
-                prediction,
-                min_confidence=export_min_confidence,
-                random_points_per_frame=random_points_per_frame,
-                total_random_points=total_random_points,
-                point_cloud_3d_nms=point_cloud_3d_nms,
-                point_cloud_3d_nms_radius=point_cloud_3d_nms_radius,
-                point_cloud_3d_nms_min_neighbors=point_cloud_3d_nms_min_neighbors,
-                precomputed_points=precomputed,
-                split_files=split_files,
-            )
-        else:
-            save_prediction(
-                output_path / "predictions.npz",
-                prediction,
-                split_files=split_files,
-            )
 
     if save_html is not None:
         with profiler.stage("html_export"):
@@ -1257,7 +1692,7 @@ def reconstruct(
     if save_blend is not None:
         from .algo_3d_bbox import class_colors_from_detection_meta
 
-        with profiler.stage("blend_export"):
+        with _BPY_EXPORT_LOCK, profiler.stage("blend_export"):
             _export_blend_scene(
                 prediction,
                 output_path,
@@ -1286,7 +1721,16 @@ def reconstruct(
                 verbose=verbose,
             )
 
-    profiler.print_summary(engine=engine, num_frames=num_frames, output_path=output_path)
+    profiler.finish()
+    profiler.append_history(
+        engine=engine,
+        num_frames=memory_plan.num_frames,
+        height=memory_plan.height,
+        width=memory_plan.width,
+        inference_cache_hit=cache_hit,
+    )
+    if verbose:
+        profiler.print_summary(engine=engine, num_frames=num_frames, output_path=output_path)
     return output_path
 
 
@@ -1302,6 +1746,7 @@ def reconstruct_from_config(
     config_path: str | Path,
     image_path: str | Path | None = None,
     output_path: str | Path | None = None,
+    engine: str | None = None,
     preprocess_mode: str | None = None,
     max_frames: int | None = None,
     max_frames_mode: str | None = None,
@@ -1319,18 +1764,32 @@ def reconstruct_from_config(
     point_cloud_3d_nms: bool | None = None,
     point_cloud_3d_nms_radius: float | None = None,
     point_cloud_3d_nms_min_neighbors: int | None = None,
+    pipelined_postprocess: bool | None = None,
+    memory_budget_gb: float | None = None,
+    video_decode: str | None = None,
+    video_persist_frames: bool | None = None,
+    video_extract_workers: int | None = None,
+    video_threads: int | None = None,
+    adaptive_motion_threshold: float | None = None,
+    video_frame_cache: bool | None = None,
     html: bool | None = None,
     frames: bool | None = None,
     map_anything_model: str | None = None,
     map_anything_install_all: bool = False,
+    force_inference: bool = False,
+    resume: bool = False,
+    cpu_quantize: str | None = None,
+    cpu_threads: int | None = None,
 ) -> Path:
     from .config import apply_overrides, apply_video_frame_overrides, load_yaml_config, parse_feedforward_config
 
     config_path = Path(config_path)
     cfg = apply_overrides(
         load_yaml_config(config_path),
-        {"image_path": image_path, "output_path": output_path},
+        {"image_path": image_path, "output_path": output_path, "engine": engine, "cpu_quantize": cpu_quantize},
     )
+    if cpu_threads is not None:
+        cfg["cpu_threads"] = int(cpu_threads) or None
     cfg = apply_video_frame_overrides(
         cfg,
         max_frames=max_frames,
@@ -1437,6 +1896,46 @@ def reconstruct_from_config(
         if not isinstance(output, dict):
             raise ValueError("Config section 'output' must be a mapping")
         output["point_cloud_3d_nms_min_neighbors"] = int(point_cloud_3d_nms_min_neighbors)
+    if pipelined_postprocess is not None:
+        output = cfg.setdefault("output", {})
+        if not isinstance(output, dict):
+            raise ValueError("Config section 'output' must be a mapping")
+        output["pipelined_postprocess"] = bool(pipelined_postprocess)
+    if memory_budget_gb is not None:
+        output = cfg.setdefault("output", {})
+        if not isinstance(output, dict):
+            raise ValueError("Config section 'output' must be a mapping")
+        output["memory_budget_gb"] = float(memory_budget_gb) or None
+    if video_decode is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["decode"] = video_decode
+    if video_persist_frames is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["persist_frames"] = bool(video_persist_frames)
+    if video_extract_workers is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["extract_workers"] = int(video_extract_workers)
+    if video_threads is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["threads"] = int(video_threads) or None
+    if adaptive_motion_threshold is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["adaptive_motion_threshold"] = float(adaptive_motion_threshold) or None
+    if video_frame_cache is not None:
+        video = cfg.setdefault("video", {})
+        if not isinstance(video, dict):
+            raise ValueError("Config section 'video' must be a mapping")
+        video["frame_cache"] = bool(video_frame_cache)
     if html is not None:
         output = cfg.setdefault("output", {})
         if not isinstance(output, dict):
@@ -1485,12 +1984,19 @@ def reconstruct_from_config(
         else:
             section["preprocess_mode"] = preprocess_mode
     params = parse_feedforward_config(cfg, config_path=config_path.resolve())
+    if force_inference:
+        params["force_inference"] = True
+    if resume:
+        if not is_r3_engine(params.get("engine", "")):
+            raise ValueError("--resume is only supported when engine is 'r3'")
+        params["r3_resume"] = True
     return reconstruct(**params)
 
 
 def main() -> None:
     import argparse
 
+    from .common import CPU_QUANTIZE_MODES
     from .config import DEFAULT_FEEDFORWARD_CONFIG
 
     os.environ.setdefault("KMP_DUPLICATE_LIB_OK", "TRUE")
@@ -1510,6 +2016,14 @@ def main() -> None:
         help="Override config image_path (video, image folder, or single image).",
     )
     parser.add_argument("--output_path", default=None, help="Override config output_path.")
+    parser.add_argument(
+        "--engine",
+        default=None,
+        help=(
+            f"Override config engine: {', '.join(FEEDFORWARD_ENGINES)} or a registered plugin "
+            "(synthetic: procedural scene, no model weights)."
+        ),
+    )
     parser.add_argument(
         "--max_frames",
         type=int,
@@ -1519,10 +2033,19 @@ def main() -> None:
     )
     parser.add_argument(
         "--max_frames_mode",
-        choices=("spread", "first"),
+        choices=MAX_FRAMES_MODES,
         default=None,
         help="How to pick N frames: first=first N consecutive (default), "
-        "spread=evenly across full input.",
+        "spread=evenly across full input, adaptive=by motion with blurred frames rejected.",
+    )
+    parser.add_argument(
+        "--adaptive_motion_threshold",
+        "--adaptive-motion-threshold",
+        type=float,
+        default=None,
+        help="With --max-frames-mode adaptive, take a frame whenever accumulated motion "
+        "(fraction of frame width) reaches this; --max-frames still caps the count "
+        "(default: video.adaptive_motion_threshold).",
     )
     parser.add_argument(
         "--point_scale",
@@ -1600,6 +2123,66 @@ def main() -> None:
         default=None,
         help="Min neighbors within radius to keep a point (default: output.point_cloud_3d_nms_min_neighbors).",
     )
+    parser.add_argument(
+        "--pipelined_postprocess",
+        "--pipelined-postprocess",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="After inference, run per-frame confidence/3D NMS on background threads while ground "
+        "align, Z-up and detection run; no effect with --algo_3d_bbox "
+        "(default: output.pipelined_postprocess).",
+    )
+    parser.add_argument(
+        "--memory_budget_gb",
+        "--memory-budget-gb",
+        type=float,
+        default=None,
+        help="Host RSS budget for postprocess + save; when the estimate exceeds it, switch to "
+        "split files, then fewer points per frame. 0 = off (default: output.memory_budget_gb).",
+    )
+    parser.add_argument(
+        "--video_decode",
+        "--video-decode",
+        choices=VIDEO_DECODE_MODES,
+        default=None,
+        help="Video input: ffmpeg (JPEG frames on disk) or stream (in-process PyAV/OpenCV decode) "
+        "(default: video.decode).",
+    )
+    parser.add_argument(
+        "--persist_frames",
+        "--persist-frames",
+        dest="video_persist_frames",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="With --video-decode stream, still write frame_%%04d.jpg next to the video "
+        "(default: video.persist_frames).",
+    )
+    parser.add_argument(
+        "--extract_workers",
+        "--extract-workers",
+        dest="video_extract_workers",
+        type=int,
+        default=None,
+        help="Parallel ffmpeg processes for JPEG extraction, each on its own time segment; "
+        "1 = serial, 0 = auto by duration and CPUs (default: video.extract_workers).",
+    )
+    parser.add_argument(
+        "--video_threads",
+        "--video-threads",
+        type=int,
+        default=None,
+        help="Total ffmpeg threads for frame extraction, split across workers; 0 = ffmpeg's "
+        "own choice (default: video.threads).",
+    )
+    parser.add_argument(
+        "--frame_cache",
+        "--frame-cache",
+        dest="video_frame_cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Take extracted video frames from the shared cache keyed by video content, fps and "
+        "quality (default: video.frame_cache).",
+    )
     parser.add_argument(
         "--algo_3d_bbox",
         "--algo-3d-bbox",
@@ -1648,6 +2231,33 @@ def main() -> None:
         action="store_true",
         help="Install Map-Anything with the upstream [all] extra before running.",
     )
+    parser.add_argument(
+        "--force-inference",
+        "--force_inference",
+        dest="force_inference",
+        action="store_true",
+        help="Re-run the model even when a cached raw prediction matches this input/settings.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="R3: continue an interrupted run from its last stream checkpoint (needs r3.checkpoint_every).",
+    )
+    parser.add_argument(
+        "--cpu_quantize",
+        "--cpu-quantize",
+        choices=CPU_QUANTIZE_MODES,
+        default=None,
+        help="Dynamic int8 Linear layers for CPU inference (YAML cpu_quantize; ignored on GPU).",
+    )
+    parser.add_argument(
+        "--cpu_threads",
+        "--cpu-threads",
+        type=int,
+        default=None,
+        help="CPU core budget for torch + post-processing threads; 0 = auto from affinity / "
+        "cgroup quota (default: YAML cpu_threads).",
+    )
     args = parser.parse_args()
 
     try:
@@ -1655,6 +2265,7 @@ def main() -> None:
             args.config,
             args.image_path,
             args.output_path,
+            engine=args.engine,
             preprocess_mode=args.preprocess_mode,
             max_frames=args.max_frames,
             max_frames_mode=args.max_frames_mode,
@@ -1674,10 +2285,22 @@ def main() -> None:
             point_cloud_3d_nms=args.point_cloud_3d_nms,
             point_cloud_3d_nms_radius=args.point_cloud_3d_nms_radius,
             point_cloud_3d_nms_min_neighbors=args.point_cloud_3d_nms_min_neighbors,
+            pipelined_postprocess=args.pipelined_postprocess,
+            memory_budget_gb=args.memory_budget_gb,
+            video_decode=args.video_decode,
+            video_persist_frames=args.video_persist_frames,
+            video_extract_workers=args.video_extract_workers,
+            video_threads=args.video_threads,
+            adaptive_motion_threshold=args.adaptive_motion_threshold,
+            video_frame_cache=args.video_frame_cache,
             html=args.html if args.html else None,
             frames=args.frames if args.frames else None,
             map_anything_model=args.map_anything_model,
             map_anything_install_all=args.map_anything_install_all,
+            force_inference=args.force_inference,
+            resume=args.resume,
+            cpu_quantize=args.cpu_quantize,
+            cpu_threads=args.cpu_threads,
         )
         sys.exit(0)
     except ValueError as exc:
@@ -0,0 +1,82 @@
+"""Append-only JSONL history of profiled ``reconstruct`` runs (input to ``estimate``).
+
+One line per run under ``feedforward_cache_root()/run_history.jsonl``: engine, device,
+thread count, frame count, resolution, per-stage wall time and peak RSS. Set
+``VIBEPHYSICS_NO_RUN_HISTORY=1`` to stop recording.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+RUN_HISTORY_SCHEMA = 1
+RUN_HISTORY_FILE = "run_history.jsonl"
+
+_HISTORY_LOCK = threading.Lock()
+
+
+def run_history_enabled() -> bool:
+    return os.environ.get("VIBEPHYSICS_NO_RUN_HISTORY", "").strip().lower() not in {"1", "true", "yes"}
+
+
+def run_history_path() -> Path:
+    from .common import feedforward_cache_root
+
+    return feedforward_cache_root() / RUN_HISTORY_FILE
+
+
+def current_device_and_threads() -> tuple[str | None, int]:
+    """Device / intra-op threads of this process, without importing torch if nothing did."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None, os.cpu_count() or 1
+    from .common import resolve_torch_device
+
+    try:
+        device = resolve_torch_device(verbose=False).device
+    except Exception:
+        device = None
+    return device, int(torch.get_num_threads())
+
+
+def append_run_record(record: dict[str, Any], path: Path | None = None) -> Path | None:
+    """Append one run as a JSON line; returns the history path (None when disabled / unwritable)."""
+    if not run_history_enabled():
+        return None
+    path = Path(path) if path is not None else run_history_path()
+    line = json.dumps({"schema": RUN_HISTORY_SCHEMA, "host": platform.node(), **record}, default=str)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _HISTORY_LOCK, path.open("a") as handle:
+            handle.write(line + "\n")
+    except OSError:
+        return None
+    return path
+
+
+def load_run_history(path: Path | None = None) -> list[dict[str, Any]]:
+    """Parsed history records, oldest first; unreadable lines are skipped."""
+    path = Path(path) if path is not None else run_history_path()
+    if not path.is_file():
+        return []
+    records: list[dict[str, Any]] = []
+    with path.open() as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("schema") == RUN_HISTORY_SCHEMA:
+                records.append(record)
+    return records
+
+
+def timestamp() -> str:
+    return datetime.now().isoformat(timespec="seconds")
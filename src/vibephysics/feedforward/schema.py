@@ -154,13 +154,14 @@ def _npz_base_path(path: Path) -> Path:
 
 
 def _write_npz_payload(path: Path, payload: dict, *, split_files: bool = False) -> None:
-    payload = _encode_float_storage(payload)
     if not split_files:
-        np.savez_compressed(path, **payload)
+        np.savez_compressed(path, **_encode_float_storage(payload))
         return
+    # Encode one key at a time so only a single float16 copy is alive during the write.
     base = _npz_base_path(path)
     for key, value in payload.items():
-        np.savez_compressed(base.parent / f"{base.name}.{key}.npz", **{key: value})
+        encoded = _encode_float_storage({key: value})
+        np.savez_compressed(base.parent / f"{base.name}.{key}.npz", **encoded)
 
 
 def load_npz_payload(path: Path | str) -> dict:
@@ -0,0 +1,409 @@
+"""Long-lived local reconstruction service (``vibephysics-serve``).
+
+Keeps engines resident (warm model pool) and exposes a small JSON job API over
+local HTTP or a Unix socket. A job body is the same kwargs as ``reconstruct()``.
+Model inference runs on a single lane; ``--max-jobs`` bounds how many jobs are in
+flight, i.e. how much CPU post-processing/export overlaps the running inference.
+
+Endpoints::
+
+    POST   /jobs                  {"image_path": "clip.mov", "engine": "lingbot_map", ...}
+    GET    /jobs                  all jobs (newest last)
+    GET    /jobs/<id>             status, stage, progress, output_path, artifacts, timings
+    DELETE /jobs/<id>             cancel (queued: dropped; running: stops at next checkpoint);
+                                  on a finished job, forget it
+    DELETE /jobs                  forget every finished job
+    GET    /health
+
+Only the newest ``--keep-finished`` finished jobs (default 100) are kept; older ones
+are forgotten as new jobs finish. Their output folders stay on disk.
+
+Usage::
+
+    vibephysics-serve --port 8765
+    vibephysics-serve --socket /tmp/vibephysics.sock
+    curl -X POST localhost:8765/jobs -d '{"image_path": "clip.mov", "save_html": "visual.html"}'
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SERVE_HOST = "127.0.0.1"
+DEFAULT_SERVE_PORT = 8765
+DEFAULT_SERVE_MAX_JOBS = 2
+DEFAULT_SERVE_KEEP_FINISHED = 100
+
+# reconstruct() kwargs owned by the service, not by job submitters.
+_RESERVED_JOB_KWARGS = frozenset({"inference_lane", "profiler"})
+_FINISHED_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+
+
+class JobCancelled(Exception):
+    """Raised at a stage/progress checkpoint when a running job is cancelled."""
+
+
+@dataclass
+class ReconstructJob:
+    id: str
+    kwargs: dict[str, Any]
+    status: str = "queued"
+    stage: str | None = None
+    progress: dict[str, Any] | None = None
+    output_path: str | None = None
+    error: str | None = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    notes: dict[str, str] = field(default_factory=dict)
+    cancel_requested: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in _FINISHED_STATUSES
+
+    def checkpoint(self) -> None:
+        if self.cancel_requested.is_set():
+            raise JobCancelled(f"job {self.id} cancelled")
+
+    def artifacts(self) -> list[str]:
+        if not self.output_path:
+            return []
+        root = Path(self.output_path)
+        if not root.is_dir():
+            return []
+        return sorted(str(path) for path in root.rglob("*") if path.is_file())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "output_path": self.output_path,
+            "artifacts": self.artifacts() if self.status == "succeeded" else [],
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "timings": self.timings,
+            "notes": self.notes,
+            "kwargs": self.kwargs,
+        }
+
+
+def validate_job_kwargs(kwargs: Any) -> dict[str, Any]:
+    """Reject unknown or service-owned ``reconstruct()`` kwargs before queueing."""
+    from .reconstruct import reconstruct
+
+    if not isinstance(kwargs, dict):
+        raise ValueError("Job body must be a JSON object of reconstruct() kwargs")
+    if not kwargs.get("image_path"):
+        raise ValueError("Job needs 'image_path'")
+    accepted = set(inspect.signature(reconstruct).parameters) - _RESERVED_JOB_KWARGS
+    unknown = sorted(set(kwargs) - accepted)
+    if unknown:
+        raise ValueError(f"Unknown reconstruct() kwargs: {', '.join(unknown)}")
+    return dict(kwargs)
+
+
+class ReconstructService:
+    """Job queue around ``reconstruct()`` with warm models and a single inference lane."""
+
+    def __init__(
+        self,
+        *,
+        max_jobs: int = DEFAULT_SERVE_MAX_JOBS,
+        keep_finished: int = DEFAULT_SERVE_KEEP_FINISHED,
+    ) -> None:
+        from .common import set_model_pool_enabled
+
+        self.max_jobs = max(1, int(max_jobs))
+        self.keep_finished = max(0, int(keep_finished))
+        self._jobs: dict[str, ReconstructJob] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._inference_lane = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_jobs,
+            thread_name_prefix="vibephysics-serve",
+        )
+        set_model_pool_enabled(True)
+
+    def submit(self, kwargs: Any) -> ReconstructJob:
+        job = ReconstructJob(id=f"job-{next(self._ids):05d}", kwargs=validate_job_kwargs(kwargs))
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> ReconstructJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> list[ReconstructJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def remove(self, job_id: str) -> ReconstructJob | None:
+        """Forget a finished job; queued or running jobs are left alone (returns None for them)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return None
+            return self._jobs.pop(job_id)
+
+    def remove_finished(self) -> int:
+        """Forget every finished job; returns how many were removed."""
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished:
+                del self._jobs[job_id]
+        return len(finished)
+
+    def _prune_finished(self) -> None:
+        with self._lock:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.finished),
+                key=lambda job: job.finished_at or 0.0,
+            )
+            for job in finished[: max(len(finished) - self.keep_finished, 0)]:
+                del self._jobs[job.id]
+
+    def cancel(self, job_id: str) -> ReconstructJob | None:
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.cancel_requested.set()
+        with self._lock:
+            if job.status == "queued":
+                job.status = "cancelled"
+                job.finished_at = time.time()
+        self._prune_finished()
+        return job
+
+    def shutdown(self) -> None:
+        from .common import set_model_pool_enabled
+
+        for job in self.jobs():
+            job.cancel_requested.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        set_model_pool_enabled(False)
+
+    def _on_stage(self, job: ReconstructJob, name: str) -> None:
+        job.checkpoint()
+        job.stage = name
+        job.progress = None
+
+    def _on_progress(self, job: ReconstructJob, desc: str, n: int, total: int | None) -> None:
+        job.checkpoint()
+        job.progress = {"desc": desc, "n": n, "total": total}
+
+    def _run(self, job: ReconstructJob) -> None:
+        from .lingbot_map import progress_listener
+        from .reconstruct import RunProfiler, reconstruct
+
+        with self._lock:
+            if job.status != "queued":
+                return
+            job.status = "running"
+            job.started_at = time.time()
+
+        profiler = RunProfiler(enabled=True, on_stage=lambda name: self._on_stage(job, name))
+        try:
+            with progress_listener(lambda desc, n, total: self._on_progress(job, desc, n, total)):
+                output_path = reconstruct(
+                    **job.kwargs,
+                    inference_lane=self._inference_lane,
+                    profiler=profiler,
+                )
+            job.output_path = str(output_path)
+            job.status = "succeeded"
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as exc:
+            job.status = "failed"
+            job.error = f"{type(exc).__name__}: {exc}"
+            traceback.print_exc()
+        finally:
+            profiler.finish()
+            job.finished_at = time.time()
+            job.stage = None
+            for stage in profiler.stages:
+                job.timings[stage.name] = job.timings.get(stage.name, 0.0) + stage.elapsed_s
+            job.notes = dict(profiler.notes)
+            self._prune_finished()
+
+
+def _make_handler(service: ReconstructService) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "vibephysics-serve"
+
+        def address_string(self) -> str:
+            # Unix-socket peers have no (host, port) tuple.
+            return self.client_address[0] if self.client_address else "unix"
+
+        def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+            body = json.dumps(payload, indent=2, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _job_id(self) -> str | None:
+            parts = [part for part in self.path.split("?")[0].split("/") if part]
+            if len(parts) == 2 and parts[0] == "jobs":
+                return parts[1]
+            return None
+
+        def do_GET(self) -> None:
+            path = self.path.split("?")[0].rstrip("/")
+            if path == "/health":
+                self._send_json(HTTPStatus.OK, {"status": "ok", "jobs": len(service.jobs())})
+                return
+            if path == "/jobs":
+                self._send_json(HTTPStatus.OK, [job.to_dict() for job in service.jobs()])
+                return
+            job_id = self._job_id()
+            job = service.get(job_id) if job_id else None
+            if job is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"no such job: {self.path}"})
+                return
+            self._send_json(HTTPStatus.OK, job.to_dict())
+
+        def do_POST(self) -> None:
+            if self.path.split("?")[0].rstrip("/") != "/jobs":
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"unknown endpoint: {self.path}"})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                kwargs = json.loads(self.rfile.read(length) or b"{}")
+                job = service.submit(kwargs)
+            except (json.JSONDecodeError, ValueError) as exc:
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+                return
+            self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+
+        def do_DELETE(self) -> None:
+            if self.path.split("?")[0].rstrip("/") == "/jobs":
+                self._send_json(HTTPStatus.OK, {"removed": service.remove_finished()})
+                return
+            job_id = self._job_id()
+            job = service.get(job_id) if job_id else None
+            if job is not None and job.finished:
+                service.remove(job_id)
+                self._send_json(HTTPStatus.OK, {**job.to_dict(), "removed": True})
+                return
+            job = service.cancel(job_id) if job is not None else None
+            if job is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"no such job: {self.path}"})
+                return
+            self._send_json(HTTPStatus.OK, job.to_dict())
+
+    return Handler
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(
+    *,
+    host: str = DEFAULT_SERVE_HOST,
+    port: int = DEFAULT_SERVE_PORT,
+    socket_path: str | Path | None = None,
+    max_jobs: int = DEFAULT_SERVE_MAX_JOBS,
+    keep_finished: int = DEFAULT_SERVE_KEEP_FINISHED,
+) -> None:
+    """Run the job API until interrupted."""
+    service = ReconstructService(max_jobs=max_jobs, keep_finished=keep_finished)
+    handler = _make_handler(service)
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.exists():
+            socket_path.unlink()
+        server = _UnixHTTPServer(str(socket_path), handler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, int(port)), handler)
+        where = f"http://{host}:{port}"
+    print(
+        f"--- [vibephysics] Serving reconstruct jobs on {where} "
+        f"({service.max_jobs} jobs in flight, single inference lane) ---",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        if socket_path is not None and Path(socket_path).exists():
+            Path(socket_path).unlink()
+
+
+def main() -> None:
+    import argparse
+
+    os.environ.setdefault("KMP_DUPLICATE_LIB_OK", "TRUE")
+
+    parser = argparse.ArgumentParser(description="Serve feedforward reconstruction jobs locally.")
+    parser.add_argument("--host", default=DEFAULT_SERVE_HOST, help="HTTP bind address.")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVE_PORT, help="HTTP port.")
+    parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        type=Path,
+        default=None,
+        help="Serve on a Unix socket instead of TCP.",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        "--max_jobs",
+        dest="max_jobs",
+        type=int,
+        default=DEFAULT_SERVE_MAX_JOBS,
+        help="Jobs in flight (CPU post-processing concurrency); inference is always one at a time.",
+    )
+    parser.add_argument(
+        "--keep-finished",
+        "--keep_finished",
+        dest="keep_finished",
+        type=int,
+        default=DEFAULT_SERVE_KEEP_FINISHED,
+        help=f"Finished jobs kept for GET /jobs (default: {DEFAULT_SERVE_KEEP_FINISHED}); older ones are forgotten.",
+    )
+    args = parser.parse_args()
+
+    try:
+        serve(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket_path,
+            max_jobs=args.max_jobs,
+            keep_finished=args.keep_finished,
+        )
+    except OSError as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
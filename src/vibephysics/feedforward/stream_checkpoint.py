@@ -0,0 +1,182 @@
+"""Resumable checkpoints for online (streaming) engine runs.
+
+An online engine consumes frames in order, keeps a streaming state (R3: KV cache,
+keyframe bank, frame counters) and emits per-frame outputs. :func:`run_segments`
+drives it ``every`` frames at a time and, after each segment, :class:`StreamCheckpoint`
+persists the engine state, the processed frame ids and that segment's outputs under
+``.vibephysics/feedforward/stream_checkpoints/<engine>-<identity>/``:
+
+- ``segment-<start>.npz``  one per finished segment (written once, never rewritten);
+- ``state.pkl``            identity, processed frame ids, segment files and the engine
+  state — replaced atomically last, so it only ever names complete segments.
+
+The identity is the run's inference-cache key (engine, settings, frame content
+hashes): a checkpoint left by other inputs or settings is never resumed. A finished
+run deletes its checkpoint.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import shutil
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+STREAM_CHECKPOINT_SCHEMA = 1
+
+
+def stream_checkpoint_dir() -> Path:
+    """``.vibephysics/feedforward/stream_checkpoints/`` (honors ``VIBEPHYSICS_FEEDFORWARD_CACHE``)."""
+    from .common import feedforward_engine_dir
+
+    return feedforward_engine_dir("stream_checkpoints")
+
+
+@dataclass
+class ResumePoint:
+    """What a run needs to continue: frames done, their outputs, the engine state."""
+
+    frame_ids: list[int]
+    segments: list[dict[str, np.ndarray]]
+    state: Any
+
+
+def _replace_atomically(path: Path, write: Callable[[Path], None]) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class StreamCheckpoint:
+    """On-disk checkpoint of one online run (see module docstring)."""
+
+    def __init__(self, engine: str, identity: str, *, root: Path | None = None):
+        self.identity = identity
+        self.directory = Path(root or stream_checkpoint_dir()) / f"{engine}-{identity[:24]}"
+        self._frame_ids: list[int] = []
+        self._segment_files: list[str] = []
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / "state.pkl"
+
+    def load(self, *, verbose: bool = True) -> ResumePoint | None:
+        """The last checkpoint of this run, or ``None`` (missing, stale or unreadable)."""
+        try:
+            with open(self.state_path, "rb") as handle:
+                record = pickle.load(handle)
+            if record.get("schema") != STREAM_CHECKPOINT_SCHEMA or record.get("identity") != self.identity:
+                raise ValueError("checkpoint was written for other inputs or settings")
+            segments = []
+            for name in record["segments"]:
+                with np.load(self.directory / name, allow_pickle=False) as data:
+                    segments.append({key: data[key] for key in data.files})
+        except FileNotFoundError:
+            if verbose:
+                print("--- [vibephysics] No stream checkpoint to resume; starting at frame 0 ---", flush=True)
+            return None
+        except Exception as exc:
+            if verbose:
+                print(f"--- [vibephysics] Ignoring stream checkpoint {self.directory} ({exc}) ---", flush=True)
+            return None
+        self._frame_ids = [int(frame) for frame in record["frame_ids"]]
+        self._segment_files = list(record["segments"])
+        return ResumePoint(frame_ids=list(self._frame_ids), segments=segments, state=record["state"])
+
+    def save(self, frame_ids: list[int], outputs: Mapping[str, np.ndarray], state: Any) -> None:
+        """Add one finished segment (its frame ids and outputs) and the state after it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"segment-{int(frame_ids[0]):06d}.npz"
+
+        def write_segment(path: Path) -> None:
+            with open(path, "wb") as handle:
+                np.savez(handle, **{key: np.asarray(value) for key, value in outputs.items()})
+
+        _replace_atomically(self.directory / name, write_segment)
+        frame_ids = self._frame_ids + [int(frame) for frame in frame_ids]
+        segment_files = self._segment_files + [name]
+        record = {
+            "schema": STREAM_CHECKPOINT_SCHEMA,
+            "identity": self.identity,
+            "frame_ids": frame_ids,
+            "segments": segment_files,
+            "state": state,
+        }
+
+        def write(path: Path) -> None:
+            with open(path, "wb") as handle:
+                pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _replace_atomically(self.state_path, write)
+        self._frame_ids, self._segment_files = frame_ids, segment_files
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._frame_ids, self._segment_files = [], []
+
+
+def run_segments(
+    num_frames: int,
+    step: Callable[[int, int], dict[str, np.ndarray]],
+    *,
+    every: int | None = None,
+    checkpoint: StreamCheckpoint | None = None,
+    resume: bool = False,
+    snapshot: Callable[[], Any] | None = None,
+    restore: Callable[[Any], None] | None = None,
+    verbose: bool = True,
+) -> list[dict[str, np.ndarray]]:
+    """
+    Outputs of ``step(start, stop)`` over ``[0, num_frames)`` in ``every``-frame segments
+    (one segment when ``every`` is falsy), in order.
+
+    With a ``checkpoint``, ``snapshot()`` (the engine state after a segment) is saved
+    after every segment but the last; ``resume`` first restores the last checkpoint with
+    ``restore(state)`` and skips the frames it covers. A finished run clears the checkpoint.
+    """
+    every = int(every) if every and every > 0 else max(num_frames, 1)
+    segments: list[dict[str, np.ndarray]] = []
+    start = 0
+    point = checkpoint.load(verbose=verbose) if checkpoint is not None and resume else None
+    if point is not None and point.frame_ids != list(range(min(len(point.frame_ids), num_frames))):
+        point = None
+    if point is not None:
+        if restore is not None:
+            restore(point.state)
+        segments = point.segments
+        start = len(point.frame_ids)
+        if verbose:
+            print(
+                f"--- [vibephysics] Resuming from stream checkpoint: {start}/{num_frames} frames done ---",
+                flush=True,
+            )
+    elif checkpoint is not None:
+        checkpoint.clear()
+
+    while start < num_frames:
+        stop = min(start + every, num_frames)
+        outputs = step(start, stop)
+        segments.append(outputs)
+        if checkpoint is not None and stop < num_frames:
+            try:
+                checkpoint.save(list(range(start, stop)), outputs, snapshot() if snapshot is not None else None)
+            except (pickle.PicklingError, TypeError, AttributeError, OSError) as exc:
+                print(f"--- [vibephysics] Warning: stream checkpointing disabled for this run ({exc}) ---")
+                checkpoint.clear()
+                checkpoint = None
+            else:
+                if verbose:
+                    print(f"--- [vibephysics] Stream checkpoint: {stop}/{num_frames} frames ---", flush=True)
+        start = stop
+
+    if checkpoint is not None:
+        checkpoint.clear()
+    return segments
@@ -0,0 +1,273 @@
+"""Deterministic procedural scenes as ``FeedforwardPrediction`` (no model, CPU only).
+
+A box-shaped room (floor, ceiling, four walls; checker-textured) seen from a camera
+gliding through it, with a few boxes sliding across the floor. Depth, confidence,
+world points and colors come from exact ray casting, so the geometry is known and
+runs are reproducible for a given seed — used by ``benchmarks/`` to time the
+post-processing stages without checkpoints.
+
+``engine: synthetic`` runs the same scene through ``reconstruct()`` (one rendered frame
+per selected input frame, optional simulated model latency), so input preparation,
+ground align, post-processing, save and export can be profiled on any CPU.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .schema import FeedforwardPrediction
+from .video_source import VideoFrameSource
+
+DEFAULT_HEIGHT = 240
+DEFAULT_WIDTH = 320
+# Engines return up-to-scale geometry of roughly unit depth; default NMS radii assume it.
+# ``run_synthetic`` applies it at DEFAULT_WIDTH and scales it with the frame width.
+DEFAULT_ENGINE_SCENE_SCALE = 0.25
+
+# Room bounds in the OpenCV world (x right, y down, z forward): floor at y = +1.4.
+ROOM_MIN = np.array([-3.0, -1.3, -4.0])
+ROOM_MAX = np.array([3.0, 1.4, 4.0])
+CAMERA_PITCH = 0.2  # radians, looking slightly down at the floor
+
+_ROOM_COLORS = np.array(
+    [
+        [0.80, 0.55, 0.50],  # -x wall
+        [0.50, 0.65, 0.80],  # +x wall
+        [0.95, 0.95, 0.92],  # ceiling (-y)
+        [0.55, 0.45, 0.35],  # floor (+y)
+        [0.70, 0.80, 0.60],  # -z wall
+        [0.85, 0.80, 0.55],  # +z wall
+    ],
+    dtype=np.float32,
+)
+
+
+def synthetic_camera_path(num_frames: int) -> tuple[np.ndarray, np.ndarray]:
+    """Camera-to-world rotations (S, 3, 3) and centers (S, 3) along a gentle S-curve."""
+    rotations = np.empty((num_frames, 3, 3), dtype=np.float64)
+    centers = np.empty((num_frames, 3), dtype=np.float64)
+    for i in range(num_frames):
+        t = i / max(num_frames - 1, 1)
+        yaw = 0.35 * math.sin(2.0 * math.pi * t)
+        forward = np.array(
+            [
+                math.sin(yaw) * math.cos(CAMERA_PITCH),
+                math.sin(CAMERA_PITCH),
+                math.cos(yaw) * math.cos(CAMERA_PITCH),
+            ]
+        )
+        right = np.array([math.cos(yaw), 0.0, -math.sin(yaw)])
+        down = np.cross(forward, right)
+        rotations[i] = np.stack([right, down, forward], axis=1)
+        centers[i] = [1.2 * math.sin(2.0 * math.pi * t), -0.1, -2.5 + 2.0 * t]
+    return rotations, centers
+
+
+def _synthetic_boxes(num_boxes: int, rng: np.random.Generator) -> list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """(min corner at t=0, size, velocity over the clip, color) per box resting on the floor."""
+    boxes = []
+    for _ in range(num_boxes):
+        size = rng.uniform([0.3, 0.3, 0.3], [0.7, 0.8, 0.7])
+        start = np.array(
+            [
+                rng.uniform(ROOM_MIN[0] + 0.5, ROOM_MAX[0] - 0.5 - size[0]),
+                ROOM_MAX[1] - size[1],
+                rng.uniform(0.0, ROOM_MAX[2] - 0.5 - size[2]),
+            ]
+        )
+        heading = rng.uniform(0.0, 2.0 * math.pi)
+        velocity = rng.uniform(0.5, 1.0) * np.array([math.cos(heading), 0.0, math.sin(heading)])
+        color = rng.uniform(0.2, 0.9, size=3).astype(np.float32)
+        boxes.append((start, size, velocity, color))
+    return boxes
+
+
+def _checker(points: np.ndarray, cell: float = 0.5) -> np.ndarray:
+    # Quarter-cell offset keeps the room planes (at whole/tenth meters) off cell borders.
+    parity = np.floor(points / cell + 0.25).astype(np.int64).sum(axis=1) % 2
+    return np.where(parity == 0, 1.0, 0.8).astype(np.float32)
+
+
+def make_synthetic_prediction(
+    num_frames: int = 16,
+    height: int = 120,
+    width: int = 160,
+    *,
+    num_boxes: int = 3,
+    seed: int = 0,
+    depth_noise: float = 0.002,
+    scene_scale: float = 1.0,
+    engine: str = "synthetic",
+) -> FeedforwardPrediction:
+    """
+    Ray-cast the synthetic room into an engine-shaped prediction.
+
+    ``depth_noise`` is a relative Gaussian perturbation of depth (0 = exact geometry).
+    ``scene_scale`` multiplies all world units (room in meters at 1.0); engines predict
+    up-to-scale geometry, so smaller scales mimic their normalized outputs.
+    Extrinsics are world-to-camera (3x4), as returned by the real engines.
+    """
+    if num_frames < 1 or height < 2 or width < 2:
+        raise ValueError("Synthetic scene needs num_frames >= 1 and at least 2x2 pixels")
+    rng = np.random.default_rng(seed)
+    boxes = _synthetic_boxes(int(num_boxes), rng)
+    rotations, centers = synthetic_camera_path(num_frames)
+    scene_scale = float(scene_scale)
+    if scene_scale <= 0:
+        raise ValueError("scene_scale must be positive")
+
+    focal = 0.8 * width
+    intrinsic = np.array(
+        [[focal, 0.0, width / 2.0], [0.0, focal, height / 2.0], [0.0, 0.0, 1.0]],
+        dtype=np.float32,
+    )
+    u, v = np.meshgrid(np.arange(width) + 0.5, np.arange(height) + 0.5)
+    rays_cam = np.stack(
+        [(u - width / 2.0) / focal, (v - height / 2.0) / focal, np.ones_like(u)],
+        axis=-1,
+    ).reshape(-1, 3)
+
+    depth = np.empty((num_frames, height, width), dtype=np.float32)
+    world_points = np.empty((num_frames, height, width, 3), dtype=np.float32)
+    images = np.empty((num_frames, height, width, 3), dtype=np.float32)
+    extrinsic = np.empty((num_frames, 3, 4), dtype=np.float32)
+
+    for i in range(num_frames):
+        t_clip = i / max(num_frames - 1, 1)
+        rotation, origin = rotations[i], centers[i]
+        dirs = rays_cam @ rotation.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv = 1.0 / dirs
+        # Exit distance from inside the room: nearest wall along each axis.
+        wall_t = np.where(dirs > 0, (ROOM_MAX - origin) * inv, (ROOM_MIN - origin) * inv)
+        wall_t = np.where(np.isfinite(wall_t) & (dirs != 0), wall_t, np.inf)
+        axis = np.argmin(wall_t, axis=1)
+        hit_t = wall_t[np.arange(len(dirs)), axis]
+        face = axis * 2 + (dirs[np.arange(len(dirs)), axis] > 0)
+        colors = _ROOM_COLORS[face]
+
+        for start, size, velocity, box_color in boxes:
+            lo = start + velocity * t_clip
+            hi = lo + size
+            with np.errstate(invalid="ignore"):
+                t1 = (lo - origin) * inv
+                t2 = (hi - origin) * inv
+            t_near = np.nanmax(np.minimum(t1, t2), axis=1)
+            t_far = np.nanmin(np.maximum(t1, t2), axis=1)
+            hit = (t_near <= t_far) & (t_near > 1e-6) & (t_near < hit_t)
+            hit_t = np.where(hit, t_near, hit_t)
+            colors = np.where(hit[:, None], box_color[None, :], colors)
+
+        if depth_noise > 0:
+            hit_t = hit_t * (1.0 + depth_noise * rng.standard_normal(len(hit_t)))
+        points = origin + dirs * hit_t[:, None]
+        # rays_cam has z == 1, so the ray parameter is the camera-space depth.
+        depth[i] = hit_t.reshape(height, width)
+        world_points[i] = points.reshape(height, width, 3)
+        images[i] = (colors * _checker(points)[:, None]).reshape(height, width, 3)
+        extrinsic[i, :, :3] = rotation.T
+        extrinsic[i, :, 3] = -rotation.T @ origin
+
+    conf = (1.0 + 9.0 * np.exp(-depth / 4.0)).astype(np.float32)
+    if scene_scale != 1.0:
+        depth *= scene_scale
+        world_points *= scene_scale
+        extrinsic[:, :, 3] *= scene_scale
+    return FeedforwardPrediction(
+        depth=depth,
+        conf=conf,
+        extrinsic=extrinsic,
+        intrinsic=np.repeat(intrinsic[None], num_frames, axis=0),
+        world_points=world_points,
+        image_paths=[f"synthetic/frame_{i:05d}.png" for i in range(num_frames)],
+        engine=engine,
+        images=images,
+        metadata={
+            "synthetic_seed": int(seed),
+            "synthetic_num_boxes": int(num_boxes),
+            "depth_noise": float(depth_noise),
+            "scene_scale": scene_scale,
+            "input_hw": [int(height), int(width)],
+            "w2c_as_camera_pose": False,
+        },
+    )
+
+
+def is_available() -> bool:
+    return True
+
+
+def run_synthetic(
+    image_path: Path,
+    *,
+    height: int = DEFAULT_HEIGHT,
+    width: int = DEFAULT_WIDTH,
+    latency_per_frame: float = 0.0,
+    num_boxes: int = 3,
+    seed: int = 0,
+    depth_noise: float = 0.002,
+    scene_scale: float = DEFAULT_ENGINE_SCENE_SCALE,
+    max_frames: int | None = None,
+    max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
+    frame_source: VideoFrameSource | None = None,
+    verbose: bool = True,
+) -> FeedforwardPrediction:
+    """
+    Stand-in engine: one synthetic frame per selected input frame, no model or weights.
+
+    Streamed video frames are still decoded (and discarded) so input I/O is profiled.
+    ``scene_scale`` is world units per meter at ``DEFAULT_WIDTH``; it is scaled with
+    ``width`` so the world-space pixel spacing (and so 3D NMS neighbor counts) stays
+    the same at any resolution.
+    """
+    from .common import discover_images, limit_image_frames
+
+    all_images = frame_source.frame_paths() if frame_source is not None else discover_images(image_path)
+    selected, indices, input_num_frames = limit_image_frames(
+        all_images,
+        max_frames,
+        mode=max_frames_mode,
+        indices=frame_indices,
+        verbose=verbose,
+        engine_label="synthetic",
+    )
+    if verbose:
+        print(
+            f"--- [vibephysics] Synthetic engine: {len(selected)} frames @ {height}x{width}, "
+            f"simulated latency {latency_per_frame:g}s/frame ---",
+            flush=True,
+        )
+
+    started_at = time.perf_counter()
+    if frame_source is not None:
+        for _ in frame_source.iter_frames(indices):
+            pass
+    prediction = make_synthetic_prediction(
+        len(selected),
+        int(height),
+        int(width),
+        num_boxes=num_boxes,
+        seed=seed,
+        depth_noise=depth_noise,
+        scene_scale=float(scene_scale) * int(width) / DEFAULT_WIDTH,
+    )
+    remaining = float(latency_per_frame) * len(selected) - (time.perf_counter() - started_at)
+    if remaining > 0:
+        time.sleep(remaining)
+
+    prediction.image_paths = [str(path) for path in selected]
+    prediction.metadata.update(
+        {
+            "selected_indices": indices,
+            "input_num_frames": input_num_frames,
+            "max_frames_mode": max_frames_mode,
+            "latency_per_frame": float(latency_per_frame),
+            "inference_device": "cpu",
+        }
+    )
+    return prediction
@@ -15,11 +15,14 @@ os.environ.setdefault("TORCHDYNAMO_DISABLE", "1")
 
 from ..common import (
     c2w_to_w2c,
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
+    filter_depth_conf_edges,
     get_vram_gb,
     images_chw_to_hwc,
     limit_image_frames,
+    resolve_cpu_quantize,
     resolve_torch_device,
 )
 from ..deps import ensure_engine_dependencies
@@ -29,33 +32,6 @@ DEFAULT_CACHE = feedforward_engine_dir("vgg_ttt")
 DEFAULT_MODEL_ID = "nvidia/vgg-ttt"
 
 
-def _depth_edge(depth: np.ndarray, rtol: float = 0.03, kernel_size: int = 3) -> np.ndarray:
-    depth = np.asarray(depth)
-    original_shape = depth.shape
-    depth = depth.reshape(-1, *original_shape[-2:])
-
-    pad = kernel_size // 2
-    padded = np.pad(depth, ((0, 0), (pad, pad), (pad, pad)), mode="edge")
-    depth_max = np.full_like(depth, -np.inf)
-    depth_min = np.full_like(depth, np.inf)
-
-    for y in range(kernel_size):
-        for x in range(kernel_size):
-            window = padded[:, y : y + depth.shape[-2], x : x + depth.shape[-1]]
-            depth_max = np.maximum(depth_max, window)
-            depth_min = np.minimum(depth_min, window)
-
-    relative_jump = (depth_max - depth_min) / np.maximum(np.abs(depth), 1e-6)
-    return (relative_jump > rtol).reshape(original_shape)
-
-
-def _filter_depth_conf_edges(depth: np.ndarray, conf: np.ndarray, *, rtol: float = 0.03) -> np.ndarray:
-    conf = conf.copy()
-    depth_for_edges = depth[..., 0] if depth.ndim == 4 else depth
-    conf[_depth_edge(depth_for_edges, rtol=rtol)] = 0.0
-    return conf
-
-
 def _predictions_to_numpy(predictions: dict) -> dict:
     predictions_np = {}
     for key, value in predictions.items():
@@ -149,11 +125,13 @@ def run_vgg_ttt(
     image_size: int = 518,
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
     filter_depth_edges: bool = True,
     depth_edge_rtol: float = 0.03,
     conf_percentile: float = 50.0,
     num_ttt_steps: int | None = 1,
     memory_efficient_inference: bool = False,
+    cpu_quantize: str | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
     if not ensure_dependencies(verbose):
@@ -171,6 +149,7 @@ def run_vgg_ttt(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label="VGG-T³",
     )
@@ -193,10 +172,15 @@ def run_vgg_ttt(
             flush=True,
         )
 
+    cpu_quantize = resolve_cpu_quantize(cpu_quantize, device, verbose=verbose)
     with _cuda_fallback_context(device):
         if verbose:
             print(f"--- [vibephysics] Loading model {model_id} ---", flush=True)
-        model = VGGT.from_pretrained(model_id).eval().to(device)
+        model = cpu_quantized_model(
+            lambda: VGGT.from_pretrained(model_id).eval().to(device),
+            cpu_quantize=cpu_quantize,
+            verbose=verbose,
+        )
 
         # Official API: load_and_preprocess_images(...) -> infer(images)
         images = load_and_preprocess_images(
@@ -231,7 +215,7 @@ def run_vgg_ttt(
         conf = conf[..., None]
 
     if filter_depth_edges:
-        conf = _filter_depth_conf_edges(depth, conf, rtol=depth_edge_rtol)
+        conf = filter_depth_conf_edges(depth, conf, rtol=depth_edge_rtol)
 
     pose_c2w = predictions_np["pose"]
     if pose_c2w.shape[-2:] == (4, 4):
@@ -272,6 +256,7 @@ def run_vgg_ttt(
             "input_num_frames": input_num_frames,
             "max_frames_mode": max_frames_mode,
             "inference_device": device,
+            "cpu_quantize": cpu_quantize,
             "inference_api": "vggttt.VGGT.infer",
             "vram_gb": get_vram_gb(),
             "input_hw": [int(h), int(w)],
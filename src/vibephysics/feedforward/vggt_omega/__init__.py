@@ -10,15 +10,21 @@ from pathlib import Path
 import numpy as np
 
 from ..common import (
+    cpu_quantized_model,
     discover_images,
     feedforward_engine_dir,
+    filter_depth_conf_edges,
     get_vram_gb,
     images_chw_to_hwc,
     limit_image_frames,
+    pooled_model,
+    resolve_cpu_quantize,
     resolve_torch_device,
 )
 from ..deps import ensure_engine_dependencies, pip_install
 from ..schema import FeedforwardPrediction
+from ..weights import load_checkpoint_into
+from ..window_align import apply_sim3, measure_window, overlap_sim3, plan_frame_windows
 
 DEFAULT_CACHE = feedforward_engine_dir("vggt_omega")
 
@@ -27,6 +33,9 @@ CHECKPOINT_FILES = {
     "vggt-omega-1b-256-text": ("facebook/VGGT-Omega", "vggt_omega_1b_256_text.pt"),
 }
 
+# Above this many frames on CPU without chunking, suggest vggt_omega.chunk_size.
+_CPU_CHUNK_HINT_FRAMES = 48
+
 _HF_TOKEN_ENV_KEYS = ("HF_TOKEN", "HUGGING_FACE_HUB_TOKEN", "HUGGINGFACE_HUB_TOKEN")
 
 _VRAM_BENCHMARK = {
@@ -74,33 +83,6 @@ def _unproject_depth_map_to_point_map(
     ).astype(np.float32)
 
 
-def _depth_edge(depth: np.ndarray, rtol: float = 0.03, kernel_size: int = 3) -> np.ndarray:
-    depth = np.asarray(depth)
-    original_shape = depth.shape
-    depth = depth.reshape(-1, *original_shape[-2:])
-
-    pad = kernel_size // 2
-    padded = np.pad(depth, ((0, 0), (pad, pad), (pad, pad)), mode="edge")
-    depth_max = np.full_like(depth, -np.inf)
-    depth_min = np.full_like(depth, np.inf)
-
-    for y in range(kernel_size):
-        for x in range(kernel_size):
-            window = padded[:, y : y + depth.shape[-2], x : x + depth.shape[-1]]
-            depth_max = np.maximum(depth_max, window)
-            depth_min = np.minimum(depth_min, window)
-
-    relative_jump = (depth_max - depth_min) / np.maximum(np.abs(depth), 1e-6)
-    return (relative_jump > rtol).reshape(original_shape)
-
-
-def _filter_depth_conf_edges(depth: np.ndarray, conf: np.ndarray, *, rtol: float = 0.03) -> np.ndarray:
-    conf = conf.copy()
-    depth_for_edges = depth[..., 0] if depth.ndim == 4 else depth
-    conf[_depth_edge(depth_for_edges, rtol=rtol)] = 0.0
-    return conf
-
-
 def is_available() -> bool:
     return importlib.util.find_spec("vggt_omega") is not None
 
@@ -265,11 +247,23 @@ def run_vggt_omega(
     enable_alignment: bool = False,
     max_frames: int | None = None,
     max_frames_mode: str = "first",
+    frame_indices: list[int] | None = None,
     filter_depth_edges: bool = True,
     depth_edge_rtol: float = 0.03,
     conf_percentile: float = 50.0,
+    chunk_size: int | None = None,
+    chunk_overlap: int = 8,
+    cpu_quantize: str | None = None,
     verbose: bool = True,
 ) -> FeedforwardPrediction:
+    """
+    Run VGGT-Omega on the frames in ``image_path``.
+
+    ``chunk_size`` > 0 runs overlapping windows of that many frames (sharing
+    ``chunk_overlap``) and stitches them with a Sim(3) fit on the shared frames, so
+    peak memory follows the window instead of the clip length. ``cpu_quantize="int8"``
+    runs the Linear layers as dynamic int8 on CPU.
+    """
     if not ensure_dependencies(verbose):
         raise RuntimeError(
             "VGGT-Omega not installed. Run: ./run_feedforward.sh --method vggt_omega "
@@ -293,6 +287,7 @@ def run_vggt_omega(
         all_images,
         max_frames,
         mode=max_frames_mode,
+        indices=frame_indices,
         verbose=verbose,
         engine_label="VGGT-Omega",
     )
@@ -300,6 +295,7 @@ def run_vggt_omega(
 
     if preprocess_mode not in ("balanced", "max_size"):
         raise ValueError("preprocess_mode must be 'balanced' or 'max_size'")
+    windows = plan_frame_windows(len(str_paths), chunk_size, chunk_overlap)
 
     if verbose:
         print(
@@ -312,51 +308,128 @@ def run_vggt_omega(
     if device == "cpu" and verbose:
         print("--- [vibephysics] Warning: VGGT-Omega expects CUDA; running on CPU ---")
 
-    model = VGGTOmega(enable_alignment=enable_alignment).to(device).eval()
-    model.load_state_dict(torch.load(str(ckpt), map_location="cpu"))
-
-    images = load_and_preprocess_images(
-        str_paths,
-        mode=preprocess_mode,
-        image_resolution=image_resolution,
-    ).to(device)
-    if verbose:
-        print(f"--- [vibephysics] Preprocessed to {tuple(images.shape)} ---")
-
-    with torch.inference_mode():
-        predictions = model(images)
+    cpu_quantize = resolve_cpu_quantize(cpu_quantize, device, verbose=verbose)
+
+    def _load_model():
+        return cpu_quantized_model(
+            lambda: VGGTOmega(enable_alignment=enable_alignment).to(device).eval(),
+            load_weights=lambda model: load_checkpoint_into(model, ckpt, keys=(), verbose=verbose),
+            cpu_quantize=cpu_quantize,
+            checkpoint=ckpt,
+            cache_dir=ckpt.parent,
+            variant=enable_alignment,
+            verbose=verbose,
+        )
 
-    extrinsic, intrinsic = encoding_to_camera(
-        predictions["pose_enc"],
-        predictions["images"].shape[-2:],
+    model = pooled_model(
+        ("vggt_omega", str(ckpt), enable_alignment, str(device), cpu_quantize),
+        _load_model,
+        verbose=verbose,
     )
-    predictions["extrinsic"] = extrinsic
-    predictions["intrinsic"] = intrinsic
-
-    predictions_np = _predictions_to_numpy(predictions)
-    depth = predictions_np["depth"]
-    if depth.ndim == 3:
-        depth = depth[..., None]
 
-    conf = predictions_np["depth_conf"]
-    if conf.ndim == 3:
-        conf = conf[..., None]
+    if len(windows) > 1 and verbose:
+        print(
+            f"--- [vibephysics] VGGT-Omega: {len(windows)} windows of <= {chunk_size} frames "
+            f"({chunk_overlap} overlap, Sim(3)-stitched) ---"
+        )
+    elif device == "cpu" and len(str_paths) > _CPU_CHUNK_HINT_FRAMES and verbose:
+        print(
+            "--- [vibephysics] Tip: set vggt_omega.chunk_size (e.g. 32) to bound CPU memory "
+            "on long clips ---"
+        )
 
-    extrinsic_np = predictions_np["extrinsic"]
-    if extrinsic_np.ndim == 4 and extrinsic_np.shape[-2:] == (4, 4):
-        extrinsic_np = extrinsic_np[:, :3, :4]
+    def _infer(paths: list[str]) -> dict:
+        images = load_and_preprocess_images(
+            paths,
+            mode=preprocess_mode,
+            image_resolution=image_resolution,
+        ).to(device)
+        if verbose and len(windows) == 1:
+            print(f"--- [vibephysics] Preprocessed to {tuple(images.shape)} ---")
+
+        with torch.inference_mode():
+            predictions = model(images)
+
+        extrinsic, intrinsic = encoding_to_camera(
+            predictions["pose_enc"],
+            predictions["images"].shape[-2:],
+        )
+        predictions["extrinsic"] = extrinsic
+        predictions["intrinsic"] = intrinsic
+        return _predictions_to_numpy(predictions)
+
+    window_stats: list[dict] = []
+    depth = conf = extrinsic_np = intrinsic_np = world_points = rgb = None
+    for index, (start, stop) in enumerate(windows):
+        with measure_window(window_stats, start, stop) as record:
+            predictions_np = _infer(str_paths[start:stop])
+            window_depth = predictions_np["depth"]
+            if window_depth.ndim == 4:
+                window_depth = window_depth[..., 0]
+            window_conf = predictions_np["depth_conf"]
+            if window_conf.ndim == 4:
+                window_conf = window_conf[..., 0]
+            window_extrinsic = predictions_np["extrinsic"][..., :3, :4]
+            window_intrinsic = predictions_np["intrinsic"]
+            window_points = _unproject_depth_map_to_point_map(window_depth, window_extrinsic, window_intrinsic)
+            window_rgb = images_chw_to_hwc(predictions_np["images"])
+            del predictions_np
+
+            if depth is None:
+                total = len(str_paths)
+                depth = np.empty((total, *window_depth.shape[1:]), dtype=np.float32)
+                conf = np.empty_like(depth)
+                extrinsic_np = np.empty((total, 3, 4), dtype=np.float32)
+                intrinsic_np = np.empty((total, 3, 3), dtype=np.float32)
+                world_points = np.empty((*depth.shape, 3), dtype=np.float32)
+                rgb = np.empty((*depth.shape, 3), dtype=np.float32)
+            elif window_depth.shape[1:] != depth.shape[1:]:
+                raise RuntimeError(
+                    f"VGGT-Omega window {index + 1} preprocessed to {window_depth.shape[1:]}, "
+                    f"expected {depth.shape[1:]}; mixed image sizes need vggt_omega.chunk_size: 0"
+                )
+
+            if index > 0:
+                shared = slice(start, windows[index - 1][1])
+                count = shared.stop - shared.start
+                scale, rotation, translation, rmse = overlap_sim3(
+                    world_points[shared],
+                    conf[shared],
+                    extrinsic_np[shared],
+                    window_points[:count],
+                    window_conf[:count],
+                    window_extrinsic[:count],
+                )
+                window_extrinsic, window_depth, window_points = apply_sim3(
+                    scale,
+                    rotation,
+                    translation,
+                    extrinsic=window_extrinsic,
+                    depth=window_depth,
+                    world_points=window_points,
+                )
+                record.update(scale=scale, align_rmse=rmse)
+                if verbose:
+                    print(
+                        f"--- [vibephysics] VGGT-Omega window {index + 1}/{len(windows)} "
+                        f"(frames {start}-{stop - 1}): scale {scale:.3f}, overlap RMSE {rmse:.4f} ---"
+                    )
+
+            # Overlap frames keep the earlier window's prediction; only new frames are written.
+            skip = windows[index - 1][1] - start if index > 0 else 0
+            new = slice(start + skip, stop)
+            depth[new] = window_depth[skip:]
+            conf[new] = window_conf[skip:]
+            extrinsic_np[new] = window_extrinsic[skip:]
+            intrinsic_np[new] = window_intrinsic[skip:]
+            world_points[new] = window_points[skip:]
+            rgb[new] = window_rgb[skip:]
+            del window_depth, window_conf, window_points, window_rgb
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
 
-    intrinsic_np = predictions_np["intrinsic"]
     if filter_depth_edges:
-        conf = _filter_depth_conf_edges(depth, conf, rtol=depth_edge_rtol)
-
-    world_points = _unproject_depth_map_to_point_map(depth, extrinsic_np, intrinsic_np)
-    rgb = images_chw_to_hwc(predictions_np["images"])
-
-    if depth.ndim == 4:
-        depth = depth[..., 0]
-    if conf.ndim == 4:
-        conf = conf[..., 0]
+        conf = filter_depth_conf_edges(depth, conf, rtol=depth_edge_rtol)
 
     h, w = rgb.shape[1:3]
     if torch.cuda.is_available():
@@ -364,11 +437,11 @@ def run_vggt_omega(
 
     return FeedforwardPrediction(
         images=rgb,
-        depth=depth.astype(np.float32),
-        conf=conf.astype(np.float32),
-        extrinsic=extrinsic_np.astype(np.float32),
-        intrinsic=intrinsic_np.astype(np.float32),
-        world_points=world_points.astype(np.float32),
+        depth=depth,
+        conf=conf.astype(np.float32, copy=False),
+        extrinsic=extrinsic_np,
+        intrinsic=intrinsic_np,
+        world_points=world_points,
         image_paths=str_paths,
         engine="vggt_omega",
         metadata={
@@ -387,6 +460,10 @@ def run_vggt_omega(
             "conf_percentile": float(conf_percentile),
             "filter_depth_edges": filter_depth_edges,
             "depth_edge_rtol": depth_edge_rtol,
+            "chunk_size": int(chunk_size or 0),
+            "chunk_overlap": int(chunk_overlap),
+            "inference_windows": window_stats,
+            "cpu_quantize": cpu_quantize,
             "w2c_as_camera_pose": False,
         },
     )
@@ -0,0 +1,332 @@
+"""In-process video decoding at a target fps (PyAV, else OpenCV) — no JPEG round trip.
+
+The ffmpeg path (``video.decode: ffmpeg``) writes every sampled frame to
+``frame_%04d.jpg`` and each engine decodes the JPEGs again. With
+``video.decode: stream`` a :class:`VideoFrameSource` decodes the selected frames
+straight into RGB arrays for engines that preprocess in-process
+(``EngineSpec.streams_frames``); JPEGs are only written when ``video.persist_frames`` is on
+or the engine's upstream loader needs files.
+
+Sampling follows ffmpeg's ``fps`` filter (each source timestamp rounded to the
+nearest output tick; every tick shows the latest frame at or before it), so frame
+counts and ``frame_%04d`` numbering match the extracted folder.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+VIDEO_DECODE_MODES = ("ffmpeg", "stream")
+VIDEO_DECODE_BACKENDS = ("auto", "pyav", "opencv")
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    source_fps: float
+    width: int
+    height: int
+    source_frames: int
+    start_time: float
+
+
+def normalize_video_decode(mode: str | None) -> str:
+    normalized = str(mode or "ffmpeg").strip().lower()
+    if normalized not in VIDEO_DECODE_MODES:
+        raise ValueError(f"Unknown video.decode '{mode}'. Choose one of: {', '.join(VIDEO_DECODE_MODES)}")
+    return normalized
+
+
+def resolve_video_backend(backend: str | None = "auto") -> str:
+    """``pyav`` when installed, else ``opencv``; explicit choices must be importable."""
+    backend = str(backend or "auto").strip().lower()
+    if backend not in VIDEO_DECODE_BACKENDS:
+        raise ValueError(
+            f"Unknown video.backend '{backend}'. Choose one of: {', '.join(VIDEO_DECODE_BACKENDS)}"
+        )
+    has_av = importlib.util.find_spec("av") is not None
+    has_cv2 = importlib.util.find_spec("cv2") is not None
+    if backend == "auto":
+        if has_av:
+            return "pyav"
+        if has_cv2:
+            return "opencv"
+    elif backend == "pyav" and has_av:
+        return backend
+    elif backend == "opencv" and has_cv2:
+        return backend
+    raise RuntimeError(
+        "video.decode: stream needs PyAV or OpenCV. Install with: pip install av "
+        "(or opencv-python), or set video.decode: ffmpeg"
+    )
+
+
+def engine_streams_frames(engine: str, *, lingbot_map_preprocess_mode: str | None = None) -> bool:
+    """True when ``engine`` can take decoded frames instead of image files (lingbot_map: center_square only)."""
+    from .engines import get_engine
+
+    if not getattr(get_engine(engine), "streams_frames", False):
+        return False
+    if engine == "lingbot_map":
+        return (lingbot_map_preprocess_mode or "center_square") == "center_square"
+    return True
+
+
+def _output_tick(timestamp: float, start_time: float, fps: float) -> int:
+    # ffmpeg fps filter, round=near: halves round away from zero.
+    return int(np.floor((timestamp - start_time) * fps + 0.5))
+
+
+class VideoFrameSource:
+    """
+    Frames of one video sampled at ``fps``, decoded on demand.
+
+    ``frame_paths()`` returns virtual ``<video>#frame_0001`` paths so the usual frame
+    selection (``limit_image_frames``) and ``image_paths`` bookkeeping work unchanged;
+    ``iter_frames`` / ``read_frames`` decode only the requested output indices.
+    """
+
+    def __init__(self, video_path: str | Path, fps: float | None = None, *, backend: str | None = "auto"):
+        from .common import DEFAULT_VIDEO_FPS
+
+        self.video_path = Path(video_path).absolute()
+        if not self.video_path.is_file():
+            raise FileNotFoundError(f"Video file does not exist: {self.video_path}")
+        self.fps = DEFAULT_VIDEO_FPS if fps is None else float(fps)
+        if self.fps <= 0:
+            raise ValueError("video fps must be positive")
+        self.backend = resolve_video_backend(backend)
+        self._info: VideoInfo | None = None
+        self._timestamps: list[float] | None = None
+        self._fingerprint: str | None = None
+
+    # -- probing ------------------------------------------------------------------
+
+    def _probe_pyav(self) -> tuple[VideoInfo, list[float]]:
+        import av
+
+        with av.open(str(self.video_path)) as container:
+            stream = container.streams.video[0]
+            time_base = float(stream.time_base)
+            # Demux only (no decode): packet pts are enough to place every frame.
+            timestamps = sorted(
+                float(packet.pts) * time_base
+                for packet in container.demux(stream)
+                if packet.pts is not None and packet.size
+            )
+            rate = stream.average_rate or stream.guessed_rate
+            info = VideoInfo(
+                source_fps=float(rate) if rate else 0.0,
+                width=int(stream.codec_context.width),
+                height=int(stream.codec_context.height),
+                source_frames=len(timestamps),
+                start_time=timestamps[0] if timestamps else 0.0,
+            )
+        return info, timestamps
+
+    def _probe_opencv(self) -> tuple[VideoInfo, list[float]]:
+        import cv2
+
+        capture = cv2.VideoCapture(str(self.video_path))
+        try:
+            if not capture.isOpened():
+                raise RuntimeError(f"OpenCV could not open {self.video_path}")
+            source_fps = float(capture.get(cv2.CAP_PROP_FPS)) or 30.0
+            count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            info = VideoInfo(
+                source_fps=source_fps,
+                width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                source_frames=count,
+                start_time=0.0,
+            )
+        finally:
+            capture.release()
+        # Constant frame rate assumed: OpenCV cannot read pts without decoding.
+        return info, [index / source_fps for index in range(count)]
+
+    def _probe(self) -> None:
+        if self._info is not None:
+            return
+        probe = self._probe_pyav if self.backend == "pyav" else self._probe_opencv
+        self._info, self._timestamps = probe()
+        if not self._timestamps:
+            raise RuntimeError(f"No video frames found in {self.video_path}")
+
+    @property
+    def info(self) -> VideoInfo:
+        self._probe()
+        return self._info
+
+    def __len__(self) -> int:
+        self._probe()
+        return _output_tick(self._timestamps[-1], self._info.start_time, self.fps) + 1
+
+    def frame_paths(self) -> list[Path]:
+        """Virtual per-frame paths, numbered like ffmpeg's ``frame_%04d.jpg`` output."""
+        return [Path(f"{self.video_path}#frame_{index + 1:04d}") for index in range(len(self))]
+
+    def fingerprint(self) -> str:
+        """The frame cache's video identity (size, mtime, sampled blocks); no full read of the file."""
+        if self._fingerprint is None:
+            from .frame_cache import video_fingerprint
+
+            self._fingerprint = video_fingerprint(self.video_path)
+        return self._fingerprint
+
+    def frame_keys(self) -> list[str]:
+        """Per-frame identities for the inference cache (video fingerprint + sampling)."""
+        prefix = f"{self.fingerprint()}:{self.fps:g}:{self.backend}"
+        return [f"{prefix}:{index}" for index in range(len(self))]
+
+    # -- decoding -----------------------------------------------------------------
+
+    def _source_coverage(self) -> list[range]:
+        """Output ticks shown by each source frame (empty when a later frame shares its tick)."""
+        self._probe()
+        ticks = [_output_tick(t, self._info.start_time, self.fps) for t in self._timestamps]
+        ends = ticks[1:] + [len(self)]
+        return [range(start, max(start, end)) for start, end in zip(ticks, ends)]
+
+    def _decoded_pyav(self) -> Iterator[object]:
+        import av
+
+        with av.open(str(self.video_path)) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            yield from container.decode(stream)
+
+    def _decoded_opencv(self) -> Iterator[object]:
+        import cv2
+
+        capture = cv2.VideoCapture(str(self.video_path))
+        try:
+            # grab() decodes; the BGR copy happens in _to_rgb only for frames that are kept.
+            while capture.grab():
+                yield capture
+        finally:
+            capture.release()
+
+    def _to_rgb(self, handle) -> np.ndarray:
+        if self.backend == "pyav":
+            return handle.to_ndarray(format="rgb24")
+        import cv2
+
+        ok, bgr = handle.retrieve()
+        if not ok:
+            raise RuntimeError(f"OpenCV failed to decode a frame from {self.video_path}")
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+    def iter_frames(self, indices: list[int] | None = None) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Yield ``(output_index, rgb_uint8_hwc)`` in ascending index order.
+
+        ``indices`` restricts the RGB conversion to those output frames; decoding stops
+        after the last one.
+        """
+        total = len(self)
+        if indices is None:
+            wanted = set(range(total))
+        else:
+            wanted = {int(index) for index in indices if 0 <= int(index) < total}
+        if not wanted:
+            return
+        last_wanted = max(wanted)
+        coverage = self._source_coverage()
+        decoded = self._decoded_pyav() if self.backend == "pyav" else self._decoded_opencv()
+        try:
+            for source_index, handle in enumerate(decoded):
+                if source_index >= len(coverage):
+                    break
+                shown = [tick for tick in coverage[source_index] if tick in wanted]
+                if shown:
+                    rgb = self._to_rgb(handle)
+                    for tick in shown:
+                        yield tick, rgb
+                if coverage[source_index].stop > last_wanted:
+                    break
+        finally:
+            decoded.close()
+
+    def read_frames(self, indices: list[int] | None = None) -> list[np.ndarray]:
+        """Decoded RGB uint8 frames for ``indices`` (all frames when None), in that order."""
+        frames = dict(self.iter_frames(indices))
+        order = range(len(self)) if indices is None else indices
+        missing = [index for index in order if index not in frames]
+        if missing:
+            raise RuntimeError(f"Could not decode frames {missing[:5]} from {self.video_path}")
+        return [frames[index] for index in order]
+
+    def sequential_reader(self, indices: list[int] | None = None) -> "_SequentialFrameReader":
+        """
+        A ``read_frames`` that decodes ``indices`` in one front-to-back pass across calls
+        (each call must ask for later frames than the previous one). ``close()`` it when done.
+        """
+        return _SequentialFrameReader(self, indices)
+
+    def persist_jpegs(self, output_dir: str | Path, *, quality: int = 2, verbose: bool = True) -> Path:
+        """Write ``frame_%04d.jpg`` + the extract fps stamp (ffmpeg-compatible folder)."""
+        from PIL import Image
+
+        from .reconstruct import write_extract_fps
+
+        output_dir = Path(output_dir).absolute()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # ffmpeg -q:v 2..31 (lower is better) -> PIL quality 97..10.
+        jpeg_quality = int(np.clip(100 - 3 * (int(quality) - 1), 10, 97))
+        if verbose:
+            print(
+                f"--- [vibephysics] Decoding {self.video_path.name} at {self.fps:g} fps "
+                f"({self.backend}) to {output_dir} ---",
+                flush=True,
+            )
+        count = 0
+        for index, rgb in self.iter_frames():
+            Image.fromarray(rgb).save(output_dir / f"frame_{index + 1:04d}.jpg", quality=jpeg_quality)
+            count += 1
+        if not count:
+            raise RuntimeError(f"No frames decoded from {self.video_path}")
+        write_extract_fps(output_dir, self.fps)
+        if verbose:
+            print(f"--- [vibephysics] Extracted {count} frames to {output_dir} ---")
+        return output_dir
+
+
+class _SequentialFrameReader:
+    """One ``iter_frames`` pass shared by successive ``read_frames`` calls (ascending indices)."""
+
+    def __init__(self, source: VideoFrameSource, indices: list[int] | None):
+        self._source = source
+        self._frames = source.iter_frames(indices)
+        self._pending: tuple[int, np.ndarray] | None = None
+        self._floor = -1
+
+    def read_frames(self, indices: list[int]) -> list[np.ndarray]:
+        wanted = sorted({int(index) for index in indices})
+        if wanted and wanted[0] <= self._floor:
+            raise ValueError(
+                f"Frame {wanted[0]} requested after frame {self._floor}; a sequential reader only moves forward"
+            )
+        frames = {}
+        for index in wanted:
+            while self._pending is None or self._pending[0] < index:
+                item = next(self._frames, None)
+                if item is None:
+                    break
+                self._pending = item
+            if self._pending is not None and self._pending[0] == index:
+                frames[index] = self._pending[1]
+        if wanted:
+            self._floor = wanted[-1]
+        missing = [index for index in wanted if index not in frames]
+        if missing:
+            raise RuntimeError(f"Could not decode frames {missing[:5]} from {self._source.video_path}")
+        return [frames[int(index)] for index in indices]
+
+    def close(self) -> None:
+        self._frames.close()
+        self._pending = None
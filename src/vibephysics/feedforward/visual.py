@@ -17,7 +17,7 @@ from mathutils import Matrix
 
 from .common import is_lingbot_map_engine, is_vgg_ttt_engine, is_vggt_omega_engine
 from .common import collect_colored_point_cloud, resolve_confidence_threshold
-from .config import DEFAULT_POINT_SCALE
+from .config import DEFAULT_POINT_SCALE, normalize_animation_mode
 from .schema import FeedforwardPrediction, load_prediction
 
 ENGINE_COLLECTION_NAMES = {
@@ -45,7 +45,6 @@ PLAYBACK_CAMERA_CLIP_START = 0.01
 PLAYBACK_CAMERA_CLIP_END = 1000.0
 CAMERA_TRAJECTORY_RADIUS = 0.0008
 DEFAULT_POINT_RADIUS = DEFAULT_POINT_SCALE
-ANIMATION_MODES = ("progressive", "discrete")
 
 
 def _srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
@@ -72,7 +71,7 @@ class _AnimationTiming:
         self.num_frames = max(int(num_frames), 1)
         self.animation_fps = max(float(animation_fps), 1.0)
         self.video_fps = max(float(video_fps), 1e-6)
-        self.mode = _normalize_animation_mode(mode)
+        self.mode = normalize_animation_mode(mode)
         self.frames_per_recon = self.animation_fps / self.video_fps
         self.frames_per_slot = max(int(round(self.frames_per_recon)), 1)
         self.timeline_start = 1
@@ -124,15 +123,6 @@ class _AnimationTiming:
         return self.playback_frame_end
 
 
-def _normalize_animation_mode(mode: str) -> str:
-    normalized = str(mode).strip().lower()
-    if normalized not in ANIMATION_MODES:
-        raise ValueError(
-            f"Unknown animation_mode '{mode}'. Choose one of: {', '.join(ANIMATION_MODES)}"
-        )
-    return normalized
-
-
 def _ensure_collection(name: str, parent=None) -> bpy.types.Collection:
     if name in bpy.data.collections:
         col = bpy.data.collections[name]
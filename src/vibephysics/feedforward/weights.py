@@ -0,0 +1,218 @@
+"""Checkpoint loading without a second in-RAM copy of the weights.
+
+``torch.load`` of a ``.pt`` file materializes the whole state dict in anonymous memory
+and ``load_state_dict`` then copies it into the module, so peak RSS is about twice
+the model. :func:`load_checkpoint_state_dict` instead maps the file:
+
+- ``.safetensors`` via ``safetensors.safe_open`` (tensors are views of the mapped file);
+- ``.pt`` via ``torch.load(mmap=True)`` (zip-format checkpoints), else a plain load;
+- a ``.pt`` path with a newer ``.safetensors`` sibling loads the sibling.
+
+:func:`load_state_dict_into` assigns the mapped tensors as the module's parameters
+when the module is on CPU and shapes / dtypes match (no copy); otherwise it copies as
+usual. Existing ``.pt`` checkpoints are converted once with::
+
+    python -m vibephysics.feedforward.weights convert path/to/model.pt
+    python -m vibephysics.feedforward.weights convert          # every engine .pt in the cache
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+STATE_DICT_KEYS = ("state_dict", "model")
+# Quantized-weight caches (``common.cpu_quantized_model``) hold packed params, not tensors.
+_SKIP_CONVERT_MARKER = "-dynamic."
+
+
+def safetensors_sibling(path: str | Path) -> Path:
+    return Path(path).with_suffix(".safetensors")
+
+
+def _preferred_checkpoint(path: Path) -> Path:
+    if path.suffix == ".safetensors":
+        return path
+    sibling = safetensors_sibling(path)
+    try:
+        if sibling.is_file() and sibling.stat().st_mtime >= path.stat().st_mtime:
+            return sibling
+    except OSError:
+        pass
+    return path
+
+
+def unwrap_state_dict(checkpoint: Mapping[str, Any], keys: Iterable[str] = STATE_DICT_KEYS) -> Mapping[str, Any]:
+    """The tensor mapping inside a training checkpoint (``{"model": {...}}``, ...)."""
+    for key in keys:
+        nested = checkpoint.get(key)
+        if isinstance(nested, Mapping):
+            return nested
+    return checkpoint
+
+
+def _load_safetensors(path: Path, device: str) -> dict[str, Any]:
+    from safetensors import safe_open
+
+    with safe_open(str(path), framework="pt", device=device) as handle:
+        return {key: handle.get_tensor(key) for key in handle.keys()}
+
+
+def _load_torch(path: Path, device: str) -> Any:
+    import torch
+
+    try:
+        return torch.load(str(path), map_location=device, weights_only=False, mmap=True)
+    except (RuntimeError, TypeError):
+        # Legacy (non-zip) checkpoints and older torch cannot be mapped.
+        return torch.load(str(path), map_location=device, weights_only=False)
+
+
+def load_checkpoint_state_dict(
+    path: str | Path,
+    *,
+    device: str = "cpu",
+    keys: Iterable[str] = STATE_DICT_KEYS,
+    verbose: bool = False,
+) -> Mapping[str, Any]:
+    """Memory-mapped state dict of ``path`` (see module docstring for the lookup order)."""
+    source = _preferred_checkpoint(Path(path))
+    if verbose and source != Path(path):
+        print(f"--- [vibephysics] Loading safetensors copy: {source} ---", flush=True)
+    if source.suffix == ".safetensors":
+        return _load_safetensors(source, str(device))
+    checkpoint = _load_torch(source, str(device))
+    return unwrap_state_dict(checkpoint, keys) if isinstance(checkpoint, Mapping) else checkpoint
+
+
+def _can_assign(model, state_dict: Mapping[str, Any]) -> bool:
+    own = model.state_dict(keep_vars=True)
+    if any(tensor.device.type != "cpu" for tensor in own.values()):
+        return False
+    # Tied weights would be untied by assignment.
+    pointers = [tensor.data_ptr() for tensor in own.values() if tensor.numel()]
+    if len(pointers) != len(set(pointers)):
+        return False
+    for key, value in state_dict.items():
+        target = own.get(key)
+        if target is not None and (target.dtype != value.dtype or target.shape != value.shape):
+            return False
+    return True
+
+
+def load_state_dict_into(model, state_dict: Mapping[str, Any], *, strict: bool = True):
+    """``model.load_state_dict`` that adopts mapped CPU tensors instead of copying them."""
+    if _can_assign(model, state_dict):
+        try:
+            return model.load_state_dict(state_dict, strict=strict, assign=True)
+        except TypeError:  # torch < 2.1
+            pass
+    return model.load_state_dict(state_dict, strict=strict)
+
+
+def load_checkpoint_into(
+    model,
+    path: str | Path,
+    *,
+    strict: bool = True,
+    device: str = "cpu",
+    keys: Iterable[str] = STATE_DICT_KEYS,
+    verbose: bool = False,
+):
+    """Load ``path`` into ``model`` via :func:`load_checkpoint_state_dict` / :func:`load_state_dict_into`."""
+    state_dict = load_checkpoint_state_dict(path, device=device, keys=keys, verbose=verbose)
+    return load_state_dict_into(model, state_dict, strict=strict)
+
+
+def convert_checkpoint_to_safetensors(
+    path: str | Path,
+    output: str | Path | None = None,
+    *,
+    keys: Iterable[str] = STATE_DICT_KEYS,
+    overwrite: bool = False,
+    verbose: bool = True,
+) -> Path:
+    """
+    Write a ``.safetensors`` copy of a ``.pt`` checkpoint's state dict (next to it by
+    default) and return its path; an up-to-date copy is reused unless ``overwrite``.
+    """
+    import torch
+    from safetensors.torch import save_file
+
+    path = Path(path)
+    output = Path(output) if output is not None else safetensors_sibling(path)
+    if not overwrite and output.is_file() and output.stat().st_mtime >= path.stat().st_mtime:
+        if verbose:
+            print(f"--- [vibephysics] Up to date: {output} ---", flush=True)
+        return output
+
+    checkpoint = _load_torch(path, "cpu")
+    state_dict = unwrap_state_dict(checkpoint, keys) if isinstance(checkpoint, Mapping) else checkpoint
+    tensors: dict[str, Any] = {}
+    seen: set[int] = set()
+    for key, value in state_dict.items():
+        if not isinstance(value, torch.Tensor):
+            continue
+        # safetensors refuses aliased storage; the rare shared tensor gets its own copy.
+        pointer = value.untyped_storage().data_ptr()
+        value = value.contiguous()
+        tensors[key] = value.clone() if pointer in seen and value.numel() else value
+        seen.add(pointer)
+    if not tensors:
+        raise ValueError(f"No tensors found in checkpoint {path}")
+
+    tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    try:
+        save_file(tensors, str(tmp_path), metadata={"source": path.name})
+        os.replace(tmp_path, output)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    if verbose:
+        print(f"--- [vibephysics] Wrote {output} ({len(tensors)} tensors) ---", flush=True)
+    return output
+
+
+def engine_checkpoints() -> list[Path]:
+    """``.pt`` checkpoints under the feedforward cache (quantized-weight caches excluded)."""
+    from .common import feedforward_cache_root
+
+    return sorted(
+        path
+        for path in feedforward_cache_root().rglob("*.pt")
+        if _SKIP_CONVERT_MARKER not in path.name and path.is_file()
+    )
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert feedforward .pt checkpoints to .safetensors.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    convert = sub.add_parser("convert", help="Write a .safetensors copy next to each .pt checkpoint.")
+    convert.add_argument("paths", nargs="*", type=Path, help="Checkpoints (default: every .pt in the cache).")
+    convert.add_argument("--overwrite", action="store_true", help="Rewrite existing .safetensors copies.")
+    args = parser.parse_args()
+
+    paths = args.paths or engine_checkpoints()
+    if not paths:
+        print("--- [vibephysics] No .pt checkpoints found ---")
+        sys.exit(0)
+    try:
+        for path in paths:
+            if not path.is_file():
+                raise ValueError(f"Checkpoint not found: {path}")
+            convert_checkpoint_to_safetensors(path, overwrite=args.overwrite)
+    except (ValueError, ImportError) as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(1)
+    except Exception as exc:
+        print(f"[ERROR] Conversion failed: {exc}")
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Overlapping-window inference helpers: window planning and Sim(3) stitching.
+
+Engines that would otherwise run one forward pass over every frame (memory grows with
+the frame count) can run overlapping windows instead: contiguous windows
+(:func:`plan_frame_windows`, vggt_omega) or anchor windows that re-run a few views
+of the previous window ahead of the new frames (:func:`plan_anchor_windows`,
+map_anything). Each window predicts in its own gauge (first camera = world, arbitrary
+scale); :func:`overlap_sim3` fits the Sim(3) that maps it onto the frames already
+stitched, from the shared frames' camera centres and confident point-map samples, and
+:func:`apply_sim3` moves the window's cameras, depth and points into the global frame.
+
+Per-window wall time / peak RSS go into ``metadata["inference_windows"]``; ``reconstruct``
+turns them into ``inference[i/n]`` profiler rows.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+
+# Point-map samples per overlap fit; a few thousand pin down 7 DOF comfortably.
+MAX_ALIGN_POINTS = 20000
+
+
+def plan_frame_windows(num_frames: int, window_size: int | None, overlap: int) -> list[tuple[int, int]]:
+    """``[(start, stop), ...]`` covering ``num_frames``; consecutive windows share ``overlap`` frames."""
+    if not window_size or window_size <= 0 or num_frames <= window_size:
+        return [(0, num_frames)]
+    if not 1 <= overlap < window_size:
+        raise ValueError(f"window overlap must be in [1, {window_size - 1}] (got {overlap})")
+    windows = []
+    start = 0
+    while True:
+        stop = min(start + window_size, num_frames)
+        windows.append((start, stop))
+        if stop == num_frames:
+            return windows
+        start = stop - overlap
+
+
+def plan_anchor_windows(
+    num_frames: int,
+    window_size: int | None,
+    anchor_frames: int,
+    stride: int | None = None,
+) -> list[tuple[list[int], int]]:
+    """
+    ``[(frame_indices, num_anchors), ...]``: each window after the first re-runs
+    ``anchor_frames`` of the previous window's new frames (spread over them, last one
+    included; the latest frames of the whole previous window when it has fewer new
+    frames than that), followed by the next ``stride`` new frames (default: fill the window).
+    """
+    if not window_size or window_size <= 0 or num_frames <= window_size:
+        return [(list(range(num_frames)), 0)]
+    if not 1 <= anchor_frames < window_size:
+        raise ValueError(f"anchor_frames must be in [1, {window_size - 1}] (got {anchor_frames})")
+    max_stride = window_size - anchor_frames
+    stride = max_stride if not stride else int(stride)
+    if not 1 <= stride <= max_stride:
+        raise ValueError(
+            f"window stride must be in [1, {max_stride}] for window_size={window_size}, "
+            f"anchor_frames={anchor_frames} (got {stride})"
+        )
+    windows = [(list(range(window_size)), 0)]
+    next_frame = window_size
+    while next_frame < num_frames:
+        frames, num_anchors = windows[-1]
+        previous = frames[num_anchors:]  # its new frames, so anchors stay near the frames they join
+        if len(previous) >= anchor_frames:
+            # Spread from the last new frame back, so a single anchor is the latest frame.
+            picks = np.unique(np.linspace(len(previous) - 1, 0, anchor_frames).round().astype(np.int64))
+            anchors = [previous[pick] for pick in picks]
+        else:
+            # stride < anchor_frames: top up with the previous window's own anchors
+            # (already stitched), keeping the configured anchor count.
+            anchors = sorted(frames)[-anchor_frames:]
+        new = list(range(next_frame, min(next_frame + stride, num_frames)))
+        windows.append((anchors + new, len(anchors)))
+        next_frame = new[-1] + 1
+    return windows
+
+
+def camera_centers(extrinsic_w2c: np.ndarray) -> np.ndarray:
+    """(S, 3) world-space camera centres of (S, 3, 4) w2c extrinsics."""
+    rotation = extrinsic_w2c[:, :3, :3]
+    translation = extrinsic_w2c[:, :3, 3]
+    return -np.einsum("sji,sj->si", rotation, translation)
+
+
+def _confident_points(points: np.ndarray, conf: np.ndarray) -> np.ndarray:
+    finite = np.isfinite(points).all(axis=-1) & np.isfinite(conf)
+    if not finite.any():
+        return finite
+    return finite & (conf >= np.median(conf[finite]))
+
+
+def overlap_sim3(
+    reference_points: np.ndarray,
+    reference_conf: np.ndarray,
+    reference_extrinsic: np.ndarray,
+    points: np.ndarray,
+    conf: np.ndarray,
+    extrinsic: np.ndarray,
+    *,
+    max_points: int = MAX_ALIGN_POINTS,
+) -> tuple[float, np.ndarray, np.ndarray, float]:
+    """
+    Sim(3) ``(s, R, t)`` with ``reference ≈ s * R @ window + t`` on the shared frames,
+    plus the RMS residual of the fit (reference units).
+
+    Inputs are the overlap frames only: (K, H, W, 3) points, (K, H, W) conf and
+    (K, 3, 4) w2c extrinsics, reference (already stitched) first.
+    """
+    from .common import umeyama_alignment
+
+    mask = _confident_points(reference_points, reference_conf) & _confident_points(points, conf)
+    src = points[mask]
+    dst = reference_points[mask]
+    if len(src) > max_points:
+        # Deterministic stride keeps reruns (and the inference cache) reproducible.
+        keep = np.linspace(0, len(src) - 1, max_points).astype(np.int64)
+        src, dst = src[keep], dst[keep]
+    # Camera centres anchor the trajectory even where the overlap sees little structure;
+    # repeat them so a handful of cameras is not swamped by thousands of points.
+    weight = max(1, len(src) // (10 * len(extrinsic)))
+    src = np.concatenate([src, np.repeat(camera_centers(extrinsic), weight, axis=0)])
+    dst = np.concatenate([dst, np.repeat(camera_centers(reference_extrinsic), weight, axis=0)])
+    scale, rotation, translation = umeyama_alignment(src, dst, with_scale=True)
+    residual = dst - (scale * src @ rotation.T + translation)
+    rmse = float(np.sqrt((residual**2).sum(axis=1).mean()))
+    return scale, rotation, translation, rmse
+
+
+def apply_sim3(
+    scale: float,
+    rotation: np.ndarray,
+    translation: np.ndarray,
+    *,
+    extrinsic: np.ndarray,
+    depth: np.ndarray,
+    world_points: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Move one window into the global frame: ``p' = s R p + t``.
+
+    Cameras keep their intrinsics, so depth scales by ``s`` and the w2c extrinsic
+    becomes ``[R_wc R^T | s T_wc - R_wc R^T t]``.
+    """
+    rotation = np.asarray(rotation, dtype=np.float64)
+    translation = np.asarray(translation, dtype=np.float64)
+    new_rotation = extrinsic[:, :3, :3].astype(np.float64) @ rotation.T
+    new_translation = scale * extrinsic[:, :3, 3].astype(np.float64) - new_rotation @ translation
+    new_extrinsic = np.concatenate([new_rotation, new_translation[..., None]], axis=-1)
+    new_points = (scale * world_points.astype(np.float64)) @ rotation.T + translation
+    return (
+        new_extrinsic.astype(extrinsic.dtype),
+        (depth * scale).astype(depth.dtype),
+        new_points.astype(world_points.dtype),
+    )
+
+
+@contextmanager
+def measure_window(stats: list[dict[str, Any]], start: int, stop: int) -> Iterator[dict[str, Any]]:
+    """Time one window and sample its peak process RSS; appends a record to ``stats``."""
+    from .reconstruct import _MemorySampler
+
+    record: dict[str, Any] = {"start": int(start), "stop": int(stop)}
+    sampler = _MemorySampler()
+    sampler.start()
+    started_at = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["elapsed_s"] = time.perf_counter() - started_at
+        record["peak_rss_bytes"] = sampler.stop()
+        stats.append(record)
@@ -1,10 +1,19 @@
-from .colmap import colmap_pipeline, glomap_pipeline, sfm_pipeline
-from .map_visual import load_colmap_reconstruction, save_reconstruction_blend
-
-__all__ = [
-    "colmap_pipeline",
-    "glomap_pipeline",
-    "sfm_pipeline",
-    "load_colmap_reconstruction",
-    "save_reconstruction_blend",
-]
+_LAZY_EXPORTS = {
+    "colmap_pipeline": ".colmap",
+    "glomap_pipeline": ".colmap",
+    "sfm_pipeline": ".colmap",
+    "load_colmap_reconstruction": ".map_visual",
+    "save_reconstruction_blend": ".map_visual",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    # map_visual needs bpy; resolve exports on first use so SfM CLIs stay light.
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name, __name__), name)